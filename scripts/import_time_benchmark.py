@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Import-time benchmark for `import flock`.
+
+Runs `python -X importtime` in fresh interpreters, reports the median
+cumulative import time and the heaviest imports, and fails if the time
+exceeds the budget or if a dependency that should load lazily (on first
+use) is imported at startup.
+
+Usage:
+    python scripts/import_time_benchmark.py
+    python scripts/import_time_benchmark.py --budget-ms 1500 --runs 7
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+DEFAULT_STATEMENT = "from flock.core import Flock"
+
+# Heavy dependencies that must only be imported on first use
+LAZY_MODULES = [
+    "datasets",
+    "dspy",
+    "litellm",
+    "mcp",
+    "numpy",
+    "opentelemetry.sdk.metrics",
+    "pandas",
+    "pyarrow",
+    "questionary",
+    "rich",
+]
+
+
+def parse_importtime(stderr: str) -> dict[str, tuple[int, int]]:
+    """Parses `-X importtime` output into {module: (self_us, cumulative_us)}."""
+    timings: dict[str, tuple[int, int]] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():
+            continue  # Header line
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def measure(statement: str) -> tuple[float, dict[str, tuple[int, int]]]:
+    """Imports in a fresh interpreter; returns (wall_ms, timings)."""
+    timed = (
+        "import time; _start = time.perf_counter()\n"
+        f"{statement}\n"
+        "print((time.perf_counter() - _start) * 1000)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", timed],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Logging may write to stdout during import; the timing is the last line
+    wall_ms = float(result.stdout.strip().splitlines()[-1])
+    return wall_ms, parse_importtime(result.stderr)
+
+
+def main() -> int:
+    """Runs the benchmark and returns the process exit code."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--statement", default=DEFAULT_STATEMENT)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=3000.0,
+        help="Fail if the median import time exceeds this (default: 3000).",
+    )
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    # Warm-up run so the bytecode cache does not skew the first sample
+    measure(args.statement)
+    samples = []
+    timings: dict[str, tuple[int, int]] = {}
+    for _ in range(args.runs):
+        total_ms, timings = measure(args.statement)
+        samples.append(total_ms)
+    median_ms = statistics.median(samples)
+
+    print(
+        f"`{args.statement}`: median {median_ms:.0f} ms over {args.runs} runs"
+    )
+    print("Heaviest imports (self time, last run):")
+    heaviest = sorted(
+        timings.items(), key=lambda item: item[1][0], reverse=True
+    )
+    for name, (self_us, cumulative_us) in heaviest[: args.top]:
+        print(
+            f"  {self_us / 1000:8.1f} ms self {cumulative_us / 1000:8.1f} ms cumulative  {name}"
+        )
+
+    failed = False
+    eager = [module for module in LAZY_MODULES if module in timings]
+    if eager:
+        print(
+            f"FAIL: imported at startup, should load lazily: {', '.join(eager)}"
+        )
+        failed = True
+    if median_ms > args.budget_ms:
+        print(
+            f"FAIL: {median_ms:.0f} ms exceeds budget of {args.budget_ms:.0f} ms"
+        )
+        failed = True
+    if not failed:
+        print(f"OK: within budget of {args.budget_ms:.0f} ms")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
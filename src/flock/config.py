@@ -3,6 +3,8 @@ import os
 
 from decouple import config
 
+from flock.core.logging.logging import configure_logging
+from flock.core.logging.span_attributes import configure_span_attributes
 from flock.core.logging.telemetry import TelemetryConfig
 
 cfg_file = os.path.expanduser(f"~/.flock/flock.cfg")
@@ -19,9 +21,21 @@ GITHUB_PAT = config("GITHUB_PAT", "")
 GITHUB_REPO = config("GITHUB_REPO", "")
 GITHUB_USERNAME = config("GITHUB_USERNAME", "")
 
+# -- Rate Limiting (default per-model limits, 0 = unlimited) --
+RATE_LIMIT_RPM = config("FLOCK_RATE_LIMIT_RPM", 0, cast=float)
+RATE_LIMIT_TPM = config("FLOCK_RATE_LIMIT_TPM", 0, cast=float)
+# Entries kept in DSPy's process-wide LM history (0 = none)
+LM_HISTORY_SIZE = config("FLOCK_LM_HISTORY_SIZE", 100, cast=int)
+
 # -- Debugging and Logging Configurations --
 LOCAL_DEBUG = config("LOCAL_DEBUG", True)
 LOG_LEVEL = config("LOG_LEVEL", "DEBUG")
+# Write log lines from a background thread so logging never blocks
+LOG_ASYNC: bool = config("FLOCK_LOG_ASYNC", False, cast=bool)
+# Record per-phase agent latency histograms in memory
+PROFILING_ENABLED: bool = config("FLOCK_PROFILE", True, cast=bool)
+# Record agent, run and batch metrics for the API's /metrics endpoint
+PROMETHEUS_ENABLED: bool = config("FLOCK_PROMETHEUS", True, cast=bool)
 LOGGING_DIR = config("LOGGING_DIR", "logs")
 
 OTEL_SERVICE_NAME = config("OTL_SERVICE_NAME", "otel-flock")
@@ -36,6 +50,55 @@ OTEL_FILE_NAME = config("OTEL_FILE_NAME", "flock_events.jsonl")
 OTEL_ENABLE_SQL: bool = config("OTEL_ENABLE_SQL", True) == "True"
 OTEL_ENABLE_FILE: bool = config("OTEL_ENABLE_FILE", True) == "True"
 OTEL_ENABLE_JAEGER: bool = config("OTEL_ENABLE_JAEGER", False) == "True"
+# Aggregated OTel metrics, exported to the SQLite DB and this file
+OTEL_ENABLE_METRICS: bool = config("FLOCK_ENABLE_METRICS", True, cast=bool)
+OTEL_METRICS_FILE_NAME = config("OTEL_METRICS_FILE_NAME", "flock_metrics.jsonl")
+OTEL_METRIC_EXPORT_INTERVAL = config(
+    "OTEL_METRIC_EXPORT_INTERVAL", 60000, cast=float
+)
+# Span file rotation: size in MB and/or age in hours (0 = no limit)
+OTEL_FILE_MAX_MB = config("OTEL_FILE_MAX_MB", 50, cast=float)
+OTEL_FILE_ROTATE_HOURS = config("OTEL_FILE_ROTATE_HOURS", 0, cast=float)
+# "gzip", "zstd" (requires zstandard) or "none" for rotated segments
+OTEL_FILE_COMPRESSION = config("OTEL_FILE_COMPRESSION", "gzip").lower()
+OTEL_FILE_MAX_SEGMENTS = config("OTEL_FILE_MAX_SEGMENTS", 0, cast=int)
+# Days of spans kept in the SQLite store (0 = keep forever)
+OTEL_SQL_RETENTION_DAYS = config("OTEL_SQL_RETENTION_DAYS", 0, cast=float)
+# Background span export (standard OTEL_BSP_* names)
+OTEL_BSP_MAX_QUEUE_SIZE = config("OTEL_BSP_MAX_QUEUE_SIZE", 2048, cast=int)
+OTEL_BSP_SCHEDULE_DELAY = config("OTEL_BSP_SCHEDULE_DELAY", 5000, cast=float)
+OTEL_BSP_MAX_EXPORT_BATCH_SIZE = config(
+    "OTEL_BSP_MAX_EXPORT_BATCH_SIZE", 512, cast=int
+)
+# "drop_newest" or "drop_oldest" when the export queue is full
+OTEL_BSP_DROP_POLICY = config("FLOCK_OTEL_DROP_POLICY", "drop_newest")
+# Set to False to disable tracing for the whole process
+OTEL_ENABLED: bool = config("FLOCK_ENABLE_TELEMETRY", True, cast=bool)
+# Span payloads (inputs/results) are fingerprinted unless capture is enabled
+OTEL_CAPTURE_PAYLOADS: bool = config("FLOCK_TRACE_PAYLOADS", False, cast=bool)
+OTEL_MAX_ATTRIBUTE_BYTES = config(
+    "FLOCK_TRACE_MAX_ATTRIBUTE_BYTES", 1024, cast=int
+)
+OTEL_PAYLOAD_SAMPLE_RATE = config(
+    "FLOCK_TRACE_PAYLOAD_SAMPLE_RATE", 1.0, cast=float
+)
+# Head sampling: fraction of traces recorded, optionally per agent
+# (e.g. FLOCK_TRACE_AGENT_SAMPLE_RATIOS="chatty_agent=0.05,critic=1.0")
+OTEL_SAMPLE_RATIO = config("FLOCK_TRACE_SAMPLE_RATIO", 1.0, cast=float)
+OTEL_AGENT_SAMPLE_RATIOS = {
+    name.strip(): float(ratio)
+    for name, _, ratio in (
+        item.partition("=")
+        for item in config("FLOCK_TRACE_AGENT_SAMPLE_RATIOS", "").split(",")
+        if item.strip()
+    )
+}
+# Tail sampling: keep errors and slow traces, drop most healthy ones
+OTEL_TAIL_SAMPLING: bool = config("FLOCK_TAIL_SAMPLING", False, cast=bool)
+OTEL_TAIL_KEEP_RATIO = config("FLOCK_TAIL_KEEP_RATIO", 0.1, cast=float)
+OTEL_TAIL_LATENCY_THRESHOLD_MS = config(
+    "FLOCK_TAIL_LATENCY_THRESHOLD_MS", 10_000, cast=float
+)
 
 
 TELEMETRY = TelemetryConfig(
@@ -48,4 +111,39 @@ TELEMETRY = TelemetryConfig(
     OTEL_ENABLE_JAEGER,
     OTEL_ENABLE_FILE,
     OTEL_ENABLE_SQL,
+    batch_processor_options={
+        "max_queue_size": OTEL_BSP_MAX_QUEUE_SIZE,
+        "schedule_delay_millis": OTEL_BSP_SCHEDULE_DELAY,
+        "max_export_batch_size": OTEL_BSP_MAX_EXPORT_BATCH_SIZE,
+        "drop_policy": OTEL_BSP_DROP_POLICY,
+    },
+    enabled=OTEL_ENABLED,
+    sqlite_retention_days=OTEL_SQL_RETENTION_DAYS or None,
+    sample_ratio=OTEL_SAMPLE_RATIO,
+    agent_sample_ratios=OTEL_AGENT_SAMPLE_RATIOS,
+    file_exporter_options={
+        "max_bytes": int(OTEL_FILE_MAX_MB * 1024 * 1024) or None,
+        "rotate_interval_seconds": OTEL_FILE_ROTATE_HOURS * 3600 or None,
+        "compression": None
+        if OTEL_FILE_COMPRESSION == "none"
+        else OTEL_FILE_COMPRESSION,
+        "max_segments": OTEL_FILE_MAX_SEGMENTS or None,
+    },
+    tail_sampling_options={
+        "keep_ratio": OTEL_TAIL_KEEP_RATIO,
+        "latency_threshold_ms": OTEL_TAIL_LATENCY_THRESHOLD_MS,
+    }
+    if OTEL_TAIL_SAMPLING
+    else None,
+    enable_metrics=OTEL_ENABLE_METRICS,
+    metrics_file_name=OTEL_METRICS_FILE_NAME,
+    metric_export_interval_millis=OTEL_METRIC_EXPORT_INTERVAL,
+)
+configure_logging(LOG_LEVEL, async_sink=LOG_ASYNC)
+# Exporters are set up lazily on the first span
+TELEMETRY.install()
+configure_span_attributes(
+    capture_payloads=OTEL_CAPTURE_PAYLOADS,
+    max_bytes=OTEL_MAX_ATTRIBUTE_BYTES,
+    sample_rate=OTEL_PAYLOAD_SAMPLE_RATE,
 )
@@ -13,9 +13,10 @@ from fastapi import (
 )
 
 # Import HTMLResponse for the UI form endpoint
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, PlainTextResponse, Response
 
 from flock.core.logging.logging import get_logger
+from flock.core.util.prometheus_metrics import render_metrics
 
 # Import models and UI utils
 from .models import (
@@ -219,6 +220,32 @@ def create_api_router(flock_api: "FlockAPI") -> APIRouter:
         ]
         return {"agents": agents_list}
 
+    @router.get("/profile/latency", tags=["API"])
+    async def get_latency_report(format: str = "json"):
+        """Per-agent, per-phase latency histograms (format: json or text)."""
+        if format == "text":
+            return PlainTextResponse(
+                flock_instance.get_latency_report(as_text=True)
+            )
+        if format != "json":
+            raise HTTPException(
+                status_code=400, detail="format must be 'json' or 'text'"
+            )
+        return {"agents": flock_instance.get_latency_report()}
+
+    @router.get("/metrics", tags=["API"])
+    async def get_prometheus_metrics():
+        """Agent, run and batch metrics in the Prometheus text format."""
+        try:
+            content, content_type = render_metrics()
+        except ImportError as e:
+            raise HTTPException(
+                status_code=501,
+                detail="/metrics requires 'prometheus-client': "
+                "pip install prometheus-client",
+            ) from e
+        return Response(content=content, media_type=content_type)
+
     # --- UI Form Endpoint ---
     @router.post("/ui/run-agent-form", response_class=HTMLResponse, tags=["UI"])
     async def run_flock_form(fastapi_req: FastAPIRequest):
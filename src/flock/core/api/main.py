@@ -274,6 +274,7 @@ class FlockAPI:
                                 return_errors=request.return_errors,
                                 silent_mode=request.silent_mode,
                                 write_to_csv=request.write_to_csv,
+                                write_to_parquet=request.write_to_parquet,
                             )
                         )
 
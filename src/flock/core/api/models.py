@@ -39,7 +39,8 @@ class FlockBatchRequest(BaseModel):
 
     agent_name: str = Field(..., description="Name of the agent to run")
     batch_inputs: list[dict[str, Any]] | str = Field(
-        ..., description="List of input dictionaries or path to CSV file"
+        ...,
+        description="List of input dictionaries or path to a CSV/Parquet/Arrow file",
     )
     input_mapping: dict[str, str] | None = Field(
         None, description="Maps DataFrame/CSV column names to agent input keys"
@@ -68,6 +69,9 @@ class FlockBatchRequest(BaseModel):
     write_to_csv: str | None = Field(
         None, description="Path to save results as CSV file"
     )
+    write_to_parquet: str | None = Field(
+        None, description="Path to save results as Parquet file"
+    )
 
 
 class FlockBatchResponse(BaseModel):
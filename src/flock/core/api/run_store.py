@@ -6,6 +6,7 @@ from datetime import datetime
 from typing import Any
 
 from flock.core.logging.logging import get_logger
+from flock.core.util.prometheus_metrics import get_prometheus_metrics
 
 from .models import (  # Import from the models file
     FlockAPIResponse,
@@ -14,6 +15,35 @@ from .models import (  # Import from the models file
 
 logger = get_logger("api.run_store")
 
+# Runs and batches in these states count as in flight on /metrics
+IN_FLIGHT_STATUSES = ("starting", "running")
+FINISHED_STATUSES = ("completed", "failed")
+
+
+def _record_transition(kind: str, old: str | None, new: str) -> None:
+    """Updates the in-flight gauge and finished counter for a status change."""
+    metrics = get_prometheus_metrics()
+    if metrics is None or old == new:
+        return
+    was_in_flight = old in IN_FLIGHT_STATUSES
+    if was_in_flight != (new in IN_FLIGHT_STATUSES):
+        metrics.runs_in_flight.labels(kind=kind).inc(-1 if was_in_flight else 1)
+    if new in FINISHED_STATUSES:
+        metrics.runs_finished.labels(kind=kind, status=new).inc()
+
+
+def _record_batch_items(
+    old_completed: int, new_completed: int, new_total: int = 0
+) -> None:
+    """Counts newly completed (and, with new_total, submitted) items."""
+    metrics = get_prometheus_metrics()
+    if metrics is None:
+        return
+    if new_completed > old_completed:
+        metrics.batch_items_completed.inc(new_completed - old_completed)
+    if new_total > 0:
+        metrics.batch_items_total.inc(new_total)
+
 
 class RunStore:
     """Stores and manages the state of Flock runs."""
@@ -26,12 +56,16 @@ class RunStore:
     def create_run(self, run_id: str) -> FlockAPIResponse:
         """Creates a new run record with 'starting' status."""
         with self._lock:
-            if run_id in self._runs:
+            previous = self._runs.get(run_id)
+            if previous is not None:
                 logger.warning(f"Run ID {run_id} already exists. Overwriting.")
             response = FlockAPIResponse(
                 run_id=run_id, status="starting", started_at=datetime.now()
             )
             self._runs[run_id] = response
+            _record_transition(
+                "run", previous.status if previous else None, "starting"
+            )
             logger.debug(f"Created run record for run_id: {run_id}")
             return response
 
@@ -46,6 +80,7 @@ class RunStore:
         """Updates the status and potentially error of a run."""
         with self._lock:
             if run_id in self._runs:
+                _record_transition("run", self._runs[run_id].status, status)
                 self._runs[run_id].status = status
                 if error:
                     self._runs[run_id].error = error
@@ -66,6 +101,9 @@ class RunStore:
                     dict(result) if hasattr(result, "to_dict") else result
                 )
                 self._runs[run_id].result = final_result
+                _record_transition(
+                    "run", self._runs[run_id].status, "completed"
+                )
                 self._runs[run_id].status = "completed"
                 self._runs[run_id].completed_at = datetime.now()
                 logger.debug(f"Updated result for completed run_id: {run_id}")
@@ -77,7 +115,8 @@ class RunStore:
     def create_batch(self, batch_id: str) -> FlockBatchResponse:
         """Creates a new batch record with 'starting' status."""
         with self._lock:
-            if batch_id in self._batches:
+            previous = self._batches.get(batch_id)
+            if previous is not None:
                 logger.warning(
                     f"Batch ID {batch_id} already exists. Overwriting."
                 )
@@ -91,6 +130,9 @@ class RunStore:
                 progress_percentage=0.0,
             )
             self._batches[batch_id] = response
+            _record_transition(
+                "batch", previous.status if previous else None, "starting"
+            )
             logger.debug(f"Created batch record for batch_id: {batch_id}")
             return response
 
@@ -105,6 +147,9 @@ class RunStore:
         """Updates the status and potentially error of a batch run."""
         with self._lock:
             if batch_id in self._batches:
+                _record_transition(
+                    "batch", self._batches[batch_id].status, status
+                )
                 self._batches[batch_id].status = status
                 if error:
                     self._batches[batch_id].error = error
@@ -115,6 +160,10 @@ class RunStore:
                         status == "completed"
                         and self._batches[batch_id].total_items > 0
                     ):
+                        _record_batch_items(
+                            self._batches[batch_id].completed_items,
+                            self._batches[batch_id].total_items,
+                        )
                         self._batches[batch_id].completed_items = self._batches[
                             batch_id
                         ].total_items
@@ -136,6 +185,12 @@ class RunStore:
                     dict(r) if hasattr(r, "to_dict") else r for r in results
                 ]
                 self._batches[batch_id].results = final_results
+                _record_transition(
+                    "batch", self._batches[batch_id].status, "completed"
+                )
+                _record_batch_items(
+                    self._batches[batch_id].completed_items, len(final_results)
+                )
                 self._batches[batch_id].status = "completed"
                 self._batches[batch_id].completed_at = datetime.now()
 
@@ -157,6 +212,7 @@ class RunStore:
         try:
             with self._lock:
                 if batch_id in self._batches:
+                    _record_batch_items(0, 0, total_items)
                     self._batches[batch_id].total_items = total_items
                     # Recalculate percentage
                     if total_items > 0:
@@ -191,6 +247,9 @@ class RunStore:
         try:
             with self._lock:
                 if batch_id in self._batches:
+                    _record_batch_items(
+                        self._batches[batch_id].completed_items, completed_items
+                    )
                     self._batches[batch_id].completed_items = completed_items
 
                     # Calculate percentage if we have a total
@@ -81,16 +81,18 @@ class FlockContext(Serializable, BaseModel):
         old_value = self.state.get(key)
         self.state[key] = value
         if old_value != value:
-            escaped_value = str(value).replace("{", "{{").replace("}", "}}")
-
-            logger.info(
-                "Context variable updated - {} -> {}",
-                key,
-                escaped_value,  # Arguments in order
-            )
+            if logger.is_enabled_for("info"):
+                escaped_value = (
+                    str(value).replace("{", "{{").replace("}", "}}")
+                )
+                logger.info(
+                    "Context variable updated - {} -> {}",
+                    key,
+                    escaped_value,  # Arguments in order
+                )
 
             current_span = trace.get_current_span()
-            if current_span.get_span_context().is_valid:
+            if current_span.is_recording():
                 current_span.add_event(
                     "set_variable",
                     attributes={
@@ -8,3 +8,4 @@ FLOCK_LAST_AGENT = "flock.last_agent"
 FLOCK_LAST_RESULT = "flock.last_result"
 FLOCK_MODEL = "flock.model"
 FLOCK_BATCH_SILENT_MODE = "flock.batch_silent"
+FLOCK_TOKEN_USAGE = "flock.token_usage"
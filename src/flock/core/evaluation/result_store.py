@@ -0,0 +1,188 @@
+"""Persistent store of agent outputs for incremental re-evaluation."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from flock.core.logging.logging import get_logger
+
+if TYPE_CHECKING:
+    from flock.core.flock import Flock
+    from flock.core.flock_agent import FlockAgent
+
+logger = get_logger("evaluation.result_store")
+
+
+def _hash_json(value: Any) -> str:
+    payload = json.dumps(value, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _callable_path(value: Any) -> Any:
+    if callable(value):
+        return f"{value.__module__}.{getattr(value, '__qualname__', value)}"
+    return value
+
+
+def _component_definition(component: Any) -> dict[str, Any] | None:
+    """Type, name and config of an evaluator, router or module."""
+    if component is None:
+        return None
+    config = getattr(component, "config", None)
+    return {
+        "type": type(component).__name__,
+        "name": getattr(component, "name", None),
+        "config": config.model_dump(mode="json")
+        if hasattr(config, "model_dump")
+        else None,
+    }
+
+
+def _agent_definition(agent: "FlockAgent") -> dict[str, Any]:
+    """The fields that define an agent, without runtime state.
+
+    Evaluators keep per-run state such as cost, LM history and token usage,
+    which must not change the fingerprint.
+    """
+    return {
+        "name": agent.name,
+        "model": agent.model,
+        "description": _callable_path(agent.description),
+        "input": _callable_path(agent.input),
+        "output": _callable_path(agent.output),
+        "evaluator": _component_definition(agent.evaluator),
+        "handoff_router": _component_definition(agent.handoff_router),
+        "modules": {
+            name: _component_definition(module)
+            for name, module in sorted(agent.modules.items())
+        },
+        "tools": [_callable_path(tool) for tool in agent.tools or []],
+    }
+
+
+def agent_fingerprint(flock: "Flock", start_agent: "FlockAgent | str") -> str:
+    """Hashes every agent definition that can influence a run's output.
+
+    Covers the start agent and, if it can hand off to other agents, all
+    agents in the flock (routers may pick any of them). The flock's default
+    model is included because agents without a model fall back to it.
+    """
+    name = getattr(start_agent, "name", start_agent)
+    agent = flock.agents.get(name, start_agent)
+    if isinstance(agent, str):
+        raise ValueError(f"Start agent '{name}' not found in flock.")
+
+    agents = [agent]
+    if agent.handoff_router is not None:
+        agents = [flock.agents[n] for n in sorted(flock.agents)]
+    return _hash_json(
+        {
+            "flock_model": flock.model,
+            "start_agent": name,
+            "agents": [_agent_definition(a) for a in agents],
+        }
+    )
+
+
+def input_hash(inputs: dict[str, Any]) -> str:
+    """Hashes a single item's agent inputs (including static inputs)."""
+    return _hash_json(inputs)
+
+
+class EvaluationResultStore:
+    """SQLite store of agent outputs keyed by (agent fingerprint, input hash).
+
+    Only successful agent outputs are stored; metrics are always recomputed
+    so changed answer mappings or metrics take effect without re-running.
+    """
+
+    def __init__(self, db_path: str | Path):
+        """Open (or create) the store.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS evaluation_results (
+                agent_fingerprint TEXT NOT NULL,
+                input_hash TEXT NOT NULL,
+                agent_output TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                PRIMARY KEY (agent_fingerprint, input_hash)
+            )
+            """
+        )
+        self.conn.commit()
+
+    def get_many(
+        self, fingerprint: str, input_hashes: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """Returns stored outputs for the given input hashes."""
+        found: dict[str, dict[str, Any]] = {}
+        unique_hashes = list(dict.fromkeys(input_hashes))
+        # Stay below SQLite's host parameter limit
+        chunk_size = 500
+        with self._lock:
+            for i in range(0, len(unique_hashes), chunk_size):
+                chunk = unique_hashes[i : i + chunk_size]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self.conn.execute(
+                    f"""
+                    SELECT input_hash, agent_output FROM evaluation_results
+                    WHERE agent_fingerprint = ? AND input_hash IN ({placeholders})
+                    """,
+                    [fingerprint, *chunk],
+                ).fetchall()
+                for row_hash, output in rows:
+                    found[row_hash] = json.loads(output)
+        return found
+
+    def put(
+        self, fingerprint: str, item_hash: str, agent_output: dict[str, Any]
+    ) -> None:
+        """Stores (or replaces) the output for one item."""
+        with self._lock:
+            self.conn.execute(
+                """
+                INSERT OR REPLACE INTO evaluation_results
+                (agent_fingerprint, input_hash, agent_output, created_at)
+                VALUES (?, ?, ?, ?)
+                """,
+                (
+                    fingerprint,
+                    item_hash,
+                    json.dumps(agent_output, default=str),
+                    datetime.now().isoformat(),
+                ),
+            )
+            self.conn.commit()
+
+    def prune(self, keep_fingerprint: str | None = None) -> int:
+        """Deletes outputs of other agent definitions (all if None).
+
+        Returns:
+            The number of rows removed.
+        """
+        with self._lock:
+            cursor = self.conn.execute(
+                "DELETE FROM evaluation_results WHERE agent_fingerprint != ?",
+                (keep_fingerprint or "",),
+            )
+            self.conn.commit()
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        with self._lock:
+            self.conn.close()
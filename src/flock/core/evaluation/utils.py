@@ -1,10 +1,16 @@
 # src/flock/core/util/evaluation_helpers.py
+import asyncio
+import hashlib
 import inspect
+import json
 import sys
-from collections.abc import Callable
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable, Iterator
 from pathlib import Path
+from statistics import NormalDist
 from typing import Any, Union
 
+import numpy as np
 import pandas as pd
 from box import Box
 from datasets import get_dataset_config_names, load_dataset
@@ -12,6 +18,11 @@ from datasets import get_dataset_config_names, load_dataset
 from flock.core.flock_agent import FlockAgent
 from flock.core.flock_evaluator import FlockEvaluator
 from flock.core.logging.logging import get_logger
+from flock.core.util.columnar import (
+    PARQUET_SUFFIXES,
+    is_columnar_source,
+    read_columnar_table,
+)
 
 # Potentially import metrics libraries like rouge_score, nltk, sentence_transformers
 
@@ -67,6 +78,176 @@ def normalize_dataset(dataset: Any) -> pd.DataFrame:
         raise TypeError(f"Unsupported dataset type: {type(dataset)}")
 
 
+def iter_dataset_batches(
+    dataset: Any,
+    columns: list[str] | None = None,
+    batch_size: int = 1000,
+    num_shards: int = 1,
+    shard_index: int = 0,
+) -> Iterator[list[tuple[int, dict[str, Any]]]]:
+    """Streams a dataset as batches of (row position, row) pairs.
+
+    Only the given columns are read where the source supports projection
+    (Parquet, Arrow, CSV, DataFrames and Hugging Face datasets). Hugging Face
+    hub IDs are loaded with streaming=True, config by config and split by
+    split. Nothing is materialized beyond one batch.
+
+    Args:
+        dataset: Any dataset accepted by normalize_dataset, a pyarrow Table,
+            a Parquet/Arrow file path, a Hugging Face IterableDataset or an
+            iterable of dicts.
+        columns: Columns to read. None reads all columns.
+        batch_size: Maximum number of rows per yielded batch.
+        num_shards: Number of shards the dataset is split into.
+        shard_index: Which shard to read (0-based). Parquet files are sharded
+            by row group, other sources by row position.
+
+    Yields:
+        Lists of (row position in the full dataset, row dict).
+    """
+    if not 0 <= shard_index < num_shards:
+        raise ValueError(
+            f"shard_index must be in [0, {num_shards}), got {shard_index}"
+        )
+
+    if (
+        isinstance(dataset, str | Path)
+        and Path(dataset).suffix.lower() in PARQUET_SUFFIXES
+    ):
+        yield from _iter_parquet_shard(
+            dataset, columns, batch_size, num_shards, shard_index
+        )
+        return
+
+    position = 0
+    for rows in _iter_record_batches(dataset, columns, batch_size):
+        batch = []
+        for row in rows:
+            if position % num_shards == shard_index:
+                batch.append((position, row))
+            position += 1
+        if batch:
+            yield batch
+
+
+def _iter_parquet_shard(
+    path: str | Path,
+    columns: list[str] | None,
+    batch_size: int,
+    num_shards: int,
+    shard_index: int,
+) -> Iterator[list[tuple[int, dict[str, Any]]]]:
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(path)
+    if columns is not None:
+        missing = set(columns) - set(parquet_file.schema_arrow.names)
+        if missing:
+            raise ValueError(
+                f"Dataset missing required columns: {', '.join(missing)}"
+            )
+    offset = 0
+    for group in range(parquet_file.num_row_groups):
+        group_rows = parquet_file.metadata.row_group(group).num_rows
+        if group % num_shards == shard_index:
+            position = offset
+            for record_batch in parquet_file.iter_batches(
+                batch_size=batch_size, row_groups=[group], columns=columns
+            ):
+                rows = record_batch.to_pylist()
+                yield list(enumerate(rows, start=position))
+                position += len(rows)
+        offset += group_rows
+
+
+def _iter_record_batches(
+    dataset: Any, columns: list[str] | None, batch_size: int
+) -> Iterator[list[dict[str, Any]]]:
+    """Yields lists of row dicts from any supported dataset source."""
+    if is_columnar_source(dataset):
+        table = read_columnar_table(dataset, columns=columns)
+        for record_batch in table.to_batches(max_chunksize=batch_size):
+            yield record_batch.to_pylist()
+    elif isinstance(dataset, pd.DataFrame):
+        frame = dataset[columns] if columns is not None else dataset
+        for start in range(0, len(frame), batch_size):
+            yield frame.iloc[start : start + batch_size].to_dict("records")
+    elif isinstance(dataset, str | Path):
+        yield from _iter_path_dataset(Path(dataset), columns, batch_size)
+    elif "datasets" in sys.modules and isinstance(
+        dataset, sys.modules["datasets"].Dataset
+    ):
+        if columns is not None:
+            dataset = dataset.select_columns(columns)
+        for batch in dataset.iter(batch_size=batch_size):
+            yield [dict(zip(batch, values)) for values in zip(*batch.values())]
+    else:
+        yield from _iter_row_dataset(dataset, columns, batch_size)
+
+
+def _iter_row_dataset(
+    dataset: Any, columns: list[str] | None, batch_size: int
+) -> Iterator[list[dict[str, Any]]]:
+    """Streams a Hugging Face IterableDataset or an iterable of dicts."""
+    if "datasets" in sys.modules and isinstance(
+        dataset, sys.modules["datasets"].IterableDataset
+    ):
+        if columns is not None:
+            dataset = dataset.select_columns(columns)
+    elif isinstance(dataset, dict) or not isinstance(dataset, Iterable):
+        raise TypeError(f"Unsupported dataset type: {type(dataset)}")
+    yield from _batched_rows(dataset, columns, batch_size)
+
+
+def _iter_path_dataset(
+    path: Path, columns: list[str] | None, batch_size: int
+) -> Iterator[list[dict[str, Any]]]:
+    """Streams a CSV file, or a hub dataset if no such file exists."""
+    if not path.exists():
+        yield from _iter_hub_dataset(str(path), columns, batch_size)
+    elif path.suffix.lower() == ".csv":
+        for chunk in pd.read_csv(path, usecols=columns, chunksize=batch_size):
+            yield chunk.to_dict("records")
+    else:
+        raise ValueError(f"Unsupported file type for dataset: {path.suffix}")
+
+
+def _iter_hub_dataset(
+    dataset_name: str, columns: list[str] | None, batch_size: int
+) -> Iterator[list[dict[str, Any]]]:
+    """Streams all configs and splits of a Hugging Face hub dataset."""
+    for config in get_dataset_config_names(dataset_name):
+        dataset_dict = load_dataset(dataset_name, config, streaming=True)
+        for split_name, split_dataset in dataset_dict.items():
+            rows = (
+                {**row, "config": config, "split": split_name}
+                for row in split_dataset
+            )
+            yield from _batched_rows(rows, columns, batch_size)
+
+
+def _batched_rows(
+    rows: Iterable[dict[str, Any]], columns: list[str] | None, batch_size: int
+) -> Iterator[list[dict[str, Any]]]:
+    batch = []
+    for row in rows:
+        if not isinstance(row, dict):
+            raise ValueError("Dataset rows must be dictionaries.")
+        if columns is not None:
+            missing = [c for c in columns if c not in row]
+            if missing:
+                raise ValueError(
+                    f"Dataset missing required columns: {', '.join(missing)}"
+                )
+            row = {c: row[c] for c in columns}
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
 def extract_value_by_dot_notation(data: dict | Box, key: str) -> Any:
     """Retrieves a value from a nested dictionary or Box object using dot notation."""
     if not key:
@@ -89,6 +270,46 @@ def extract_value_by_dot_notation(data: dict | Box, key: str) -> Any:
         return None
 
 
+class MetricRegistry:
+    """Caches metric functions and their heavy resources for one evaluation.
+
+    Models such as the SentenceTransformer or a RougeScorer are created once
+    and shared across all items instead of once per item.
+    """
+
+    def __init__(self):
+        """Creates an empty registry."""
+        self._functions: dict[str, Callable] = {}
+        self._resources: dict[str, Any] = {}
+
+    def get_resource(self, key: str, factory: Callable[[], Any]) -> Any:
+        """Returns the cached resource for key, creating it on first use."""
+        if key not in self._resources:
+            self._resources[key] = factory()
+        return self._resources[key]
+
+    def get_function(self, metric_name: str) -> Callable:
+        """Returns the (cached) per-item function for a built-in metric."""
+        if metric_name not in self._functions:
+            self._functions[metric_name] = _get_metric_function(
+                metric_name, self
+            )
+        return self._functions[metric_name]
+
+    def get_batch_function(self, metric_name: str) -> Callable:
+        """Returns a function computing a built-in metric over whole columns.
+
+        The function takes (predictions, references, **config) and returns
+        one result per item.
+        """
+        key = f"batch:{metric_name}"
+        if key not in self._functions:
+            self._functions[key] = _get_batch_metric_function(
+                metric_name, self
+            )
+        return self._functions[key]
+
+
 def calculate_evaluation_metrics(
     metrics: list[Union[str, Callable, "FlockAgent", "FlockEvaluator"]],
     metric_configs: dict[str, dict[str, Any]],
@@ -96,8 +317,13 @@ def calculate_evaluation_metrics(
     expected_answers: dict[str, Any],
     agent_inputs: dict[str, Any],  # For context
     agent_output: Any,  # For context
+    metric_registry: MetricRegistry | None = None,
 ) -> dict[str, Any]:
-    """Calculates all specified metrics for a single evaluation item."""
+    """Calculates all specified metrics for a single evaluation item.
+
+    Pass a shared metric_registry to reuse metric resources across items.
+    """
+    metric_registry = metric_registry or MetricRegistry()
     results = {}
     for metric in metrics:
         metric_name = ""
@@ -113,7 +339,7 @@ def calculate_evaluation_metrics(
                 ):
                     predicted = predicted_answers[metric_name]
                     expected = expected_answers[metric_name]
-                    metric_func = _get_metric_function(metric_name)
+                    metric_func = metric_registry.get_function(metric_name)
                     config = metric_configs.get(metric_name, {})
                     metric_result = metric_func(predicted, expected, **config)
                 else:
@@ -148,7 +374,7 @@ def calculate_evaluation_metrics(
                 # Requires running the judge agent - needs async context
                 # metric_result = asyncio.run(_run_judge_agent(metric, predicted_answers, expected_answers, config))
                 logger_helpers.warning(
-                    f"Agent-based metric '{metric_name}' execution not implemented in this sketch."
+                    f"Agent-based metric '{metric_name}' requires an async context; use calculate_judge_metrics."
                 )
                 metric_result = "[Agent Judge Not Implemented]"
 
@@ -160,7 +386,7 @@ def calculate_evaluation_metrics(
                 # Requires running the evaluator - needs async context
                 # metric_result = asyncio.run(_run_judge_evaluator(metric, predicted_answers, expected_answers, config))
                 logger_helpers.warning(
-                    f"Evaluator-based metric '{metric_name}' execution not implemented in this sketch."
+                    f"Evaluator-based metric '{metric_name}' requires an async context; use calculate_judge_metrics."
                 )
                 metric_result = "[Evaluator Judge Not Implemented]"
             # --- End Placeholder ---
@@ -187,8 +413,11 @@ def calculate_evaluation_metrics(
     return results
 
 
-def _get_metric_function(metric_name: str) -> Callable:
+def _get_metric_function(
+    metric_name: str, registry: MetricRegistry | None = None
+) -> Callable:
     """Maps metric names to their implementation functions."""
+    registry = registry or MetricRegistry()
     # Lazy load metric libraries
     if metric_name == "exact_match":
         return lambda pred, act, **kw: str(pred).strip() == str(act).strip()
@@ -211,17 +440,17 @@ def _get_metric_function(metric_name: str) -> Callable:
         try:
             from rouge_score import rouge_scorer
 
-            scorer = rouge_scorer.RougeScorer(
-                [metric_name.replace("_", "")], use_stemmer=True
+            rouge_type = metric_name.replace("_", "")
+            scorer = registry.get_resource(
+                f"rouge_scorer:{rouge_type}",
+                lambda: rouge_scorer.RougeScorer(
+                    [rouge_type], use_stemmer=True
+                ),
             )
 
             def calculate_rouge(pred, act, score_type="fmeasure", **kw):
                 scores = scorer.score(str(act), str(pred))
-                return (
-                    scores[metric_name.replace("_", "")]
-                    ._asdict()
-                    .get(score_type, 0.0)
-                )
+                return scores[rouge_type]._asdict().get(score_type, 0.0)
 
             return calculate_rouge
         except ImportError:
@@ -231,15 +460,10 @@ def _get_metric_function(metric_name: str) -> Callable:
             return lambda p, a, **kw: None
     elif metric_name == "semantic_similarity":
         try:
-            from sentence_transformers import SentenceTransformer, util
-
-            # Cache the model? Maybe pass it in via config?
-            model = SentenceTransformer("all-MiniLM-L6-v2")
+            model = _get_sentence_transformer(registry)
 
             def calculate_similarity(pred, act, **kw):
-                emb1 = model.encode(str(pred), convert_to_tensor=True)
-                emb2 = model.encode(str(act), convert_to_tensor=True)
-                return util.pytorch_cos_sim(emb1, emb2).item()
+                return _cosine_similarities(model, [pred], [act])[0]
 
             return calculate_similarity
         except ImportError:
@@ -256,6 +480,317 @@ def _get_metric_function(metric_name: str) -> Callable:
         raise ValueError(f"Unknown built-in metric: {metric_name}")
 
 
+def _get_batch_metric_function(
+    metric_name: str, registry: MetricRegistry
+) -> Callable:
+    """Maps metric names to column-wise implementations."""
+    if metric_name == "semantic_similarity":
+        try:
+            model = _get_sentence_transformer(registry)
+        except ImportError:
+            logger_helpers.warning(
+                "semantic_similarity requires 'sentence-transformers': pip install sentence-transformers"
+            )
+            return lambda preds, acts, **kw: [None] * len(preds)
+
+        def calculate_similarities(preds, acts, batch_size=64, **kw):
+            return _cosine_similarities(model, preds, acts, batch_size)
+
+        return calculate_similarities
+
+    # Cheap metrics: reuse the cached per-item function over the column, so
+    # one failing item does not mark the whole column as an error
+    item_function = registry.get_function(metric_name)
+
+    def calculate_items(preds, acts, **kw):
+        metric_results = []
+        for pred, act in zip(preds, acts):
+            try:
+                metric_results.append(item_function(pred, act, **kw))
+            except Exception as e:
+                logger_helpers.error(
+                    f"Error calculating metric '{metric_name}': {e}"
+                )
+                metric_results.append(f"[Error: {e}]")
+        return metric_results
+
+    return calculate_items
+
+
+def _get_sentence_transformer(registry: MetricRegistry) -> Any:
+    from sentence_transformers import SentenceTransformer
+
+    return registry.get_resource(
+        "sentence_transformer:all-MiniLM-L6-v2",
+        lambda: SentenceTransformer("all-MiniLM-L6-v2"),
+    )
+
+
+def _cosine_similarities(
+    model: Any, preds: list[Any], acts: list[Any], batch_size: int = 64
+) -> list[float]:
+    """Row-wise cosine similarity of predictions and references.
+
+    Each side is encoded in one batched call; embeddings are normalized so
+    the similarity is a row-wise dot product.
+    """
+    import numpy as np
+
+    pred_embeddings = model.encode(
+        [str(p) for p in preds],
+        batch_size=batch_size,
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+    )
+    act_embeddings = model.encode(
+        [str(a) for a in acts],
+        batch_size=batch_size,
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+    )
+    return np.sum(pred_embeddings * act_embeddings, axis=1).tolist()
+
+
+def calculate_batch_metrics(
+    metric_names: list[str],
+    metric_configs: dict[str, dict[str, Any]],
+    predicted_answers: list[dict[str, Any]],
+    expected_answers: list[dict[str, Any]],
+    registry: MetricRegistry,
+) -> list[dict[str, Any]]:
+    """Calculates built-in string metrics column-wise for many items.
+
+    Equivalent to calling calculate_evaluation_metrics per item for string
+    metrics, but each metric runs once over all predictions (e.g. a single
+    batched embedding pass for semantic_similarity).
+    """
+    results: list[dict[str, Any]] = [{} for _ in predicted_answers]
+    if not results:
+        return results
+
+    for metric_name in metric_names:
+        if not (
+            metric_name in predicted_answers[0]
+            and metric_name in expected_answers[0]
+        ):
+            logger_helpers.warning(
+                f"Could not find matching predicted/expected values for metric '{metric_name}' based on answer_mapping keys."
+            )
+            for item_results in results:
+                item_results[metric_name] = None
+            continue
+
+        try:
+            batch_function = registry.get_batch_function(metric_name)
+            metric_results = batch_function(
+                [p[metric_name] for p in predicted_answers],
+                [e[metric_name] for e in expected_answers],
+                **metric_configs.get(metric_name, {}),
+            )
+        except Exception as e:
+            logger_helpers.error(
+                f"Error calculating metric '{metric_name}': {e}"
+            )
+            metric_results = [f"[Error: {e}]"] * len(results)
+
+        for item_results, metric_result in zip(results, metric_results):
+            if isinstance(metric_result, dict):
+                for sub_key, sub_value in metric_result.items():
+                    item_results[f"{metric_name}_{sub_key}"] = sub_value
+            else:
+                item_results[metric_name] = metric_result
+
+    return results
+
+
+def wilson_interval(
+    successes: int, n: int, confidence: float = 0.95
+) -> tuple[float, float]:
+    """Wilson score interval for a proportion."""
+    if n == 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    p = successes / n
+    denominator = 1 + z**2 / n
+    center = (p + z**2 / (2 * n)) / denominator
+    margin = z * np.sqrt(p * (1 - p) / n + z**2 / (4 * n**2)) / denominator
+    return float(center - margin), float(center + margin)
+
+
+def bootstrap_interval(
+    values: Any,
+    confidence: float = 0.95,
+    n_resamples: int = 1000,
+    rng: np.random.Generator | None = None,
+) -> tuple[float, float]:
+    """Percentile bootstrap interval for the mean, resampled with NumPy."""
+    values = np.asarray(values, dtype=float)
+    if values.size == 0:
+        return float("nan"), float("nan")
+    rng = rng or np.random.default_rng()
+    # Resample in blocks to bound memory (n_resamples x n indices)
+    block = max(1, 2_000_000 // values.size)
+    means = np.concatenate(
+        [
+            values[
+                rng.integers(
+                    0,
+                    values.size,
+                    size=(min(block, n_resamples - start), values.size),
+                )
+            ].mean(axis=1)
+            for start in range(0, n_resamples, block)
+        ]
+    )
+    alpha = (1 - confidence) / 2
+    low, high = np.quantile(means, [alpha, 1 - alpha])
+    return float(low), float(high)
+
+
+def confidence_interval(
+    values: list[bool | int | float],
+    confidence: float = 0.95,
+    rng: np.random.Generator | None = None,
+) -> dict[str, Any]:
+    """Mean and confidence interval of a metric's values.
+
+    Boolean metrics use the Wilson interval, numeric metrics a bootstrap.
+    """
+    n = len(values)
+    if n and all(isinstance(v, bool) for v in values):
+        successes = int(np.sum(values))
+        low, high = wilson_interval(successes, n, confidence)
+        mean, method = successes / n, "wilson"
+    else:
+        low, high = bootstrap_interval(values, confidence, rng=rng)
+        mean = float(np.mean(values)) if n else float("nan")
+        method = "bootstrap"
+    return {
+        "mean": mean,
+        "low": low,
+        "high": high,
+        "half_width": (high - low) / 2,
+        "n": n,
+        "method": method,
+    }
+
+
+def check_confidence_intervals(
+    results_list: list[dict[str, Any]],
+    target_half_width: float,
+    confidence: float = 0.95,
+    min_items: int = 30,
+    metric_names: list[str] | None = None,
+    rng: np.random.Generator | None = None,
+) -> dict[str, Any]:
+    """Checks whether all monitored metrics are estimated precisely enough.
+
+    Args:
+        results_list: Evaluated items (errored items are ignored).
+        target_half_width: Required CI half-width, e.g. 0.01 for +-1%.
+        confidence: Confidence level of the intervals.
+        min_items: Minimum number of values per metric before stopping.
+        metric_names: Metrics to monitor; None monitors all numeric metrics.
+
+    Returns:
+        A dict with 'converged', 'items_evaluated' and per-metric 'intervals'.
+    """
+    values_by_metric: dict[str, list[bool | int | float]] = {
+        name: [] for name in metric_names or []
+    }
+    for item in results_list:
+        if item.get("error"):
+            continue
+        for name, value in item.get("metrics", {}).items():
+            if metric_names is not None and name not in metric_names:
+                continue
+            if isinstance(value, bool | int | float):
+                values_by_metric.setdefault(name, []).append(value)
+
+    intervals = {
+        name: confidence_interval(values, confidence, rng)
+        for name, values in values_by_metric.items()
+    }
+    converged = bool(intervals) and all(
+        interval["n"] >= min_items
+        and interval["half_width"] <= target_half_width
+        for interval in intervals.values()
+    )
+    return {
+        "converged": converged,
+        "items_evaluated": len(results_list),
+        "intervals": intervals,
+    }
+
+
+class RunningIntervals:
+    """Running (Welford) estimates of metric means for early stopping.
+
+    Values are added once per item, so checking convergence costs O(1) per
+    metric instead of recomputing intervals over all values seen so far.
+    Boolean metrics use the Wilson interval, numeric metrics a normal
+    approximation; check_confidence_intervals gives the final report.
+    """
+
+    def __init__(self, metric_names: list[str] | None = None):
+        """Initialize the estimates.
+
+        Args:
+            metric_names: Metrics to monitor; None monitors all numeric
+                metrics.
+        """
+        self.metric_names = metric_names
+        self._stats: dict[str, dict[str, Any]] = {
+            name: {"n": 0, "mean": 0.0, "m2": 0.0, "boolean": True}
+            for name in metric_names or []
+        }
+
+    def add(self, item: dict[str, Any]) -> None:
+        """Adds the metric values of one evaluated item."""
+        if item.get("error"):
+            return
+        for name, value in item.get("metrics", {}).items():
+            if self.metric_names is not None and name not in self.metric_names:
+                continue
+            if not isinstance(value, bool | int | float):
+                continue
+            stats = self._stats.setdefault(
+                name, {"n": 0, "mean": 0.0, "m2": 0.0, "boolean": True}
+            )
+            stats["n"] += 1
+            delta = value - stats["mean"]
+            stats["mean"] += delta / stats["n"]
+            stats["m2"] += delta * (value - stats["mean"])
+            stats["boolean"] = stats["boolean"] and isinstance(value, bool)
+
+    def half_width(self, name: str, confidence: float = 0.95) -> float:
+        """Current CI half-width of a metric (inf without enough values)."""
+        stats = self._stats.get(name)
+        if not stats or stats["n"] < 2:
+            return float("inf")
+        n = stats["n"]
+        if stats["boolean"]:
+            low, high = wilson_interval(
+                round(stats["mean"] * n), n, confidence
+            )
+            return (high - low) / 2
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        return float(z * np.sqrt(stats["m2"] / (n - 1) / n))
+
+    def converged(
+        self,
+        target_half_width: float,
+        confidence: float = 0.95,
+        min_items: int = 30,
+    ) -> bool:
+        """Whether every monitored metric is estimated precisely enough."""
+        return bool(self._stats) and all(
+            stats["n"] >= min_items
+            and self.half_width(name, confidence) <= target_half_width
+            for name, stats in self._stats.items()
+        )
+
+
 def aggregate_results(results_list: list[dict[str, Any]]) -> dict[str, Any]:
     """Aggregates evaluation results across all items."""
     summary = {"total_items": len(results_list), "errors": 0}
@@ -294,19 +829,225 @@ def aggregate_results(results_list: list[dict[str, Any]]) -> dict[str, Any]:
     return summary
 
 
-# --- Placeholder for async judge execution ---
-# Need to run these within the main async context or manage loops carefully
-async def _run_judge_agent(judge_agent, predicted, expected, config):
-    # Prepare input for the judge agent based on its signature
-    # E.g., judge_input = {"prediction": predicted_value, "reference": expected_value, "criteria": ...}
-    # judge_result = await judge_agent.run_async(judge_input)
-    # return judge_result # Or extract specific score/judgement
-    return "[Agent Judge Not Implemented]"
+# --- LLM-as-judge metrics ---
+DEFAULT_JUDGE_INPUT = "prediction: str, reference: str"
+DEFAULT_JUDGE_OUTPUT = (
+    "score: float | Score between 0 and 1 for how well the prediction matches the reference, "
+    "reasoning: str | Short justification"
+)
+
+
+class JudgmentCache:
+    """Caches judge results keyed on (judge definition, prediction, reference).
+
+    Identical judgments are only paid for once: repeated keys return the
+    stored result and concurrent requests for the same key share a single
+    judge call. If a path is given, judgments are loaded from and saved to
+    that JSON file so they survive re-evaluations across processes. If
+    maxsize is given, the least recently used judgments are evicted beyond
+    that many entries.
+    """
+
+    def __init__(
+        self, path: str | Path | None = None, maxsize: int | None = None
+    ):
+        """Creates the cache, loading stored judgments from path if given."""
+        self.path = Path(path) if path else None
+        self.maxsize = maxsize
+        self._judgments: OrderedDict[str, Any] = OrderedDict()
+        self._pending: dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        if self.path and self.path.exists():
+            with open(self.path, encoding="utf-8") as f:
+                self._judgments.update(json.load(f))
+            self._evict()
+
+    @staticmethod
+    def make_key(
+        judge: "FlockAgent | FlockEvaluator",
+        config: dict[str, Any],
+        predicted: Any,
+        expected: Any,
+    ) -> str:
+        """Builds a stable hash of the judge definition and its inputs."""
+        payload = json.dumps(
+            {
+                "judge": _judge_fingerprint(judge),
+                "config": config,
+                "prediction": predicted,
+                "reference": expected,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def get_or_compute(
+        self, key: str, compute: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Returns the cached judgment for key or computes and stores it."""
+        if key in self._judgments:
+            self.hits += 1
+            self._judgments.move_to_end(key)
+            return self._judgments[key]
+        pending = self._pending.get(key)
+        if pending is not None:
+            self.hits += 1
+            return await asyncio.shield(pending)
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            value = await compute()
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark as retrieved if nobody is waiting
+            raise
+        finally:
+            self._pending.pop(key, None)
+        self._judgments[key] = value
+        self._evict()
+        future.set_result(value)
+        return value
+
+    def _evict(self) -> None:
+        """Drops the least recently used judgments beyond maxsize."""
+        if self.maxsize is None:
+            return
+        while len(self._judgments) > self.maxsize:
+            self._judgments.popitem(last=False)
+
+    def save(self) -> None:
+        """Persists judgments to the cache file, if one is configured."""
+        if not self.path:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(self._judgments, f, default=str)
+
+
+def _judge_fingerprint(judge: Any) -> dict[str, Any]:
+    """Describes what determines a judge's output (not its runtime state)."""
+    evaluator = getattr(judge, "evaluator", judge)
+    config = getattr(evaluator, "config", None)
+    return {
+        "type": type(judge).__name__,
+        "name": getattr(judge, "name", None),
+        "description": str(getattr(judge, "description", None)),
+        "input": str(getattr(judge, "input", None)),
+        "output": str(getattr(judge, "output", None)),
+        "model": getattr(judge, "model", None),
+        "evaluator_type": type(evaluator).__name__,
+        "evaluator_config": config.model_dump(mode="json")
+        if hasattr(config, "model_dump")
+        else None,
+    }
+
+
+def _judge_values(answers: dict[str, Any]) -> Any:
+    """Unwraps single-answer dicts so judges see the plain value."""
+    if len(answers) == 1:
+        return next(iter(answers.values()))
+    return answers
+
+
+async def _run_judge_agent(
+    judge_agent: "FlockAgent",
+    predicted: Any,
+    expected: Any,
+    config: dict[str, Any],
+) -> Any:
+    """Runs a judge agent with prediction/reference (plus config) as input."""
+    judge_input = {"prediction": predicted, "reference": expected, **config}
+    return await judge_agent.run_async(judge_input)
+
+
+async def _run_judge_evaluator(
+    judge_evaluator: "FlockEvaluator",
+    predicted: Any,
+    expected: Any,
+    config: dict[str, Any],
+) -> Any:
+    """Runs a judge evaluator through a transient agent definition.
+
+    The signature can be overridden with the 'input'/'output' config keys;
+    other config keys are passed as additional inputs.
+    """
+    config = dict(config)
+    judge_agent = FlockAgent(
+        name=getattr(judge_evaluator, "name", "judge_evaluator"),
+        description="Judge how well a prediction matches the reference.",
+        input=config.pop("input", DEFAULT_JUDGE_INPUT),
+        output=config.pop("output", DEFAULT_JUDGE_OUTPUT),
+        evaluator=judge_evaluator,
+    )
+    judge_input = {"prediction": predicted, "reference": expected, **config}
+    return await judge_evaluator.evaluate(judge_agent, judge_input, [])
+
+
+async def calculate_judge_metrics(
+    judges: list[Union["FlockAgent", "FlockEvaluator"]],
+    metric_configs: dict[str, dict[str, Any]],
+    predicted_answers: dict[str, Any],
+    expected_answers: dict[str, Any],
+    semaphore: asyncio.Semaphore | None = None,
+    cache: JudgmentCache | None = None,
+) -> dict[str, Any]:
+    """Runs all judge metrics for one item concurrently.
+
+    Each judge call acquires the (judge-specific) semaphore, so judges have
+    their own concurrency limit independent of the agent runs. Results are
+    looked up in / stored to the judgment cache.
+    """
+    semaphore = semaphore or asyncio.Semaphore(len(judges) or 1)
+    cache = cache or get_judgment_cache()
+    predicted = _judge_values(predicted_answers)
+    expected = _judge_values(expected_answers)
+
+    async def run_judge(judge):
+        if isinstance(judge, FlockAgent):
+            metric_name = getattr(judge, "name", "judge_agent")
+            run = _run_judge_agent
+        else:
+            metric_name = getattr(judge, "name", "judge_evaluator")
+            run = _run_judge_evaluator
+        config = metric_configs.get(metric_name, {})
+        key = JudgmentCache.make_key(judge, config, predicted, expected)
+
+        async def compute():
+            async with semaphore:
+                return _to_plain(await run(judge, predicted, expected, config))
+
+        try:
+            return metric_name, await cache.get_or_compute(key, compute)
+        except Exception as e:
+            logger_helpers.error(
+                f"Error calculating judge metric '{metric_name}': {e}"
+            )
+            return metric_name, f"[Error: {e}]"
+
+    results = {}
+    for metric_name, metric_result in await asyncio.gather(
+        *(run_judge(judge) for judge in judges)
+    ):
+        if isinstance(metric_result, dict):
+            for sub_key, sub_value in metric_result.items():
+                results[f"{metric_name}_{sub_key}"] = sub_value
+        else:
+            results[metric_name] = metric_result
+    return results
+
+
+def _to_plain(value: Any) -> Any:
+    """Converts Box results to plain dicts for caching and serialization."""
+    return value.to_dict() if isinstance(value, Box) else value
+
+
+_judgment_cache_instance = JudgmentCache(maxsize=10_000)
 
 
-async def _run_judge_evaluator(judge_evaluator, predicted, expected, config):
-    # Prepare input for the judge evaluator based on its signature
-    # judge_input = {"prediction": predicted_value, "reference": expected_value, **config}
-    # judge_result = await judge_evaluator.evaluate(None, judge_input, []) # Agent might not be needed
-    # return judge_result # Or extract specific score/judgement
-    return "[Evaluator Judge Not Implemented]"
+def get_judgment_cache() -> JudgmentCache:
+    """Returns the process-wide, size-bounded judgment cache."""
+    return _judgment_cache_instance
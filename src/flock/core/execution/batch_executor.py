@@ -1,6 +1,6 @@
 import asyncio
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Union
 
 from box import Box
 from opentelemetry import trace
@@ -13,11 +13,18 @@ from rich.progress import (  # Import Rich Progress
     TimeElapsedColumn,
 )
 
-from flock.config import TELEMETRY
 from flock.core.context.context import FlockContext
 from flock.core.context.context_vars import FLOCK_BATCH_SILENT_MODE
 from flock.core.flock_agent import FlockAgent
 from flock.core.logging.logging import get_logger
+from flock.core.util.columnar import (
+    columnar_column_names,
+    dataframe_to_records,
+    is_columnar_source,
+    read_columnar_table,
+    table_to_records,
+    write_parquet,
+)
 
 try:
     import pandas as pd
@@ -28,13 +35,25 @@ except ImportError:
     PANDAS_AVAILABLE = False
 
 if TYPE_CHECKING:
+    import pyarrow as pa
+
     from flock.core.flock import Flock
 
 logger = get_logger("flock")
-TELEMETRY.setup_tracing()  # Setup OpenTelemetry
 tracer = trace.get_tracer(__name__)
 
 
+def _result_to_record(result: Any) -> dict[str, Any]:
+    """Normalizes a batch result (Box, dict, Exception or None) to a dict."""
+    if isinstance(result, Box):
+        return result.to_dict()
+    if isinstance(result, dict):
+        return result
+    if isinstance(result, Exception):
+        return {"error": str(result)}
+    return {}
+
+
 class BatchProcessor:
     def __init__(self, flock_instance: "Flock"):
         self.flock = flock_instance
@@ -42,7 +61,7 @@ class BatchProcessor:
     async def run_batch_async(
         self,
         start_agent: FlockAgent | str,
-        batch_inputs: list[dict[str, Any]] | DataFrame | str,
+        batch_inputs: Union[list[dict[str, Any]], DataFrame, "pa.Table", str],
         input_mapping: dict[str, str] | None = None,
         static_inputs: dict[str, Any] | None = None,
         parallel: bool = True,
@@ -54,6 +73,8 @@ class BatchProcessor:
         write_to_csv: str | None = None,
         hide_columns: list[str] | None = None,
         delimiter: str = ",",
+        pack_size: int = 1,
+        write_to_parquet: str | None = None,
     ) -> list[Box | dict | None | Exception]:
         """Runs the specified agent/workflow for each item in a batch asynchronously.
 
@@ -63,7 +84,9 @@ class BatchProcessor:
                 - List of dictionaries, each representing inputs for one run
                 - Pandas DataFrame where each row is inputs for one run
                 - String path to a CSV file to load as DataFrame
-            input_mapping: Maps DataFrame/CSV column names to agent input keys (required for DataFrame/CSV).
+                - pyarrow Table, or path to a Parquet/Arrow IPC file (.parquet,
+                  .arrow, .feather); only mapped columns are read
+            input_mapping: Maps DataFrame/CSV/Arrow column names to agent input keys.
             static_inputs: Dictionary of inputs constant across all batch runs.
             parallel: Whether to run local jobs in parallel (ignored if use_temporal=True).
             max_workers: Max concurrent local workers (used if parallel=True and use_temporal=False).
@@ -73,6 +96,12 @@ class BatchProcessor:
             silent_mode: If True, suppress output and show progress bar instead.
             write_to_csv: Path to save results as CSV file.
             hide_columns: List of column names to hide from output.
+            delimiter: Delimiter used when writing the CSV file.
+            pack_size: If > 1, pack this many items into a single LM call using a
+                list-typed variant of the agent's signature (local runs only).
+                Packed items skip agent modules and routing; items whose outputs
+                cannot be parsed are re-run individually.
+            write_to_parquet: Path to save results as a Parquet file.
 
         Returns:
             List containing results (Box/dict), None (if error and not return_errors),
@@ -105,61 +134,78 @@ class BatchProcessor:
         if static_inputs == {}:
             static_inputs = None
 
-        if isinstance(batch_inputs, str):
-            # Handle CSV file input
+        if is_columnar_source(batch_inputs):
+            # Handle Arrow table / Parquet / Arrow IPC input
             try:
-                df = pd.read_csv(batch_inputs)
-                logger.debug(
-                    f"Loaded CSV file with {len(df)} rows: {batch_inputs}"
-                )
-                batch_inputs = df  # Convert to DataFrame for unified handling
-            except Exception as e:
+                columns = None
+                if input_mapping:
+                    # Like DataFrame inputs, missing mapped columns are
+                    # skipped (with a warning) rather than raising
+                    available = columnar_column_names(batch_inputs)
+                    columns = [c for c in input_mapping if c in available]
+                table = read_columnar_table(batch_inputs, columns=columns)
+            except (ValueError, OSError) as e:
                 raise ValueError(
-                    f"Failed to load CSV file '{batch_inputs}': {e}"
+                    f"Failed to load columnar input '{batch_inputs}': {e}"
                 )
-
-        if isinstance(batch_inputs, DataFrame):
-            # Handle DataFrame input
             logger.debug(
-                f"Converting DataFrame ({len(batch_inputs)} rows) to batch inputs."
+                f"Converting Arrow table ({table.num_rows} rows) to batch inputs."
             )
-            for _, row in batch_inputs.iterrows():
-                if input_mapping:
-                    item_input = {
-                        agent_key: row[df_col]
-                        for df_col, agent_key in input_mapping.items()
-                        if df_col in row
-                    }
-                else:
-                    item_input = row.to_dict()
-                prepared_batch_inputs.append(item_input)
+            prepared_batch_inputs = table_to_records(table, input_mapping)
         else:
-            # Handle list of dictionaries
-            if not isinstance(batch_inputs, list):
-                raise ValueError(
-                    "batch_inputs must be a list of dictionaries, DataFrame, or CSV file path"
-                )
+            if isinstance(batch_inputs, str):
+                # Handle CSV file input
+                try:
+                    df = pd.read_csv(
+                        batch_inputs,
+                        usecols=(lambda col: col in input_mapping)
+                        if input_mapping
+                        else None,
+                    )
+                    logger.debug(
+                        f"Loaded CSV file with {len(df)} rows: {batch_inputs}"
+                    )
+                    batch_inputs = df  # Convert to DataFrame for unified handling
+                except Exception as e:
+                    raise ValueError(
+                        f"Failed to load CSV file '{batch_inputs}': {e}"
+                    )
 
-            if input_mapping:
-                # Apply mapping to dictionary inputs
-                logger.debug("Applying input mapping to dictionary inputs")
-                for item in batch_inputs:
-                    mapped_input = {}
-                    for df_col, agent_key in input_mapping.items():
-                        if df_col in item:
-                            mapped_input[agent_key] = item[df_col]
-                        else:
-                            logger.warning(
-                                f"Input mapping key '{df_col}' not found in input dictionary"
-                            )
-                    prepared_batch_inputs.append(mapped_input)
+            if isinstance(batch_inputs, DataFrame):
+                # Handle DataFrame input
+                logger.debug(
+                    f"Converting DataFrame ({len(batch_inputs)} rows) to batch inputs."
+                )
+                prepared_batch_inputs = dataframe_to_records(
+                    batch_inputs, input_mapping
+                )
             else:
-                # Use dictionaries as-is if no mapping provided
-                prepared_batch_inputs = batch_inputs
+                # Handle list of dictionaries
+                if not isinstance(batch_inputs, list):
+                    raise ValueError(
+                        "batch_inputs must be a list of dictionaries, DataFrame, or CSV file path"
+                    )
 
-            logger.debug(
-                f"Using provided list of {len(prepared_batch_inputs)} batch inputs."
-            )
+                if input_mapping:
+                    # Apply mapping to dictionary inputs
+                    logger.debug("Applying input mapping to dictionary inputs")
+                    for item in batch_inputs:
+                        mapped_input = {}
+                        for df_col, agent_key in input_mapping.items():
+                            if df_col in item:
+                                mapped_input[agent_key] = item[df_col]
+                            else:
+                                logger.warning(
+                                    f"Input mapping key '{df_col}' not found in input dictionary"
+                                )
+                        prepared_batch_inputs.append(mapped_input)
+                else:
+                    # Use dictionaries as-is if no mapping provided
+                    prepared_batch_inputs = batch_inputs
+
+                logger.debug(
+                    f"Using provided list of {len(prepared_batch_inputs)} batch inputs."
+                )
 
         if not prepared_batch_inputs:
             return []
@@ -230,8 +276,69 @@ class BatchProcessor:
                             progress_task_id, advance=1
                         )  # Update progress
 
+        packed_agent = None
+        if pack_size > 1 and not effective_use_temporal:
+            packed_agent = self._resolve_packable_agent(start_agent)
+            if packed_agent is None:
+                logger.warning(
+                    f"Agent '{start_agent}' does not support prompt packing. Running items individually."
+                )
+
+        async def packed_worker(indices: list[int]):
+            items = [
+                {**(static_inputs or {}), **prepared_batch_inputs[i]}
+                for i in indices
+            ]
+            async with semaphore:
+                logger.debug(
+                    f"Packed batch items {indices[0] + 1}-{indices[-1] + 1} started."
+                )
+                try:
+                    outputs = await packed_agent.evaluator.evaluate_packed(
+                        packed_agent, items, packed_agent.tools or []
+                    )
+                except Exception as e:
+                    logger.warning(f"Packed batch call failed: {e}")
+                    outputs = [None] * len(indices)
+
+            fallback_indices = []
+            for index, output in zip(indices, outputs):
+                if output is None:
+                    fallback_indices.append(index)
+                    continue
+                results[index] = Box(output) if box_results else output
+                if progress_context:
+                    progress.update(progress_task_id, advance=1)
+
+            if fallback_indices:
+                logger.debug(
+                    f"Falling back to single-item runs for {len(fallback_indices)} packed items."
+                )
+                await asyncio.gather(
+                    *(
+                        worker(i, prepared_batch_inputs[i])
+                        for i in fallback_indices
+                    )
+                )
+
         try:
-            if effective_use_temporal:
+            if packed_agent is not None:
+                packs = [
+                    list(range(i, min(i + pack_size, len(prepared_batch_inputs))))
+                    for i in range(0, len(prepared_batch_inputs), pack_size)
+                ]
+                logger.info(
+                    f"Running batch as {len(packs)} packed calls of up to {pack_size} items..."
+                )
+                if parallel:
+                    await asyncio.gather(
+                        *(packed_worker(pack) for pack in packs)
+                    )
+                else:
+                    for pack in packs:
+                        await packed_worker(pack)
+
+            elif effective_use_temporal:
                 # Temporal Batching (Simplified: sequential execution for this example)
                 # A real implementation might use start_workflow or signals
                 logger.info(
@@ -282,12 +389,50 @@ class BatchProcessor:
             except Exception as e:
                 logger.error(f"Failed to write results to CSV: {e}")
 
+        if write_to_parquet:
+            try:
+                write_parquet(
+                    [_result_to_record(r) for r in results],
+                    write_to_parquet,
+                    hide_columns=hide_columns,
+                )
+                logger.info(
+                    f"Results written to Parquet file: {write_to_parquet}"
+                )
+            except Exception as e:
+                logger.error(f"Failed to write results to Parquet: {e}")
+
         return results
 
+    def _resolve_packable_agent(
+        self, start_agent: FlockAgent | str
+    ) -> FlockAgent | None:
+        """Returns the start agent if its items can be packed, else None.
+
+        Packing requires a single-hop agent (no handoff router) with static
+        input/output specs and an evaluator that implements evaluate_packed.
+        """
+        if isinstance(start_agent, FlockAgent):
+            if start_agent.name not in self.flock.agents:
+                self.flock.add_agent(start_agent)
+            agent = start_agent
+        else:
+            agent = self.flock.agents.get(start_agent)
+
+        if (
+            agent is None
+            or agent.handoff_router is not None
+            or not isinstance(agent.input, str)
+            or not isinstance(agent.output, str)
+            or not hasattr(agent.evaluator, "evaluate_packed")
+        ):
+            return None
+        return agent
+
     def run_batch(  # Synchronous wrapper
         self,
         start_agent: FlockAgent | str,
-        batch_inputs: list[dict[str, Any]] | DataFrame | str,
+        batch_inputs: Union[list[dict[str, Any]], DataFrame, "pa.Table", str],
         input_mapping: dict[str, str] | None = None,
         static_inputs: dict[str, Any] | None = None,
         parallel: bool = True,
@@ -299,6 +444,8 @@ class BatchProcessor:
         write_to_csv: str | None = None,
         hide_columns: list[str] | None = None,
         delimiter: str = ",",
+        pack_size: int = 1,
+        write_to_parquet: str | None = None,
     ) -> list[Box | dict | None | Exception]:
         """Synchronous wrapper for run_batch_async."""
         # (Standard asyncio run wrapper - same as in previous suggestion)
@@ -324,6 +471,8 @@ class BatchProcessor:
             write_to_csv=write_to_csv,
             hide_columns=hide_columns,
             delimiter=delimiter,
+            pack_size=pack_size,
+            write_to_parquet=write_to_parquet,
         )
 
         if asyncio.get_event_loop() is loop and not loop.is_running():
@@ -5,7 +5,8 @@ against datasets using various metrics.
 
 import asyncio
 import json
-from collections.abc import Callable
+import random
+from collections.abc import Callable, Iterable
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
@@ -14,6 +15,7 @@ from typing import (
     Union,
 )
 
+import numpy as np
 from pandas import DataFrame
 
 # Conditional pandas import
@@ -29,21 +31,42 @@ except ImportError:
 from box import Box
 from datasets import Dataset as HFDataset
 
+from flock.core.evaluation.result_store import (
+    EvaluationResultStore,
+    agent_fingerprint,
+    input_hash,
+)
 from flock.core.evaluation.utils import (
+    JudgmentCache,
+    MetricRegistry,
+    RunningIntervals,
     aggregate_results,
+    calculate_batch_metrics,
     calculate_evaluation_metrics,
+    calculate_judge_metrics,
+    check_confidence_intervals,
     extract_value_by_dot_notation,
+    get_judgment_cache,
+    iter_dataset_batches,
     normalize_dataset,
     # Import metric calculation/aggregation helpers
 )
 
 # Flock core imports
+from flock.core.flock_agent import FlockAgent
+from flock.core.flock_evaluator import FlockEvaluator
 from flock.core.logging.logging import get_logger
+from flock.core.util.columnar import (
+    PARQUET_SUFFIXES,
+    is_columnar_source,
+    read_columnar_table,
+    write_parquet,
+)
 
 if TYPE_CHECKING:
+    import pyarrow as pa
+
     from flock.core.flock import Flock
-    from flock.core.flock_agent import FlockAgent
-    from flock.core.flock_evaluator import FlockEvaluator
     # Conditional types
 
 
@@ -63,7 +86,15 @@ class EvaluationExecutor:
 
     async def evaluate_async(
         self,
-        dataset: str | Path | list[dict[str, Any]] | DataFrame | HFDataset,
+        dataset: Union[
+            str,
+            Path,
+            list[dict[str, Any]],
+            DataFrame,
+            HFDataset,
+            "pa.Table",
+            Iterable[dict[str, Any]],
+        ],
         start_agent: Union["FlockAgent", str],
         input_mapping: dict[str, str],
         answer_mapping: dict[str, str],
@@ -85,9 +116,59 @@ class EvaluationExecutor:
         return_dataframe: bool = True,
         silent_mode: bool = False,
         metadata_columns: list[str] | None = None,  # Columns to pass through
+        judge_max_workers: int = 5,
+        judge_cache: JudgmentCache | None = None,
+        result_store: EvaluationResultStore | str | Path | None = None,
+        early_stopping_ci_width: float | None = None,
+        early_stopping_confidence: float = 0.95,
+        early_stopping_min_items: int = 30,
+        early_stopping_metrics: list[str] | None = None,
+        random_seed: int | None = None,
+        streaming: bool = False,
+        stream_batch_size: int = 1000,
+        num_shards: int = 1,
+        shard_index: int = 0,
+        metric_registry: MetricRegistry | None = None,
+        semaphore: asyncio.Semaphore | None = None,
+        judge_semaphore: asyncio.Semaphore | None = None,
+        prepared_items: list[dict[str, Any]] | None = None,
         # dataset_split: Optional[str] = None # TODO: Add split support in normalize_dataset
     ) -> DataFrame | list[dict[str, Any]]:
-        """Evaluates the Flock's performance against a dataset asynchronously."""
+        """Evaluates the Flock's performance against a dataset asynchronously.
+
+        FlockAgent/FlockEvaluator metrics act as LLM judges. They run
+        concurrently (up to judge_max_workers) alongside the agent runs, and
+        their results are cached in judge_cache (default: the process-wide
+        cache) keyed on judge definition, prediction and reference.
+
+        If result_store (a store or SQLite path) is given, agent outputs are
+        cached by (agent-definition fingerprint, input hash): unchanged items
+        reuse the stored output instead of re-running (marked with
+        from_store=True) and only their metrics are recomputed.
+
+        If early_stopping_ci_width is set (e.g. 0.01 for +-1%), items are
+        processed in random order (random_seed) and evaluation stops once the
+        confidence interval of every monitored metric (early_stopping_metrics,
+        default all numeric metrics) is that narrow and at least
+        early_stopping_min_items values were seen. Convergence is checked
+        every max_workers finished items from running estimates (Wilson
+        intervals for boolean metrics, a normal approximation otherwise);
+        the reported intervals (bootstrap for numeric metrics) are computed
+        once at the end. The report, including the number of items needed,
+        is added to the summary and to the returned DataFrame's
+        attrs["early_stopping"].
+
+        With streaming=True the dataset is read lazily in batches of
+        stream_batch_size rows (only the mapped columns), so runs start
+        immediately and memory is bounded by the batch size; Hugging Face
+        hub datasets are loaded with streaming=True. num_shards/shard_index
+        select a disjoint part of the dataset, e.g. one per process.
+
+        metric_registry, semaphore and judge_semaphore let several
+        evaluations share metric resources and concurrency limits, and
+        prepared_items (built by _build_items) replaces loading the dataset
+        (see evaluate_matrix_async).
+        """
         effective_use_temporal = (
             use_temporal
             if use_temporal is not None
@@ -105,62 +186,109 @@ class EvaluationExecutor:
             f"Starting evaluation for agent '{start_agent_name}'. Execution: {exec_mode}, Silent: {silent_mode}"
         )
 
-        # --- 1. Normalize Dataset ---
-        try:
-            df = normalize_dataset(dataset)  # Uses helper
-            if df is None or df.empty:
-                raise ValueError(
-                    "Provided dataset is empty or could not be normalized."
-                )
-            logger.info(f"Normalized dataset with {len(df)} items.")
-        except Exception as e:
-            logger.error(
-                f"Failed to load or normalize dataset: {e}", exc_info=True
-            )
-            raise ValueError(f"Dataset processing failed: {e}") from e
-
-        # --- 2. Prepare Batch Items ---
-        batch_items = []
+        # --- 1. Load Dataset (only the required columns) ---
         required_input_cols = list(input_mapping.keys())
         required_answer_cols = list(answer_mapping.values())
         required_metadata_cols = metadata_columns or []
-        all_required_cols = set(
-            required_input_cols + required_answer_cols + required_metadata_cols
+        all_required_cols = list(
+            dict.fromkeys(
+                required_input_cols
+                + required_answer_cols
+                + required_metadata_cols
+            )
         )
 
-        missing_cols = all_required_cols - set(df.columns)
-        if missing_cols:
-            raise ValueError(
-                f"Dataset missing required columns: {', '.join(missing_cols)}"
+        if prepared_items is not None:
+            record_batches = iter([prepared_items])
+            known_total = len(prepared_items)
+        elif streaming:
+            # Rows are read lazily, one batch at a time, as evaluation runs
+            record_batches = iter_dataset_batches(
+                dataset,
+                columns=all_required_cols,
+                batch_size=stream_batch_size,
+                num_shards=num_shards,
+                shard_index=shard_index,
             )
+            known_total = None
+        else:
+            loaded_index, rows = self._load_rows(dataset, all_required_cols)
 
-        for index, row in df.iterrows():
-            agent_input = {
-                agent_key: row[df_col]
-                for df_col, agent_key in input_mapping.items()
-            }
-            expected_answers = {
-                agent_out_key: row[answer_col]
-                for agent_out_key, answer_col in answer_mapping.items()
-            }
-            metadata = {col: row[col] for col in required_metadata_cols}
-            batch_items.append(
-                {
-                    "_original_index": index,  # Store original DF index
-                    "_agent_input": agent_input,
-                    "_expected_answers": expected_answers,
-                    "_metadata": metadata,
-                }
-            )
+            shard_pairs = [
+                pair
+                for position, pair in enumerate(zip(loaded_index, rows))
+                if position % num_shards == shard_index
+            ]
+            if not shard_pairs:
+                logger.warning("No items prepared for evaluation.")
+                return pd.DataFrame() if return_dataframe else []
+            record_batches = iter([shard_pairs])
+            known_total = len(shard_pairs)
 
-        if not batch_items:
-            logger.warning("No items prepared for evaluation.")
-            return pd.DataFrame() if return_dataframe else []
+        def next_record_batch() -> list[tuple[Any, dict[str, Any]]] | None:
+            try:
+                return next(record_batches, None)
+            except Exception as e:
+                logger.error(
+                    f"Failed to load or normalize dataset: {e}", exc_info=True
+                )
+                raise ValueError(f"Dataset processing failed: {e}") from e
+
+        # --- 2. Prepare Batch Items ---
+        # Incremental re-evaluation: reuse outputs of unchanged items
+        stored_outputs: dict[str, dict[str, Any]] = {}
+        if result_store is not None:
+            if not isinstance(result_store, EvaluationResultStore):
+                result_store = EvaluationResultStore(result_store)
+            fingerprint = agent_fingerprint(self.flock, start_agent)
+
+        def build_batch_items(records: list[Any]) -> list[dict[str, Any]]:
+            if prepared_items is not None:
+                # Shared with other evaluations: copy the list, not the items
+                batch_items = list(records)
+            else:
+                batch_items = self._build_items(
+                    records,
+                    input_mapping,
+                    answer_mapping,
+                    required_metadata_cols,
+                    static_inputs,
+                    with_input_hash=result_store is not None,
+                )
+
+            if result_store is not None:
+                found = result_store.get_many(
+                    fingerprint, [item["_input_hash"] for item in batch_items]
+                )
+                stored_outputs.update(found)
+                logger.info(
+                    f"Reusing stored outputs for {sum(item['_input_hash'] in found for item in batch_items)} of {len(batch_items)} items."
+                )
+            return batch_items
 
         # --- 3. Execute Workers ---
         results_dict = {}  # Store results keyed by original index
-        tasks = []
-        semaphore = asyncio.Semaphore(
+        # Built-in string metrics are computed column-wise after all runs;
+        # callables and judges are computed per item.
+        metric_registry = metric_registry or MetricRegistry()
+        vectorized_metrics = [
+            m for m in metrics if isinstance(m, str) and m != "llm_judge"
+        ]
+        judge_metrics = [
+            m for m in metrics if isinstance(m, FlockAgent | FlockEvaluator)
+        ]
+        item_metrics = [
+            m
+            for m in metrics
+            if m not in vectorized_metrics and m not in judge_metrics
+        ]
+        judge_semaphore = judge_semaphore or asyncio.Semaphore(
+            judge_max_workers
+        )
+        judgment_cache = judge_cache or get_judgment_cache()
+        predicted_by_index: dict[Any, dict[str, Any]] = {}
+        row_index: list[Any] = []  # Original indices in dataset order
+        semaphore = semaphore or asyncio.Semaphore(
             max_workers if parallel and not effective_use_temporal else 1
         )
 
@@ -186,13 +314,31 @@ class EvaluationExecutor:
                 run_desc = f"Evaluation item (original index: {original_index})"
                 logger.debug(f"{run_desc} starting.")
                 try:
-                    # Run the agent/flock for this item
-                    agent_output = await self.flock.run_async(
-                        start_agent=start_agent,  # Name or instance
-                        input=agent_inputs_with_static,
-                        box_result=True,  # Use Box for easier access via dot notation
-                        # context=... # Assuming isolated context for now
-                    )
+                    item_hash = item_data.get("_input_hash")
+                    if item_hash in stored_outputs:
+                        agent_output = Box(stored_outputs[item_hash])
+                        item_result_details["from_store"] = True
+                    else:
+                        # Run the agent/flock for this item
+                        agent_output = await self.flock.run_async(
+                            start_agent=start_agent,  # Name or instance
+                            input=agent_inputs_with_static,
+                            box_result=True,  # Use Box for easier access via dot notation
+                            # context=... # Assuming isolated context for now
+                        )
+                        if result_store is not None:
+                            item_result_details["from_store"] = False
+                            if not (
+                                isinstance(agent_output, dict)
+                                and "error" in agent_output
+                            ):
+                                result_store.put(
+                                    fingerprint,
+                                    item_hash,
+                                    agent_output.to_dict()
+                                    if isinstance(agent_output, Box)
+                                    else agent_output,
+                                )
                     item_result_details["agent_output"] = (
                         agent_output  # Store Box or dict
                     )
@@ -206,16 +352,18 @@ class EvaluationExecutor:
                                 agent_output, agent_out_key
                             )
                         )
+                    predicted_by_index[original_index] = predicted_answers
 
-                    # Calculate metrics using helper
+                    # Calculate per-item metrics using helper
                     item_result_details["metrics"] = (
                         calculate_evaluation_metrics(
-                            metrics=metrics,
+                            metrics=item_metrics,
                             metric_configs=metric_configs or {},
                             predicted_answers=predicted_answers,
                             expected_answers=item_data["_expected_answers"],
                             agent_inputs=agent_inputs_with_static,  # Pass context if needed
                             agent_output=agent_output,  # Pass context if needed
+                            metric_registry=metric_registry,
                         )
                     )
                     logger.debug(f"{run_desc} finished successfully.")
@@ -232,12 +380,26 @@ class EvaluationExecutor:
                             True  # Mark for filtering
                         )
 
-                # Store result associated with original index
-                results_dict[original_index] = item_result_details
+            # Judges run under their own limit once the agent slot is free,
+            # so they overlap with the remaining agent runs.
+            if judge_metrics and original_index in predicted_by_index:
+                item_result_details["metrics"].update(
+                    await calculate_judge_metrics(
+                        judges=judge_metrics,
+                        metric_configs=metric_configs or {},
+                        predicted_answers=predicted_by_index[original_index],
+                        expected_answers=item_data["_expected_answers"],
+                        semaphore=judge_semaphore,
+                        cache=judgment_cache,
+                    )
+                )
 
-                # Update progress bar if applicable (inside the worker is okay)
-                if progress_context:
-                    progress.update(progress_task_id, advance=1)
+            # Store result associated with original index
+            results_dict[original_index] = item_result_details
+
+            # Update progress bar if applicable (inside the worker is okay)
+            if progress_context:
+                progress.update(progress_task_id, advance=1)
 
         # --- Setup Progress Bar if Silent ---
         progress_context = None
@@ -261,54 +423,206 @@ class EvaluationExecutor:
             )
             progress_context = progress
             progress_task_id = progress.add_task(
-                f"Evaluating {len(batch_items)} items...",
-                total=len(batch_items),
+                "Evaluating items...",
+                total=known_total,  # Unknown while streaming
             )
             progress.start()
 
-        # --- Execute Tasks ---
-        try:
-            if effective_use_temporal:
-                # TODO: Implement parallel Temporal evaluation
-                logger.info(
-                    "Running evaluation using Temporal (executing sequentially for now)..."
-                )
-                for i, item_data in enumerate(batch_items):
-                    await evaluate_worker(i, item_data)  # Pass sequential index
-            elif parallel:
-                logger.info(
-                    f"Running evaluation in parallel with max_workers={max_workers}..."
+        # --- Vectorized metrics for evaluated, not yet scored items ---
+        scored_indices: set = set()
+
+        def apply_batch_metrics() -> None:
+            pending_indices = [
+                idx
+                for idx in predicted_by_index
+                if idx in results_dict and idx not in scored_indices
+            ]
+            if not vectorized_metrics or not pending_indices:
+                return
+            batch_metrics = calculate_batch_metrics(
+                metric_names=vectorized_metrics,
+                metric_configs=metric_configs or {},
+                predicted_answers=[
+                    predicted_by_index[idx] for idx in pending_indices
+                ],
+                expected_answers=[
+                    results_dict[idx]["expected_answers"]
+                    for idx in pending_indices
+                ],
+                registry=metric_registry,
+            )
+            for idx, item_metric_values in zip(pending_indices, batch_metrics):
+                results_dict[idx]["metrics"].update(item_metric_values)
+            scored_indices.update(pending_indices)
+
+        # --- Early stopping: random order, checked with running estimates ---
+        early_stopping = early_stopping_ci_width is not None
+        early_stopping_report = None
+        if early_stopping:
+            order_rng = random.Random(random_seed)
+            running_intervals = RunningIntervals(early_stopping_metrics)
+            added_indices: set = set()
+            logger.info(
+                f"Early stopping enabled: target CI half-width {early_stopping_ci_width} at {early_stopping_confidence:.0%} confidence."
+            )
+
+        async def run_items(items: list[dict[str, Any]], offset: int):
+            if effective_use_temporal or not parallel:
+                for i, item_data in enumerate(items):
+                    await evaluate_worker(offset + i, item_data)
+            else:
+                # Pass sequential index, and the item_data which contains original_index
+                await asyncio.gather(
+                    *(
+                        evaluate_worker(offset + i, item_data)
+                        for i, item_data in enumerate(items)
+                    )
                 )
-                for i, item_data in enumerate(batch_items):
-                    # Pass sequential index i, and the item_data which contains original_index
-                    tasks.append(
-                        asyncio.create_task(evaluate_worker(i, item_data))
+
+        def intervals_converged() -> bool:
+            apply_batch_metrics()
+            for idx, result in results_dict.items():
+                if idx not in added_indices:
+                    added_indices.add(idx)
+                    running_intervals.add(result)
+            return running_intervals.converged(
+                early_stopping_ci_width,
+                early_stopping_confidence,
+                early_stopping_min_items,
+            )
+
+        async def run_until_converged(
+            batch_items: list[dict[str, Any]], offset: int
+        ) -> bool:
+            """Runs items until the intervals converge (sliding window).
+
+            A new item starts as soon as one finishes, and convergence is
+            checked every `window` finished items.
+            """
+            window = (
+                max(1, max_workers)
+                if parallel and not effective_use_temporal
+                else 1
+            )
+            queued = iter(enumerate(batch_items))
+            running: set[asyncio.Future] = set()
+            finished_since_check = 0
+            converged = False
+            try:
+                while True:
+                    while not converged and len(running) < window:
+                        next_item = next(queued, None)
+                        if next_item is None:
+                            break
+                        i, item_data = next_item
+                        running.add(
+                            asyncio.ensure_future(
+                                evaluate_worker(offset + i, item_data)
+                            )
+                        )
+                    if not running:
+                        break
+                    done, running = await asyncio.wait(
+                        running, return_when=asyncio.FIRST_COMPLETED
                     )
-                await asyncio.gather(*tasks)
-            else:  # Sequential Local
-                logger.info("Running evaluation sequentially...")
-                for i, item_data in enumerate(batch_items):
-                    await evaluate_worker(i, item_data)
+                    for task in done:
+                        task.result()  # Re-raises item errors
+                    finished_since_check += len(done)
+                    if not converged and finished_since_check >= window:
+                        finished_since_check = 0
+                        converged = intervals_converged()
+                        if converged:
+                            logger.info(
+                                f"Confidence intervals converged after {len(results_dict)} items; stopping early."
+                            )
+            except BaseException:
+                for task in running:
+                    task.cancel()
+                raise
+            return converged or intervals_converged()
 
-            logger.info("Evaluation execution finished.")
+        async def run_batch_items(
+            batch_items: list[dict[str, Any]], offset: int
+        ) -> bool:
+            """Runs one batch of items; returns True if evaluation can stop."""
+            if not early_stopping:
+                await run_items(batch_items, offset)
+                return False
+            order_rng.shuffle(batch_items)
+            return await run_until_converged(batch_items, offset)
 
-        except Exception as batch_error:
-            logger.error(
-                f"Evaluation stopped due to an error in one of the items: {batch_error}"
+        # --- Execute Tasks ---
+        if effective_use_temporal:
+            # TODO: Implement parallel Temporal evaluation
+            logger.info(
+                "Running evaluation using Temporal (executing sequentially for now)..."
             )
-            if (
-                not error_handling == "skip"
-            ):  # If skipping, we continue; otherwise, re-raise if required
-                if error_handling == "raise":
-                    raise
+        elif parallel:
+            logger.info(
+                f"Running evaluation in parallel with max_workers={max_workers}..."
+            )
+        else:  # Sequential Local
+            logger.info("Running evaluation sequentially...")
+
+        dataset_exhausted = False
+        try:
+            while True:
+                pairs = next_record_batch()
+                if pairs is None:
+                    dataset_exhausted = True
+                    break
+                batch_items = build_batch_items(pairs)
+                offset = len(row_index)
+                row_index.extend(item["_original_index"] for item in batch_items)
+                if progress_context and known_total is None:
+                    progress.update(progress_task_id, total=len(row_index))
+
+                try:
+                    stop = await run_batch_items(batch_items, offset)
+                except Exception as batch_error:
+                    logger.error(
+                        f"Evaluation stopped due to an error in one of the items: {batch_error}"
+                    )
+                    if error_handling == "raise":
+                        raise
+                    stop = True
+                if streaming:
+                    # Score results as they arrive instead of at the end
+                    apply_batch_metrics()
+                if stop:
+                    break
+
+            logger.info("Evaluation execution finished.")
         finally:
             if progress_context:
                 progress.stop()
 
+        if not row_index:
+            logger.warning("No items prepared for evaluation.")
+            return pd.DataFrame() if return_dataframe else []
+
+        apply_batch_metrics()
+        if early_stopping:
+            # Exact intervals (incl. bootstrap) once, for the report
+            early_stopping_report = check_confidence_intervals(
+                list(results_dict.values()),
+                target_half_width=early_stopping_ci_width,
+                confidence=early_stopping_confidence,
+                min_items=early_stopping_min_items,
+                metric_names=early_stopping_metrics,
+                rng=np.random.default_rng(random_seed),
+            )
+
+        judgment_cache.save()
+        if judge_metrics:
+            logger.info(
+                f"Judge metrics: {judgment_cache.hits} cached, {judgment_cache.misses} computed."
+            )
+
         # --- 4. Process Results ---
         # Reconstruct results list based on original order and filtering
         final_results_list = []
-        for idx in df.index:  # Iterate through original DataFrame index
+        for idx in row_index:  # Iterate through original dataset order
             res = results_dict.get(idx)
             if res:
                 if error_handling == "skip" and res.get("_skip"):
@@ -319,87 +633,386 @@ class EvaluationExecutor:
 
         # Calculate aggregate summary using helper
         summary = aggregate_results(final_results_list)
+        if early_stopping_report is not None:
+            total_items = (
+                known_total
+                if known_total is not None
+                else (len(row_index) if dataset_exhausted else None)
+            )
+            early_stopping_report["total_items"] = total_items
+            early_stopping_report["stopped_early"] = (
+                total_items is None
+                or early_stopping_report["items_evaluated"] < total_items
+            )
+            summary["early_stopping"] = early_stopping_report
         logger.info(
             "Evaluation Summary:", extra=summary
         )  # Log summary automatically
 
         # --- 5. Save and Return ---
-        if output_file:
-            output_path = Path(output_file)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            try:
-                results_df = pd.DataFrame(final_results_list)
-                # Handle complex objects before saving
-                if "agent_output" in results_df.columns:
-                    results_df["agent_output"] = results_df[
-                        "agent_output"
-                    ].apply(lambda x: x.to_dict() if isinstance(x, Box) else x)
-                if (
-                    "expected_answers" in results_df.columns
-                ):  # Flatten dicts for CSV
-                    results_df = pd.concat(
-                        [
-                            results_df.drop(["expected_answers"], axis=1),
-                            pd.json_normalize(
-                                results_df["expected_answers"]
-                            ).add_prefix("expected_"),
-                        ],
-                        axis=1,
+        return self._save_and_return(
+            final_results_list,
+            output_file=output_file,
+            return_dataframe=return_dataframe,
+            metadata_columns=metadata_columns,
+            attrs={"early_stopping": early_stopping_report}
+            if early_stopping_report is not None
+            else {},
+        )
+
+    async def evaluate_matrix_async(
+        self,
+        dataset: Union[
+            str, Path, list[dict[str, Any]], DataFrame, HFDataset, "pa.Table"
+        ],
+        variants: dict[str, Union["FlockAgent", str, dict[str, Any]]]
+        | list[Union["FlockAgent", str]],
+        input_mapping: dict[str, str],
+        answer_mapping: dict[str, str],
+        metrics: list[
+            Union[
+                str,
+                Callable[[Any, Any], bool | float | dict[str, Any]],
+                "FlockAgent",
+                "FlockEvaluator",
+            ]
+        ],
+        metric_configs: dict[str, dict[str, Any]] | None = None,
+        static_inputs: dict[str, Any] | None = None,
+        max_workers: int = 5,
+        error_handling: Literal["raise", "skip", "log"] = "log",
+        output_file: str | Path | None = None,
+        return_dataframe: bool = True,
+        metadata_columns: list[str] | None = None,
+        judge_max_workers: int = 5,
+        judge_cache: JudgmentCache | None = None,
+        result_store: EvaluationResultStore | str | Path | None = None,
+    ) -> DataFrame | list[dict[str, Any]]:
+        """Evaluates several agents or model variants on one dataset.
+
+        The dataset is loaded and turned into evaluation items once, and all
+        variants share these items, the metric resources, the judgment cache
+        and a single concurrency budget of max_workers agent runs
+        (judge_max_workers judge calls), so their runs are interleaved
+        instead of evaluated one after another.
+
+        Args:
+            variants: Variant name -> start agent (instance or name), or
+                -> {"agent": ..., "model": ...} to run a copy of the agent
+                with a different model. A list of agents is named by agent.
+            (other args): See evaluate_async.
+
+        Returns:
+            One row per (variant, item) with a "variant" column. Per-variant
+            aggregates are logged and, for DataFrames, stored in
+            attrs["variant_summary"].
+        """
+        resolved, temporary_agents = self._resolve_variants(variants)
+        logger.info(
+            f"Starting matrix evaluation of {len(resolved)} variants: {', '.join(resolved)}"
+        )
+
+        required_cols = list(
+            dict.fromkeys(
+                list(input_mapping.keys())
+                + list(answer_mapping.values())
+                + (metadata_columns or [])
+            )
+        )
+        loaded_index, rows = self._load_rows(dataset, required_cols)
+        shared_items = self._build_items(
+            list(zip(loaded_index, rows)),
+            input_mapping,
+            answer_mapping,
+            metadata_columns or [],
+            static_inputs,
+            with_input_hash=result_store is not None,
+        )
+
+        metric_registry = MetricRegistry()
+        semaphore = asyncio.Semaphore(max_workers)
+        judge_semaphore = asyncio.Semaphore(judge_max_workers)
+        judgment_cache = judge_cache or get_judgment_cache()
+        if result_store is not None and not isinstance(
+            result_store, EvaluationResultStore
+        ):
+            result_store = EvaluationResultStore(result_store)
+
+        try:
+            variant_results = await asyncio.gather(
+                *(
+                    self.evaluate_async(
+                        dataset=dataset,
+                        start_agent=agent,
+                        input_mapping=input_mapping,
+                        answer_mapping=answer_mapping,
+                        metrics=metrics,
+                        metric_configs=metric_configs,
+                        static_inputs=static_inputs,
+                        max_workers=max_workers,
+                        error_handling=error_handling,
+                        return_dataframe=False,
+                        metadata_columns=metadata_columns,
+                        judge_cache=judgment_cache,
+                        result_store=result_store,
+                        metric_registry=metric_registry,
+                        semaphore=semaphore,
+                        judge_semaphore=judge_semaphore,
+                        prepared_items=shared_items,
                     )
-                if "metrics" in results_df.columns:  # Flatten dicts for CSV
-                    results_df = pd.concat(
-                        [
-                            results_df.drop(["metrics"], axis=1),
-                            pd.json_normalize(results_df["metrics"]).add_prefix(
-                                "metric_"
-                            ),
-                        ],
-                        axis=1,
+                    for agent in resolved.values()
+                )
+            )
+        finally:
+            for agent_name in temporary_agents:
+                self.flock._agents.pop(agent_name, None)
+
+        final_results_list = []
+        variant_summary = {}
+        for variant_name, results in zip(resolved, variant_results):
+            final_results_list.extend(
+                {"variant": variant_name, **res} for res in results
+            )
+            variant_summary[variant_name] = aggregate_results(results)
+        logger.info("Matrix Evaluation Summary:", extra=variant_summary)
+
+        return self._save_and_return(
+            final_results_list,
+            output_file=output_file,
+            return_dataframe=return_dataframe,
+            metadata_columns=metadata_columns,
+            attrs={"variant_summary": variant_summary},
+        )
+
+    def _build_items(
+        self,
+        pairs: list[tuple[Any, dict[str, Any]]],
+        input_mapping: dict[str, str],
+        answer_mapping: dict[str, str],
+        metadata_columns: list[str],
+        static_inputs: dict[str, Any] | None = None,
+        with_input_hash: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Builds evaluation items from (index, row) pairs.
+
+        With with_input_hash, each item also gets the "_input_hash" (of its
+        inputs including static_inputs) used as result store key.
+        """
+        batch_items = []
+        for index, row in pairs:
+            agent_input = {
+                agent_key: row[df_col]
+                for df_col, agent_key in input_mapping.items()
+            }
+            expected_answers = {
+                agent_out_key: row[answer_col]
+                for agent_out_key, answer_col in answer_mapping.items()
+            }
+            metadata = {col: row[col] for col in metadata_columns}
+            item = {
+                "_original_index": index,  # Store original DF index
+                "_agent_input": agent_input,
+                "_expected_answers": expected_answers,
+                "_metadata": metadata,
+            }
+            if with_input_hash:
+                item["_input_hash"] = input_hash(
+                    {**(static_inputs or {}), **agent_input}
+                )
+            batch_items.append(item)
+        return batch_items
+
+    def _resolve_variants(
+        self,
+        variants: dict[str, Union["FlockAgent", str, dict[str, Any]]]
+        | list[Union["FlockAgent", str]],
+    ) -> tuple[dict[str, Union["FlockAgent", str]], list[str]]:
+        """Returns variant name -> start agent and the temporary agent names."""
+        if isinstance(variants, list):
+            names = [getattr(agent, "name", agent) for agent in variants]
+            duplicates = sorted({n for n in names if names.count(n) > 1})
+            if duplicates:
+                raise ValueError(
+                    f"Variants must have unique names: {', '.join(duplicates)}"
+                    " (pass a dict to name them)."
+                )
+            variants = dict(zip(names, variants))
+        if not variants:
+            raise ValueError("At least one variant is required.")
+
+        resolved: dict[str, FlockAgent | str] = {}
+        temporary_agents: list[str] = []
+        for variant_name, spec in variants.items():
+            if not isinstance(spec, dict):
+                resolved[variant_name] = spec
+                continue
+            base = spec.get("agent")
+            if isinstance(base, str):
+                base = self.flock.agents.get(base)
+            if not isinstance(base, FlockAgent):
+                raise ValueError(
+                    f"Variant '{variant_name}' needs an 'agent' in the flock."
+                )
+            if "model" not in spec:
+                resolved[variant_name] = base
+                continue
+            # Runs use a copy so variants of one agent never share state
+            agent = base.model_copy(deep=True)
+            agent.name = f"{base.name}[{variant_name}]"
+            agent.set_model(spec["model"])
+            resolved[variant_name] = agent
+            temporary_agents.append(agent.name)
+        return resolved, temporary_agents
+
+    def _load_rows(
+        self, dataset: Any, columns: list[str]
+    ) -> tuple[list[Any], list[dict[str, Any]]]:
+        """Loads the given columns of a dataset as (index, rows)."""
+        try:
+            if is_columnar_source(dataset):
+                # Projection pushdown: unused columns are never read
+                table = read_columnar_table(dataset, columns=columns)
+                if table.num_rows == 0:
+                    raise ValueError("Provided dataset is empty.")
+                rows = table.to_pylist()
+                loaded_index = list(range(table.num_rows))
+            else:
+                df = normalize_dataset(dataset)  # Uses helper
+                if df is None or df.empty:
+                    raise ValueError(
+                        "Provided dataset is empty or could not be normalized."
                     )
-                if "inputs" in results_df.columns:  # Flatten dicts for CSV
-                    results_df = pd.concat(
-                        [
-                            results_df.drop(["inputs"], axis=1),
-                            pd.json_normalize(results_df["inputs"]).add_prefix(
-                                "input_"
-                            ),
-                        ],
-                        axis=1,
+                missing_cols = set(columns) - set(df.columns)
+                if missing_cols:
+                    raise ValueError(
+                        f"Dataset missing required columns: {', '.join(missing_cols)}"
                     )
+                rows = df[columns].to_dict("records")
+                loaded_index = list(df.index)
+            logger.info(f"Loaded dataset with {len(rows)} items.")
+        except Exception as e:
+            logger.error(
+                f"Failed to load or normalize dataset: {e}", exc_info=True
+            )
+            raise ValueError(f"Dataset processing failed: {e}") from e
+        return loaded_index, rows
 
-                # Convert lists/dicts in metadata columns for CSV saving
-                for col in metadata_columns or []:
-                    if col in results_df.columns:
-                        # Check if column contains lists/dicts before converting
-                        if (
-                            results_df[col]
-                            .apply(lambda x: isinstance(x, (list, dict)))
-                            .any()
-                        ):
-                            results_df[col] = results_df[col].apply(json.dumps)
-
-                if output_path.suffix.lower() == ".csv":
-                    results_df.to_csv(output_path, index=False)
-                elif output_path.suffix.lower() == ".json":
-                    # Save list of dicts directly (before potential DataFrame manipulation)
-                    # Need to handle non-serializable types like Box
-                    serializable_results = []
-                    for res_dict in final_results_list:
-                        if "agent_output" in res_dict and isinstance(
-                            res_dict["agent_output"], Box
-                        ):
-                            res_dict["agent_output"] = res_dict[
-                                "agent_output"
-                            ].to_dict()
-                        serializable_results.append(res_dict)
-                    with open(output_path, "w", encoding="utf-8") as f:
-                        json.dump(
-                            serializable_results, f, indent=2, default=str
-                        )  # Use default=str for safety
-                else:
-                    logger.warning(
-                        f"Unsupported output file format: {output_path.suffix}. Use .csv or .json."
-                    )
+    def _flatten_results(
+        self,
+        final_results_list: list[dict[str, Any]],
+        metadata_columns: list[str] | None,
+    ) -> DataFrame:
+        """Builds the results DataFrame with nested dicts as flat columns."""
+        results_df = pd.DataFrame(final_results_list)
+        # Handle complex objects before saving
+        if "agent_output" in results_df.columns:
+            results_df["agent_output"] = results_df["agent_output"].apply(
+                lambda x: x.to_dict() if isinstance(x, Box) else x
+            )
+        if "expected_answers" in results_df.columns:  # Flatten dicts for CSV
+            results_df = pd.concat(
+                [
+                    results_df.drop(["expected_answers"], axis=1),
+                    pd.json_normalize(
+                        results_df["expected_answers"]
+                    ).add_prefix("expected_"),
+                ],
+                axis=1,
+            )
+        if "metrics" in results_df.columns:  # Flatten dicts for CSV
+            results_df = pd.concat(
+                [
+                    results_df.drop(["metrics"], axis=1),
+                    pd.json_normalize(results_df["metrics"]).add_prefix(
+                        "metric_"
+                    ),
+                ],
+                axis=1,
+            )
+        if "inputs" in results_df.columns:  # Flatten dicts for CSV
+            results_df = pd.concat(
+                [
+                    results_df.drop(["inputs"], axis=1),
+                    pd.json_normalize(results_df["inputs"]).add_prefix(
+                        "input_"
+                    ),
+                ],
+                axis=1,
+            )
+
+        # Convert lists/dicts in metadata columns for CSV saving
+        for col in metadata_columns or []:
+            # Check if column contains lists/dicts before converting
+            if (
+                col in results_df.columns
+                and results_df[col]
+                .apply(lambda x: isinstance(x, list | dict))
+                .any()
+            ):
+                results_df[col] = results_df[col].apply(json.dumps)
+        return results_df
+
+    def _write_results(
+        self,
+        output_path: Path,
+        results_df: DataFrame,
+        final_results_list: list[dict[str, Any]],
+    ) -> None:
+        """Writes results in the format given by the file suffix."""
+        if output_path.suffix.lower() == ".csv":
+            results_df.to_csv(output_path, index=False)
+        elif output_path.suffix.lower() == ".json":
+            # Save list of dicts directly (before potential DataFrame manipulation)
+            # Need to handle non-serializable types like Box
+            serializable_results = []
+            for res_dict in final_results_list:
+                if "agent_output" in res_dict and isinstance(
+                    res_dict["agent_output"], Box
+                ):
+                    res_dict["agent_output"] = res_dict[
+                        "agent_output"
+                    ].to_dict()
+                serializable_results.append(res_dict)
+            with open(output_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    serializable_results, f, indent=2, default=str
+                )  # Use default=str for safety
+        elif output_path.suffix.lower() in PARQUET_SUFFIXES:
+            # Keep inputs/metrics/agent_output as nested columns
+            write_parquet(
+                [
+                    {
+                        **res_dict,
+                        "agent_output": res_dict["agent_output"].to_dict()
+                        if isinstance(res_dict.get("agent_output"), Box)
+                        else res_dict.get("agent_output"),
+                    }
+                    for res_dict in final_results_list
+                ],
+                output_path,
+            )
+        else:
+            logger.warning(
+                f"Unsupported output file format: {output_path.suffix}. Use .csv, .json or .parquet."
+            )
+
+    def _save_and_return(
+        self,
+        final_results_list: list[dict[str, Any]],
+        output_file: str | Path | None,
+        return_dataframe: bool,
+        metadata_columns: list[str] | None,
+        attrs: dict[str, Any],
+    ) -> DataFrame | list[dict[str, Any]]:
+        """Saves results to output_file and returns them as requested."""
+        if output_file:
+            output_path = Path(output_file)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                results_df = self._flatten_results(
+                    final_results_list, metadata_columns
+                )
+                self._write_results(output_path, results_df, final_results_list)
                 logger.info(
                     f"Detailed evaluation results saved to {output_path}"
                 )
@@ -423,6 +1036,7 @@ class EvaluationExecutor:
                     results_df["agent_output"] = results_df[
                         "agent_output"
                     ].apply(lambda x: x.to_dict() if isinstance(x, Box) else x)
+            results_df.attrs.update(attrs)
             return results_df
         else:
             # Ensure Box objects are converted if returning list
@@ -6,7 +6,7 @@ from __future__ import annotations  # Ensure forward references work
 import asyncio
 import os
 import uuid
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
@@ -16,11 +16,8 @@ from typing import (
 )
 
 # Third-party imports
-from box import Box
-from datasets import Dataset
 from opentelemetry import trace
 from opentelemetry.baggage import get_baggage, set_baggage
-from pandas import DataFrame
 from pydantic import BaseModel, Field
 
 # Flock core components & utilities
@@ -31,29 +28,30 @@ from flock.core.execution.local_executor import run_local_workflow
 from flock.core.execution.temporal_executor import run_temporal_workflow
 from flock.core.flock_evaluator import FlockEvaluator
 from flock.core.logging.logging import LOGGERS, get_logger, get_module_loggers
-from flock.core.mcp.mcp_connection import MCPServerConnection
+from flock.core.logging.span_attributes import set_payload_attribute
 from flock.core.serialization.serializable import Serializable
 from flock.core.util.cli_helper import init_console
+from flock.core.util.profiler import get_profiler
 
 # Import FlockAgent using TYPE_CHECKING to avoid circular import at runtime
 if TYPE_CHECKING:
-    # These imports are only for type hints
+    # These imports are only for type hints; pandas, datasets, pyarrow and
+    # box are imported on first use to keep `import flock` fast
+    import pyarrow as pa
+    from box import Box
+    from datasets import Dataset
+    from pandas import DataFrame
+
+    from flock.core.evaluation.result_store import EvaluationResultStore
+    from flock.core.evaluation.utils import JudgmentCache
     from flock.core.flock_agent import FlockAgent
+    from flock.core.mcp.mcp_connection import MCPServerConnection
 
 
 # Registry
 from flock.core.flock_registry import get_registry
 
-try:
-    import pandas as pd
-
-    PANDAS_AVAILABLE = True
-except ImportError:
-    pd = None
-    PANDAS_AVAILABLE = False
-
 logger = get_logger("flock")
-TELEMETRY.setup_tracing()  # Setup OpenTelemetry
 tracer = trace.get_tracer(__name__)
 FlockRegistry = get_registry()  # Get the registry instance
 
@@ -93,6 +91,10 @@ class Flock(BaseModel, Serializable):
         default=True,
         description="If True, show the Flock banner on console interactions.",
     )
+    enable_telemetry: bool | None = Field(
+        default=None,
+        description="Process-wide tracing switch. None sets telemetry up lazily on the first span; True sets it up now; False disables it.",
+    )
     # Internal agent storage - not part of the Pydantic model for direct serialization
     _agents: dict[str, FlockAgent]
     _start_agent_name: str | None = None  # For potential pre-configuration
@@ -113,6 +115,7 @@ class Flock(BaseModel, Serializable):
         enable_temporal: bool = False,
         enable_logging: bool | list[str] = False,
         agents: list[FlockAgent] | None = None,
+        enable_telemetry: bool | None = None,
         **kwargs,
     ):
         """Initialize the Flock orchestrator."""
@@ -127,6 +130,7 @@ class Flock(BaseModel, Serializable):
             enable_temporal=enable_temporal,
             enable_logging=enable_logging,
             show_flock_banner=show_flock_banner,
+            enable_telemetry=enable_telemetry,
             **kwargs,
         )
 
@@ -138,6 +142,12 @@ class Flock(BaseModel, Serializable):
         # Set up logging based on the enable_logging flag
         self._configure_logging(enable_logging)  # Use instance attribute
 
+        # Telemetry is per process; None keeps the lazy setup on first span
+        if enable_telemetry is not None:
+            TELEMETRY.configure(enabled=enable_telemetry)
+            if enable_telemetry:
+                TELEMETRY.setup_tracing()
+
         # Register passed agents
         if agents:
             from flock.core.flock_agent import FlockAgent as ConcreteFlockAgent
@@ -350,7 +360,7 @@ class Flock(BaseModel, Serializable):
             effective_run_id = run_id or f"flockrun_{uuid.uuid4().hex[:8]}"
 
             span.set_attribute("start_agent", start_agent_name)
-            span.set_attribute("input", str(run_input))
+            set_payload_attribute(span, "input", run_input)
             span.set_attribute("run_id", effective_run_id)
             span.set_attribute("enable_temporal", self.enable_temporal)
             logger.info(
@@ -400,16 +410,12 @@ class Flock(BaseModel, Serializable):
                 else:
                     result = await run_temporal_workflow(run_context, box_result=False)
 
-                span.set_attribute("result.type", str(type(result)))
-                result_str = str(result)
-                span.set_attribute(
-                    "result.preview",
-                    result_str[:1000] +
-                    ("..." if len(result_str) > 1000 else ""),
-                )
+                set_payload_attribute(span, "result", result)
 
                 if box_result:
                     try:
+                        from box import Box
+
                         logger.debug("Boxing final result.")
                         return Box(result)
                     except ImportError:
@@ -433,7 +439,7 @@ class Flock(BaseModel, Serializable):
     async def run_batch_async(
         self,
         start_agent: FlockAgent | str,
-        batch_inputs: list[dict[str, Any]] | DataFrame | str,
+        batch_inputs: list[dict[str, Any]] | DataFrame | pa.Table | str,
         input_mapping: dict[str, str] | None = None,
         static_inputs: dict[str, Any] | None = None,
         parallel: bool = True,
@@ -445,6 +451,8 @@ class Flock(BaseModel, Serializable):
         write_to_csv: str | None = None,
         hide_columns: list[str] | None = None,
         delimiter: str = ",",
+        pack_size: int = 1,
+        write_to_parquet: str | None = None,
     ) -> list[Box | dict | None | Exception]:
         """Runs the specified agent/workflow for each item in a batch asynchronously (delegated)."""
         # Import processor locally
@@ -465,12 +473,14 @@ class Flock(BaseModel, Serializable):
             write_to_csv=write_to_csv,
             hide_columns=hide_columns,
             delimiter=delimiter,
+            pack_size=pack_size,
+            write_to_parquet=write_to_parquet,
         )
 
     def run_batch(
         self,
         start_agent: FlockAgent | str,
-        batch_inputs: list[dict[str, Any]] | DataFrame | str,
+        batch_inputs: list[dict[str, Any]] | DataFrame | pa.Table | str,
         input_mapping: dict[str, str] | None = None,
         static_inputs: dict[str, Any] | None = None,
         parallel: bool = True,
@@ -482,6 +492,8 @@ class Flock(BaseModel, Serializable):
         write_to_csv: str | None = None,
         hide_columns: list[str] | None = None,
         delimiter: str = ",",
+        pack_size: int = 1,
+        write_to_parquet: str | None = None,
     ) -> list[Box | dict | None | Exception]:
         """Synchronous wrapper for run_batch_async."""
         # (Standard asyncio run wrapper logic)
@@ -507,6 +519,8 @@ class Flock(BaseModel, Serializable):
             write_to_csv=write_to_csv,
             hide_columns=hide_columns,
             delimiter=delimiter,
+            pack_size=pack_size,
+            write_to_parquet=write_to_parquet,
         )
 
         if asyncio.get_event_loop() is loop and not loop.is_running():
@@ -519,7 +533,13 @@ class Flock(BaseModel, Serializable):
     # --- Evaluation (Delegation) ---
     async def evaluate_async(
         self,
-        dataset: str | Path | list[dict[str, Any]] | DataFrame | Dataset,
+        dataset: str
+        | Path
+        | list[dict[str, Any]]
+        | DataFrame
+        | Dataset
+        | pa.Table
+        | Iterable[dict[str, Any]],
         start_agent: FlockAgent | str,
         input_mapping: dict[str, str],
         answer_mapping: dict[str, str],
@@ -539,6 +559,18 @@ class Flock(BaseModel, Serializable):
         return_dataframe: bool = True,
         silent_mode: bool = False,
         metadata_columns: list[str] | None = None,
+        judge_max_workers: int = 5,
+        judge_cache: JudgmentCache | None = None,
+        result_store: EvaluationResultStore | str | Path | None = None,
+        early_stopping_ci_width: float | None = None,
+        early_stopping_confidence: float = 0.95,
+        early_stopping_min_items: int = 30,
+        early_stopping_metrics: list[str] | None = None,
+        random_seed: int | None = None,
+        streaming: bool = False,
+        stream_batch_size: int = 1000,
+        num_shards: int = 1,
+        shard_index: int = 0,
     ) -> DataFrame | list[dict[str, Any]]:
         """Evaluates the Flock's performance against a dataset (delegated)."""
         # Import processor locally
@@ -563,11 +595,29 @@ class Flock(BaseModel, Serializable):
             return_dataframe=return_dataframe,
             silent_mode=silent_mode,
             metadata_columns=metadata_columns,
+            judge_max_workers=judge_max_workers,
+            judge_cache=judge_cache,
+            result_store=result_store,
+            early_stopping_ci_width=early_stopping_ci_width,
+            early_stopping_confidence=early_stopping_confidence,
+            early_stopping_min_items=early_stopping_min_items,
+            early_stopping_metrics=early_stopping_metrics,
+            random_seed=random_seed,
+            streaming=streaming,
+            stream_batch_size=stream_batch_size,
+            num_shards=num_shards,
+            shard_index=shard_index,
         )
 
     def evaluate(
         self,
-        dataset: str | Path | list[dict[str, Any]] | DataFrame | Dataset,
+        dataset: str
+        | Path
+        | list[dict[str, Any]]
+        | DataFrame
+        | Dataset
+        | pa.Table
+        | Iterable[dict[str, Any]],
         start_agent: FlockAgent | str,
         input_mapping: dict[str, str],
         answer_mapping: dict[str, str],
@@ -587,6 +637,18 @@ class Flock(BaseModel, Serializable):
         return_dataframe: bool = True,
         silent_mode: bool = False,
         metadata_columns: list[str] | None = None,
+        judge_max_workers: int = 5,
+        judge_cache: JudgmentCache | None = None,
+        result_store: EvaluationResultStore | str | Path | None = None,
+        early_stopping_ci_width: float | None = None,
+        early_stopping_confidence: float = 0.95,
+        early_stopping_min_items: int = 30,
+        early_stopping_metrics: list[str] | None = None,
+        random_seed: int | None = None,
+        streaming: bool = False,
+        stream_batch_size: int = 1000,
+        num_shards: int = 1,
+        shard_index: int = 0,
     ) -> DataFrame | list[dict[str, Any]]:
         """Synchronous wrapper for evaluate_async."""
         # (Standard asyncio run wrapper logic)
@@ -614,6 +676,18 @@ class Flock(BaseModel, Serializable):
             return_dataframe=return_dataframe,
             silent_mode=silent_mode,
             metadata_columns=metadata_columns,
+            judge_max_workers=judge_max_workers,
+            judge_cache=judge_cache,
+            result_store=result_store,
+            early_stopping_ci_width=early_stopping_ci_width,
+            early_stopping_confidence=early_stopping_confidence,
+            early_stopping_min_items=early_stopping_min_items,
+            early_stopping_metrics=early_stopping_metrics,
+            random_seed=random_seed,
+            streaming=streaming,
+            stream_batch_size=stream_batch_size,
+            num_shards=num_shards,
+            shard_index=shard_index,
         )
 
         if asyncio.get_event_loop() is loop and not loop.is_running():
@@ -623,6 +697,140 @@ class Flock(BaseModel, Serializable):
             future = asyncio.ensure_future(coro)
             return loop.run_until_complete(future)
 
+    async def evaluate_matrix_async(
+        self,
+        dataset: str
+        | Path
+        | list[dict[str, Any]]
+        | DataFrame
+        | Dataset
+        | pa.Table,
+        variants: dict[str, FlockAgent | str | dict[str, Any]]
+        | list[FlockAgent | str],
+        input_mapping: dict[str, str],
+        answer_mapping: dict[str, str],
+        metrics: list[
+            str
+            | Callable[[Any, Any], bool | float | dict[str, Any]]
+            | FlockAgent
+            | FlockEvaluator
+        ],
+        metric_configs: dict[str, dict[str, Any]] | None = None,
+        static_inputs: dict[str, Any] | None = None,
+        max_workers: int = 5,
+        error_handling: Literal["raise", "skip", "log"] = "log",
+        output_file: str | Path | None = None,
+        return_dataframe: bool = True,
+        metadata_columns: list[str] | None = None,
+        judge_max_workers: int = 5,
+        judge_cache: JudgmentCache | None = None,
+        result_store: EvaluationResultStore | str | Path | None = None,
+    ) -> DataFrame | list[dict[str, Any]]:
+        """Evaluates several agents/model variants in one pass (delegated)."""
+        from flock.core.execution.evaluation_executor import (
+            EvaluationExecutor,
+        )
+
+        processor = EvaluationExecutor(self)
+        return await processor.evaluate_matrix_async(
+            dataset=dataset,
+            variants=variants,
+            input_mapping=input_mapping,
+            answer_mapping=answer_mapping,
+            metrics=metrics,
+            metric_configs=metric_configs,
+            static_inputs=static_inputs,
+            max_workers=max_workers,
+            error_handling=error_handling,
+            output_file=output_file,
+            return_dataframe=return_dataframe,
+            metadata_columns=metadata_columns,
+            judge_max_workers=judge_max_workers,
+            judge_cache=judge_cache,
+            result_store=result_store,
+        )
+
+    def evaluate_matrix(
+        self,
+        dataset: str
+        | Path
+        | list[dict[str, Any]]
+        | DataFrame
+        | Dataset
+        | pa.Table,
+        variants: dict[str, FlockAgent | str | dict[str, Any]]
+        | list[FlockAgent | str],
+        input_mapping: dict[str, str],
+        answer_mapping: dict[str, str],
+        metrics: list[
+            str
+            | Callable[[Any, Any], bool | float | dict[str, Any]]
+            | FlockAgent
+            | FlockEvaluator
+        ],
+        metric_configs: dict[str, dict[str, Any]] | None = None,
+        static_inputs: dict[str, Any] | None = None,
+        max_workers: int = 5,
+        error_handling: Literal["raise", "skip", "log"] = "log",
+        output_file: str | Path | None = None,
+        return_dataframe: bool = True,
+        metadata_columns: list[str] | None = None,
+        judge_max_workers: int = 5,
+        judge_cache: JudgmentCache | None = None,
+        result_store: EvaluationResultStore | str | Path | None = None,
+    ) -> DataFrame | list[dict[str, Any]]:
+        """Synchronous wrapper for evaluate_matrix_async."""
+        try:
+            loop = asyncio.get_running_loop()
+            if loop.is_closed():
+                raise RuntimeError("Event loop is closed")
+        except RuntimeError:  # No running loop
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+
+        coro = self.evaluate_matrix_async(
+            dataset=dataset,
+            variants=variants,
+            input_mapping=input_mapping,
+            answer_mapping=answer_mapping,
+            metrics=metrics,
+            metric_configs=metric_configs,
+            static_inputs=static_inputs,
+            max_workers=max_workers,
+            error_handling=error_handling,
+            output_file=output_file,
+            return_dataframe=return_dataframe,
+            metadata_columns=metadata_columns,
+            judge_max_workers=judge_max_workers,
+            judge_cache=judge_cache,
+            result_store=result_store,
+        )
+
+        if asyncio.get_event_loop() is loop and not loop.is_running():
+            return loop.run_until_complete(coro)
+        else:
+            future = asyncio.ensure_future(coro)
+            return loop.run_until_complete(future)
+
+    # --- Profiling ---
+    def get_latency_report(self, as_text: bool = False) -> dict[str, Any] | str:
+        """Per-agent, per-phase latency statistics of runs in this process.
+
+        Phases cover the agent lifecycle (initialize, pre_evaluate, evaluate,
+        evaluator.setup, rate_limit, llm, post_evaluate, terminate) and each
+        hop of the local workflow (hop.resolve_inputs, hop.execute,
+        hop.routing, hop.handoff). Disable recording with FLOCK_PROFILE=False.
+
+        Args:
+            as_text: Return a text table instead of a JSON-ready dict.
+        """
+        profiler = get_profiler()
+        return profiler.format_report() if as_text else profiler.report()
+
+    def reset_latency_report(self) -> None:
+        """Discards all recorded latency timings."""
+        get_profiler().reset()
+
     # --- API Server Starter ---
     def start_api(
         self,
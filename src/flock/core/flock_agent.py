@@ -4,6 +4,7 @@
 import asyncio
 import json
 import os
+import time
 from abc import ABC
 from collections.abc import Callable
 from datetime import datetime
@@ -19,7 +20,6 @@ if TYPE_CHECKING:
 
 from opentelemetry import trace
 from pydantic import BaseModel, Field
-from rich.console import Console
 
 # Core Flock components (ensure these are importable)
 from flock.core.context.context import FlockContext
@@ -27,6 +27,11 @@ from flock.core.flock_evaluator import FlockEvaluator
 from flock.core.flock_module import FlockModule
 from flock.core.flock_router import FlockRouter
 from flock.core.logging.logging import get_logger
+from flock.core.logging.span_attributes import (
+    payload_scope,
+    set_payload_attribute,
+)
+from flock.core.logging.telemetry_metrics import record_agent_duration
 
 # Mixins and Serialization components
 from flock.core.mixin.dspy_integration import DSPyIntegrationMixin
@@ -37,8 +42,9 @@ from flock.core.serialization.serialization_utils import (
     deserialize_component,
     serialize_item,
 )
-
-console = Console()
+from flock.core.util.cli_helper import get_console
+from flock.core.util.profiler import get_profiler
+from flock.core.util.prometheus_metrics import record_agent_run
 
 logger = get_logger("agent")
 tracer = trace.get_tracer(__name__)
@@ -149,7 +155,7 @@ class FlockAgent(BaseModel, Serializable, DSPyIntegrationMixin, ABC):
         logger.debug(f"Initializing agent '{self.name}'")
         with tracer.start_as_current_span("agent.initialize") as span:
             span.set_attribute("agent.name", self.name)
-            span.set_attribute("inputs", str(inputs))
+            set_payload_attribute(span, "inputs", inputs)
             logger.info(
                 f"agent.initialize",
                 agent=self.name,
@@ -172,8 +178,8 @@ class FlockAgent(BaseModel, Serializable, DSPyIntegrationMixin, ABC):
         logger.debug(f"Terminating agent '{self.name}'")
         with tracer.start_as_current_span("agent.terminate") as span:
             span.set_attribute("agent.name", self.name)
-            span.set_attribute("inputs", str(inputs))
-            span.set_attribute("result", str(result))
+            set_payload_attribute(span, "inputs", inputs)
+            set_payload_attribute(span, "result", result)
             logger.info(
                 f"agent.terminate",
                 agent=self.name,
@@ -185,7 +191,7 @@ class FlockAgent(BaseModel, Serializable, DSPyIntegrationMixin, ABC):
                 if self.write_to_file:
                     self._save_output(self.name, result)
                 if self.wait_for_input:
-                    console.input(prompt="Press Enter to continue...")
+                    get_console().input(prompt="Press Enter to continue...")
             except Exception as module_error:
                 logger.error(
                     "Error during terminate",
@@ -199,7 +205,7 @@ class FlockAgent(BaseModel, Serializable, DSPyIntegrationMixin, ABC):
         logger.error(f"Error occurred in agent '{self.name}': {error}")
         with tracer.start_as_current_span("agent.on_error") as span:
             span.set_attribute("agent.name", self.name)
-            span.set_attribute("inputs", str(inputs))
+            set_payload_attribute(span, "inputs", inputs)
             try:
                 for module in self.get_enabled_modules():
                     await module.on_error(self, error, inputs, self.context)
@@ -219,7 +225,7 @@ class FlockAgent(BaseModel, Serializable, DSPyIntegrationMixin, ABC):
             )
         with tracer.start_as_current_span("agent.evaluate") as span:
             span.set_attribute("agent.name", self.name)
-            span.set_attribute("inputs", str(inputs))
+            set_payload_attribute(span, "inputs", inputs)
             logger.info(
                 f"agent.evaluate",
                 agent=self.name,
@@ -228,11 +234,13 @@ class FlockAgent(BaseModel, Serializable, DSPyIntegrationMixin, ABC):
             logger.debug(f"Evaluating agent '{self.name}'")
             current_inputs = inputs
 
+            profiler = get_profiler()
             # Pre-evaluate hooks
-            for module in self.get_enabled_modules():
-                current_inputs = await module.pre_evaluate(
-                    self, current_inputs, self.context
-                )
+            with profiler.phase(self.name, "pre_evaluate"):
+                for module in self.get_enabled_modules():
+                    current_inputs = await module.pre_evaluate(
+                        self, current_inputs, self.context
+                    )
 
             # Actual evaluation
             try:
@@ -243,9 +251,10 @@ class FlockAgent(BaseModel, Serializable, DSPyIntegrationMixin, ABC):
                     # For now, assume evaluator handles tool resolution if necessary
                     registered_tools = self.tools
 
-                result = await self.evaluator.evaluate(
-                    self, current_inputs, registered_tools
-                )
+                with profiler.phase(self.name, "evaluate"):
+                    result = await self.evaluator.evaluate(
+                        self, current_inputs, registered_tools
+                    )
             except Exception as eval_error:
                 logger.error(
                     "Error during evaluate",
@@ -260,10 +269,11 @@ class FlockAgent(BaseModel, Serializable, DSPyIntegrationMixin, ABC):
 
             # Post-evaluate hooks
             current_result = result
-            for module in self.get_enabled_modules():
-                current_result = await module.post_evaluate(
-                    self, current_inputs, current_result, self.context
-                )
+            with profiler.phase(self.name, "post_evaluate"):
+                for module in self.get_enabled_modules():
+                    current_result = await module.post_evaluate(
+                        self, current_inputs, current_result, self.context
+                    )
 
             logger.debug(f"Evaluation completed for agent '{self.name}'")
             return current_result
@@ -298,17 +308,33 @@ class FlockAgent(BaseModel, Serializable, DSPyIntegrationMixin, ABC):
 
     async def run_async(self, inputs: dict[str, Any]) -> dict[str, Any]:
         """Asynchronous execution logic with lifecycle hooks."""
-        with tracer.start_as_current_span("agent.run") as span:
-            span.set_attribute("agent.name", self.name)
-            span.set_attribute("inputs", str(inputs))
+        # agent.name is set at start so per-agent head sampling can apply
+        with (
+            payload_scope(),
+            tracer.start_as_current_span(
+                "agent.run", attributes={"agent.name": self.name}
+            ) as span,
+        ):
+            set_payload_attribute(span, "inputs", inputs)
+            profiler = get_profiler()
+            start = time.perf_counter()
             try:
-                await self.initialize(inputs)
-                result = await self.evaluate(inputs)
-                await self.terminate(inputs, result)
-                span.set_attribute("result", str(result))
+                with profiler.phase(self.name, "run"):
+                    with profiler.phase(self.name, "initialize"):
+                        await self.initialize(inputs)
+                    result = await self.evaluate(inputs)
+                    with profiler.phase(self.name, "terminate"):
+                        await self.terminate(inputs, result)
+                duration = time.perf_counter() - start
+                record_agent_run(self.name, duration)
+                record_agent_duration(self.name, duration)
+                set_payload_attribute(span, "result", result)
                 logger.info("Agent run completed", agent=self.name)
                 return result
             except Exception as run_error:
+                duration = time.perf_counter() - start
+                record_agent_run(self.name, duration, run_error)
+                record_agent_duration(self.name, duration, run_error)
                 logger.error(
                     "Error running agent", agent=self.name, error=str(run_error)
                 )
@@ -326,7 +352,7 @@ class FlockAgent(BaseModel, Serializable, DSPyIntegrationMixin, ABC):
     async def run_temporal(self, inputs: dict[str, Any]) -> dict[str, Any]:
         with tracer.start_as_current_span("agent.run_temporal") as span:
             span.set_attribute("agent.name", self.name)
-            span.set_attribute("inputs", str(inputs))
+            set_payload_attribute(span, "inputs", inputs)
             try:
                 from temporalio.client import Client
 
@@ -347,7 +373,7 @@ class FlockAgent(BaseModel, Serializable, DSPyIntegrationMixin, ABC):
                     run_flock_agent_activity,
                     {"agent_data": agent_data, "inputs": inputs_data},
                 )
-                span.set_attribute("result", str(result))
+                set_payload_attribute(span, "result", result)
                 logger.info("Temporal run successful", agent=self.name)
                 return result
             except Exception as temporal_error:
@@ -22,9 +22,6 @@ from typing import (  # Add TYPE_CHECKING
 
 from pydantic import BaseModel
 
-from flock.core.mcp.mcp_settings import MCPServerConnection
-from flock.core.mcp.mcp_types import InitHookCallable
-
 if TYPE_CHECKING:
     from flock.core.flock_agent import (
         FlockAgent,  # Import only for type checking
@@ -32,6 +29,8 @@ if TYPE_CHECKING:
     from flock.core.flock_evaluator import FlockEvaluator
     from flock.core.flock_module import FlockModule
     from flock.core.flock_router import FlockRouter
+    from flock.core.mcp.mcp_settings import MCPServerConnection
+    from flock.core.mcp.mcp_types import InitHookCallable
 
     COMPONENT_BASE_TYPES = (FlockModule, FlockEvaluator, FlockRouter)
     IS_COMPONENT_CHECK_ENABLED = True
@@ -66,6 +65,11 @@ class FlockRegistry:
     _callables: dict[str, Callable]
     _types: dict[str, type]
     _components: dict[str, type]  # For Module, Evaluator, Router classes
+    # Identity-keyed reverse maps (all names, in registration order)
+    _callable_paths: dict[tuple[int, ...], list[str]]
+    _component_names: dict[int, list[str]]
+    _failed_imports: dict[str, str]  # Negative cache for get_callable
+    _failed_imports_state: tuple  # sys.path/sys.modules the cache is valid for
 
     def __new__(cls):
         if cls._instance is None:
@@ -82,6 +86,10 @@ class FlockRegistry:
         self._callables = {}
         self._types = {}
         self._components = {}
+        self._callable_paths = {}
+        self._component_names = {}
+        self._failed_imports = {}
+        self._failed_imports_state = ()
         # logger.debug("FlockRegistry initialized internal stores.")
         # Auto-register core Python types
         self._register_core_types()
@@ -132,6 +140,35 @@ class FlockRegistry:
                 f"Could not determine module/name for object: {obj}")
             return None
 
+    @staticmethod
+    def _identity_key(func: Callable) -> tuple[int, ...]:
+        """Identity key for a callable; bound methods key on (self, function).
+
+        Bound methods are created anew on every attribute access, so they are
+        keyed like their equality: by the bound object and the function.
+        Keys are only trusted after checking the forward map still holds an
+        equal object, so ids recycled after garbage collection (or entries
+        removed from the forward map directly) never resolve to a stale name.
+        """
+        bound_self = getattr(func, "__self__", None)
+        bound_func = getattr(func, "__func__", None)
+        if bound_self is not None and bound_func is not None:
+            return (id(bound_self), id(bound_func))
+        return (id(func),)
+
+    @staticmethod
+    def _first_registered(
+        names: list[str], registry: dict[str, Any], obj: Any
+    ) -> str | None:
+        """First of names still mapping to obj; drops names that do not."""
+        names[:] = [n for n in names if n in registry and registry[n] == obj]
+        return names[0] if names else None
+
+    @staticmethod
+    def _import_state() -> tuple:
+        """What a failed dynamic import depends on."""
+        return (tuple(sys.path), len(sys.modules))
+
     # --- Agent Registration ---
     def register_agent(self, agent: FlockAgent) -> None:
         """Registers a FlockAgent instance by its name."""
@@ -221,6 +258,13 @@ class FlockRegistry:
                     f"Callable '{path_str}' already registered with a different function. Overwriting."
                 )
             self._callables[path_str] = func
+            # A new registration may satisfy any cached failed import
+            self._failed_imports.clear()
+            names = self._callable_paths.setdefault(
+                self._identity_key(func), []
+            )
+            if path_str not in names:
+                names.append(path_str)
             logger.debug(
                 f"Registered callable: '{path_str}' ({func.__name__})")
             return path_str
@@ -234,6 +278,16 @@ class FlockRegistry:
         if path_str in self._callables:
             logger.debug(f"Found callable '{path_str}' in registry")
             return self._callables[path_str]
+        if (
+            self._failed_imports
+            and self._failed_imports_state != self._import_state()
+        ):
+            # sys.path changed or modules were imported since the failures
+            self._failed_imports.clear()
+        if path_str in self._failed_imports:
+            raise KeyError(
+                f"Callable '{path_str}' not found or failed to load: {self._failed_imports[path_str]}"
+            )
 
         logger.debug(
             f"Callable '{path_str}' not in registry, attempting dynamic import."
@@ -278,19 +332,26 @@ class FlockRegistry:
                 f"Failed to dynamically load/find callable '{path_str}': {e}",
                 exc_info=True,
             )
+            # Remember the failure until the import state changes
+            self._failed_imports[path_str] = str(e)
+            self._failed_imports_state = self._import_state()
             raise KeyError(
                 f"Callable '{path_str}' not found or failed to load: {e}"
             ) from e
 
     def get_callable_path_string(self, func: Callable) -> str | None:
         """Gets the path string for a callable, registering it if necessary."""
-        # First try to find by direct identity
-        for path_str, registered_func in self._callables.items():
-            if func == registered_func:
-                logger.debug(
-                    f"Found existing path string for callable: '{path_str}'"
-                )
-                return path_str
+        # First try to find by identity (first name still registered)
+        path_str = self._first_registered(
+            self._callable_paths.get(self._identity_key(func), []),
+            self._callables,
+            func,
+        )
+        if path_str is not None:
+            logger.debug(
+                f"Found existing path string for callable: '{path_str}'"
+            )
+            return path_str
 
         # If not found by identity, generate path, register, and return
         path_str = self.register_callable(func)
@@ -351,6 +412,9 @@ class FlockRegistry:
                     f"Component class '{type_name}' already registered. Overwriting."
                 )
             self._components[type_name] = component_class
+            names = self._component_names.setdefault(id(component_class), [])
+            if type_name not in names:
+                names.append(type_name)
             logger.debug(f"Registered component class: {type_name}")
             return type_name
         return None
@@ -371,9 +435,13 @@ class FlockRegistry:
 
     def get_component_type_name(self, component_class: type) -> str | None:
         """Gets the type name for a component class, registering it if necessary."""
-        for type_name, registered_class in self._components.items():
-            if component_class == registered_class:
-                return type_name
+        type_name = self._first_registered(
+            self._component_names.get(id(component_class), []),
+            self._components,
+            component_class,
+        )
+        if type_name is not None:
+            return type_name
         # If not found, register using class name and return
         return self.register_component(component_class)
 
@@ -3,24 +3,18 @@
 import pathlib
 import random
 import re
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from temporalio import workflow
+import toml  # install with: pip install toml
 
 from flock.core.logging.formatters.themes import OutputTheme
+from flock.core.util.cli_helper import get_console
 
-with workflow.unsafe.imports_passed_through():
-    from pygments.style import Style
-    from pygments.token import Token
-    from rich import box
-    from rich.console import Console, Group
+if TYPE_CHECKING:
     from rich.panel import Panel
-    from rich.syntax import PygmentsSyntaxTheme, Syntax
-    from rich.table import Table
+    from rich.syntax import PygmentsSyntaxTheme
     from rich.theme import Theme
 
-import toml  # install with: pip install toml
-
 
 def resolve_style_string(style_str: str, theme: dict) -> str:
     """Replace tokens in a style string of the form.
@@ -253,6 +247,10 @@ def create_rich_renderable(
       otherwise, renders each item recursively.
     - Other types: returns a string (adding extra newlines for multi-line strings).
     """
+    from rich import box
+    from rich.console import Group
+    from rich.table import Table
+
     if styles is None:
         styles = get_default_styles(theme)
 
@@ -366,8 +364,10 @@ def load_syntax_theme_from_file(filepath: str) -> dict:
     return syntax_theme
 
 
-def create_rich_syntax_theme(syntax_theme: dict) -> Theme:
+def create_rich_syntax_theme(syntax_theme: dict) -> "Theme":
     """Convert a syntax theme dict to a Rich-compatible Theme."""
+    from rich.theme import Theme
+
     return Theme(
         {
             "background": f"on {syntax_theme['background']}",
@@ -384,8 +384,11 @@ def create_rich_syntax_theme(syntax_theme: dict) -> Theme:
     )
 
 
-def create_pygments_syntax_theme(syntax_theme: dict) -> PygmentsSyntaxTheme:
+def create_pygments_syntax_theme(syntax_theme: dict) -> "PygmentsSyntaxTheme":
     """Convert a syntax theme dict to a Pygments-compatible Rich syntax theme."""
+    from pygments.style import Style
+    from pygments.token import Token
+    from rich.syntax import PygmentsSyntaxTheme
 
     class CustomSyntaxStyle(Style):
         """Dynamically generated Pygments style based on the loaded theme."""
@@ -428,8 +431,12 @@ class ThemedAgentResultFormatter:
         agent_name: str,
         theme,
         styles,
-    ) -> Panel:
+    ) -> "Panel":
         from devtools import pformat
+        from rich import box
+        from rich.panel import Panel
+        from rich.syntax import Syntax
+        from rich.table import Table
 
         """Format an agent's result as a Rich Panel containing a table."""
         box_style = (
@@ -536,7 +543,7 @@ class ThemedAgentResultFormatter:
             load_syntax_theme_from_file(theme)
         )
 
-        console = Console()
+        console = get_console()
         panel = self.format_result(
             result=result,
             agent_name=agent_name,
@@ -10,7 +10,12 @@ Key points:
   - Outside workflows, we use Loguru with rich formatting.
 """
 
+import atexit
+import queue
 import sys
+import threading
+from collections.abc import Callable
+from typing import Any
 
 from opentelemetry import trace
 
@@ -28,8 +33,6 @@ def in_workflow_context() -> bool:
     if successful. Otherwise, it returns False.
     """
     try:
-        workflow.logger.debug("Checking if in workflow context...")
-        # loguru_logger.debug("Checking if in workflow context...")
         # This call will succeed only if we're in a workflow context.
         return bool(hasattr(workflow.info(), "is_replaying"))
     except Exception:
@@ -46,6 +49,11 @@ def get_current_trace_id() -> str:
     return "no-trace"
 
 
+def _patch_trace_id(record) -> None:
+    # Runs only for records that pass the level check
+    record["extra"]["trace_id"] = get_current_trace_id()
+
+
 COLOR_MAP = {
     # Core & Orchestration
     "flock": "magenta",  # Color only
@@ -225,15 +233,125 @@ class PrintAndFlushSink:
         pass
 
 
+_ERROR_LEVEL_NO = 40
+
+
+class QueuedSink:
+    """A non-blocking Loguru sink.
+
+    write() only puts the formatted message on an in-process queue; a
+    daemon thread writes it to the wrapped sink, so logging never blocks
+    the event loop on terminal or file I/O. Pending messages are written
+    on flush() and at interpreter exit. When the queue is full, messages
+    below ERROR are dropped and the count is reported through the sink;
+    ERROR and above are written synchronously instead.
+    """
+
+    def __init__(self, sink: Any, max_queue_size: int = 10_000):
+        """Initialize the QueuedSink.
+
+        Args:
+            sink: The sink messages are written to (e.g. PrintAndFlushSink).
+            max_queue_size: Messages beyond this are dropped, not blocked on.
+        """
+        self._sink = sink
+        self._queue: queue.Queue[str | None] = queue.Queue(max_queue_size)
+        self.dropped = 0
+        self._reported_drops = 0
+        self._worker = threading.Thread(
+            target=self._run, name="flock-log-sink", daemon=True
+        )
+        self._worker.start()
+        atexit.register(self.stop)
+
+    def write(self, message: str) -> None:
+        """Queue a message for the background writer."""
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            record = getattr(message, "record", None)
+            if record is not None and record["level"].no >= _ERROR_LEVEL_NO:
+                # Never lose errors; write them synchronously instead
+                self._sink.write(message)
+            else:
+                self.dropped += 1
+
+    def _run(self) -> None:
+        while True:
+            message = self._queue.get()
+            try:
+                if message is None:
+                    return
+                self._sink.write(message)
+                self._report_drops()
+            finally:
+                self._queue.task_done()
+
+    def _report_drops(self) -> None:
+        dropped = self.dropped
+        if dropped > self._reported_drops:
+            self._sink.write(
+                f"Log queue was full: dropped {dropped - self._reported_drops} "
+                f"messages ({dropped} total).\n"
+            )
+            self._reported_drops = dropped
+
+    def flush(self) -> None:
+        """Wait until all queued messages have been written."""
+        if self._worker.is_alive():
+            self._queue.join()
+        self._report_drops()
+        self._sink.flush()
+
+    def stop(self) -> None:
+        """Write the remaining messages and stop the writer thread."""
+        if self._worker.is_alive():
+            self._queue.put(None)
+            self._worker.join(timeout=5)
+        self._report_drops()
+        self._sink.flush()
+
+
+# Loguru level numbers per FlockLogger method, for the level fast path
+_LEVEL_NOS = {
+    "debug": 10,
+    "info": 20,
+    "success": 25,
+    "warning": 30,
+    "error": _ERROR_LEVEL_NO,
+    "exception": _ERROR_LEVEL_NO,
+}
+_min_level_no = _LEVEL_NOS["debug"]
+_sink_id: int | None = None
+_sink: Any = None
+
+
+def configure_logging(level: str = "DEBUG", async_sink: bool = False) -> None:
+    """(Re)configure the console sink used outside of workflows.
+
+    Args:
+        level: Minimum level written; calls below it return immediately.
+        async_sink: Write through a QueuedSink so logging never blocks.
+    """
+    global _min_level_no, _sink_id, _sink
+    if _sink_id is not None:
+        loguru_logger.remove(_sink_id)
+    if isinstance(_sink, QueuedSink):
+        _sink.stop()
+    _sink = QueuedSink(PrintAndFlushSink()) if async_sink else PrintAndFlushSink()
+    _sink_id = loguru_logger.add(
+        _sink,
+        level=level.upper(),
+        colorize=True,
+        format=custom_format,
+    )
+    _min_level_no = loguru_logger.level(level.upper()).no
+
+
 # Configure Loguru for non-workflow (local/worker) contexts.
 # Note that in workflow code, we will use Temporal's workflow.logger instead.
 loguru_logger.remove()
-loguru_logger.add(
-    PrintAndFlushSink(),
-    level="DEBUG",
-    colorize=True,
-    format=custom_format,
-)
+configure_logging("DEBUG")
 # Optionally add a file handler, e.g.:
 # loguru_logger.add("logs/flock.log", rotation="100 MB", retention="30 days", level="DEBUG")
 
@@ -274,6 +392,9 @@ class FlockLogger:
     - If running in a workflow context, it uses Temporal's built-in logger.
       Additionally, if workflow.info().is_replaying is True, it suppresses debug/info/warning logs.
     - Otherwise, it uses Loguru.
+    - Calls below the configured level return before any formatting. The
+      message may be a zero-argument callable (e.g. `lambda: f"{big}"`) and,
+      like positional `{}` arguments, is only formatted when emitted.
     """
 
     def __init__(self, name: str, enable_logging: bool = False):
@@ -285,6 +406,14 @@ class FlockLogger:
         """
         self.name = name
         self.enable_logging = enable_logging
+        self._bound_logger = None
+
+    def is_enabled_for(self, level: str) -> bool:
+        """Return True if a call at this level (e.g. "debug") would be logged.
+
+        Use it to guard expensive work that only feeds a log message.
+        """
+        return self.enable_logging and _LEVEL_NOS[level] >= _min_level_no
 
     def _get_logger(self):
         if not self.enable_logging:
@@ -292,12 +421,29 @@ class FlockLogger:
         if in_workflow_context():
             # Use Temporal's workflow.logger inside a workflow context.
             return workflow.logger
-        # Bind our logger with category and trace_id
-        return loguru_logger.bind(
-            name=self.name,
-            category=self.name,  # Customize this per module (e.g., "flock", "agent", "context")
-            trace_id=get_current_trace_id(),
-        )
+        # Bound once; the trace_id is added only to emitted records
+        if self._bound_logger is None:
+            self._bound_logger = loguru_logger.bind(
+                name=self.name,
+                category=self.name,  # Customize this per module (e.g., "flock", "agent", "context")
+            ).patch(_patch_trace_id)
+        return self._bound_logger
+
+    def _log(
+        self,
+        level: str,
+        message: "str | Callable[[], str]",
+        args: tuple,
+        max_length: int,
+        kwargs: dict,
+    ) -> None:
+        # Fast path: nothing is formatted or bound for disabled levels
+        if not self.enable_logging or _LEVEL_NOS[level] < _min_level_no:
+            return
+        if callable(message):
+            message = message()
+        message = self._truncate_message(message, max_length)
+        getattr(self._get_logger(), level)(message, *args, **kwargs)
 
     def _truncate_message(self, message: str, max_length: int) -> str:
         """Truncate a message if it exceeds max_length and add truncation indicator."""
@@ -310,7 +456,7 @@ class FlockLogger:
 
     def debug(
         self,
-        message: str,
+        message: "str | Callable[[], str]",
         *args,
         flush: bool = False,
         max_length: int = MAX_LENGTH,
@@ -323,12 +469,11 @@ class FlockLogger:
             flush (bool, optional): Whether to flush the message. Defaults to False.
             max_length (int, optional): The maximum length of the message. Defaults to MAX_LENGTH.
         """
-        message = self._truncate_message(message, max_length)
-        self._get_logger().debug(message, *args, **kwargs)
+        self._log("debug", message, args, max_length, kwargs)
 
     def info(
         self,
-        message: str,
+        message: "str | Callable[[], str]",
         *args,
         flush: bool = False,
         max_length: int = MAX_LENGTH,
@@ -341,12 +486,11 @@ class FlockLogger:
             flush (bool, optional): Whether to flush the message. Defaults to False.
             max_length (int, optional): The maximum length of the message. Defaults to MAX_LENGTH.
         """
-        message = self._truncate_message(message, max_length)
-        self._get_logger().info(message, *args, **kwargs)
+        self._log("info", message, args, max_length, kwargs)
 
     def warning(
         self,
-        message: str,
+        message: "str | Callable[[], str]",
         *args,
         flush: bool = False,
         max_length: int = MAX_LENGTH,
@@ -359,12 +503,11 @@ class FlockLogger:
             flush (bool, optional): Whether to flush the message. Defaults to False.
             max_length (int, optional): The maximum length of the message. Defaults to MAX_LENGTH.
         """
-        message = self._truncate_message(message, max_length)
-        self._get_logger().warning(message, *args, **kwargs)
+        self._log("warning", message, args, max_length, kwargs)
 
     def error(
         self,
-        message: str,
+        message: "str | Callable[[], str]",
         *args,
         flush: bool = False,
         max_length: int = MAX_LENGTH,
@@ -377,12 +520,11 @@ class FlockLogger:
             flush (bool, optional): Whether to flush the message. Defaults to False.
             max_length (int, optional): The maximum length of the message. Defaults to MAX_LENGTH.
         """
-        message = self._truncate_message(message, max_length)
-        self._get_logger().error(message, *args, **kwargs)
+        self._log("error", message, args, max_length, kwargs)
 
     def exception(
         self,
-        message: str,
+        message: "str | Callable[[], str]",
         *args,
         flush: bool = False,
         max_length: int = MAX_LENGTH,
@@ -395,12 +537,11 @@ class FlockLogger:
             flush (bool, optional): Whether to flush the message. Defaults to False.
             max_length (int, optional): The maximum length of the message. Defaults to MAX_LENGTH.
         """
-        message = self._truncate_message(message, max_length)
-        self._get_logger().exception(message, *args, **kwargs)
+        self._log("exception", message, args, max_length, kwargs)
 
     def success(
         self,
-        message: str,
+        message: "str | Callable[[], str]",
         *args,
         flush: bool = False,
         max_length: int = MAX_LENGTH,
@@ -413,8 +554,7 @@ class FlockLogger:
             flush (bool, optional): Whether to flush the message. Defaults to False.
             max_length (int, optional): The maximum length of the message. Defaults to MAX_LENGTH.
         """
-        message = self._truncate_message(message, max_length)
-        self._get_logger().success(message, *args, **kwargs)
+        self._log("success", message, args, max_length, kwargs)
 
 
 _LOGGER_CACHE: dict[str, FlockLogger] = {}
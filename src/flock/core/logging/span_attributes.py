@@ -0,0 +1,185 @@
+"""Bounded, policy-driven capture of payload span attributes.
+
+Agent inputs and results can be megabytes in size. Instead of calling
+`span.set_attribute("inputs", str(inputs))` on every hop, call sites use
+`set_payload_attribute`, which by default records only a short fingerprint
+(type, size and a hash of a bounded representation, computed once per payload
+within a `payload_scope`) and captures the payload itself only when enabled,
+truncated to `max_bytes` and optionally sampled.
+"""
+
+import hashlib
+import random
+import reprlib
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from opentelemetry.trace import Span
+from pydantic import BaseModel, Field
+
+
+class SpanAttributePolicy(BaseModel):
+    """How payloads (inputs, results, arguments) are attached to spans."""
+
+    capture_payloads: bool = Field(
+        default=False,
+        description="Record payloads themselves, not just fingerprints.",
+    )
+    max_bytes: int = Field(
+        default=1024,
+        gt=0,
+        description="Maximum size of a captured payload attribute.",
+    )
+    sample_rate: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of spans whose payloads are captured.",
+    )
+    fingerprints: bool = Field(
+        default=True,
+        description="Record type, size and a hash for every payload.",
+    )
+
+
+_policy = SpanAttributePolicy()
+# (id, max_bytes) -> (payload, fingerprint) for the active payload_scope
+_fingerprint_cache: ContextVar[
+    dict[tuple[int, int], tuple[Any, str]] | None
+] = ContextVar("flock_payload_fingerprints", default=None)
+
+
+def get_span_attribute_policy() -> SpanAttributePolicy:
+    """Returns the process-wide span attribute policy."""
+    return _policy
+
+
+def configure_span_attributes(**options: Any) -> SpanAttributePolicy:
+    """Updates the process-wide policy, e.g. `capture_payloads=True`."""
+    global _policy
+    _policy = SpanAttributePolicy(**{**_policy.model_dump(), **options})
+    return _policy
+
+
+class _PayloadRepr(reprlib.Repr):
+    """reprlib.Repr that also abbreviates container subclasses and models.
+
+    reprlib dispatches on the exact type name, so a Box or a pydantic model
+    would otherwise be formatted in full by repr() before being truncated.
+    """
+
+    def repr1(self, x: Any, level: int) -> str:
+        if isinstance(x, BaseModel):
+            return f"{type(x).__name__}({self.repr_dict(dict(x), level)})"
+        for base in (dict, list, tuple, set, frozenset, str):
+            if isinstance(x, base) and type(x) is not base:
+                return getattr(self, f"repr_{base.__name__}")(x, level)
+        return super().repr1(x, level)
+
+
+def _bounded_repr(value: Any, max_bytes: int) -> str:
+    """repr-like text of value whose construction is bounded by max_bytes.
+
+    Strings, containers and pydantic models are abbreviated while being
+    formatted, so a large payload is never stringified in full.
+    """
+    if isinstance(value, str):
+        text = value if len(value) <= max_bytes else value[:max_bytes]
+    else:
+        limiter = _PayloadRepr()
+        limiter.maxlevel = 4
+        limiter.maxstring = limiter.maxother = max(16, max_bytes // 4)
+        limiter.maxdict = limiter.maxlist = limiter.maxtuple = 32
+        limiter.maxset = limiter.maxfrozenset = 32
+        text = limiter.repr(value)
+    encoded = text.encode("utf-8", errors="replace")
+    if len(encoded) <= max_bytes:
+        return text
+    return encoded[:max_bytes].decode("utf-8", errors="ignore") + "..."
+
+
+def payload_fingerprint(value: Any, max_bytes: int = 1024) -> str:
+    """Short stable hash identifying a payload without storing it.
+
+    Only the bounded representation (at most max_bytes) is hashed, together
+    with the payload's type and size, so the cost does not grow with the
+    payload. Payloads that differ only beyond that bound hash the same.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    size = len(value) if hasattr(value, "__len__") else -1
+    digest.update(f"{type(value).__name__}:{size}:".encode())
+    digest.update(
+        _bounded_repr(value, max_bytes).encode("utf-8", errors="replace")
+    )
+    return digest.hexdigest()
+
+
+@contextmanager
+def payload_scope() -> Iterator[None]:
+    """Fingerprints each payload only once while active (e.g. for a hop).
+
+    Payloads are recognized by identity and assumed not to change within
+    the scope. Nested scopes share the outermost one.
+    """
+    if _fingerprint_cache.get() is not None:
+        yield
+        return
+    token = _fingerprint_cache.set({})
+    try:
+        yield
+    finally:
+        _fingerprint_cache.reset(token)
+
+
+def _cached_fingerprint(value: Any, max_bytes: int) -> str:
+    cache = _fingerprint_cache.get()
+    if cache is None:
+        return payload_fingerprint(value, max_bytes)
+    # Keep a reference to value so its id cannot be reused in the scope
+    cached = cache.get((id(value), max_bytes))
+    if cached is not None and cached[0] is value:
+        return cached[1]
+    fingerprint = payload_fingerprint(value, max_bytes)
+    cache[(id(value), max_bytes)] = (value, fingerprint)
+    return fingerprint
+
+
+def payload_attributes(
+    key: str, value: Any, policy: SpanAttributePolicy | None = None
+) -> dict[str, Any]:
+    """Span/event attributes describing a payload under the policy.
+
+    Contains `<key>.type`, `<key>.size` and `<key>.fingerprint` when
+    fingerprints are enabled, and `<key>` (bounded) when payload capture is
+    enabled and this call is sampled.
+    """
+    policy = policy or _policy
+    attributes: dict[str, Any] = {}
+    if policy.fingerprints:
+        attributes[f"{key}.type"] = type(value).__name__
+        if hasattr(value, "__len__"):
+            attributes[f"{key}.size"] = len(value)
+        attributes[f"{key}.fingerprint"] = _cached_fingerprint(
+            value, policy.max_bytes
+        )
+    if policy.capture_payloads and (
+        policy.sample_rate >= 1.0 or random.random() < policy.sample_rate
+    ):
+        attributes[key] = _bounded_repr(value, policy.max_bytes)
+    return attributes
+
+
+def set_payload_attribute(
+    span: Span,
+    key: str,
+    value: Any,
+    policy: SpanAttributePolicy | None = None,
+) -> None:
+    """Attaches a payload to span according to the attribute policy.
+
+    Does nothing (and does no formatting work) for non-recording spans.
+    """
+    if span.is_recording():
+        span.set_attributes(payload_attributes(key, value, policy))
@@ -0,0 +1,163 @@
+"""Bounded-queue span processor exporting batches on a background thread."""
+
+import collections
+import threading
+from collections.abc import Sequence
+from typing import Literal
+
+from opentelemetry.sdk.trace import ReadableSpan, SpanProcessor
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+
+from flock.core.logging.logging import get_logger
+
+logger = get_logger("telemetry")
+
+DropPolicy = Literal["drop_newest", "drop_oldest"]
+
+
+class QueuedBatchSpanProcessor(SpanProcessor):
+    """Queues ended spans and exports them in batches off the hot path.
+
+    Ending a span only appends it to a bounded in-memory queue. A daemon
+    thread exports the queue every `schedule_delay_millis` (or as soon as a
+    full batch is waiting), so exporters such as SQLite commit once per batch
+    instead of once per span. When the queue is full, spans are dropped
+    according to `drop_policy` and counted; drops are reported as warnings.
+    """
+
+    def __init__(
+        self,
+        exporter: SpanExporter,
+        max_queue_size: int = 2048,
+        schedule_delay_millis: float = 5000,
+        max_export_batch_size: int = 512,
+        drop_policy: DropPolicy = "drop_newest",
+    ):
+        """Starts the background export thread.
+
+        Args:
+            exporter: The exporter that receives batches of spans.
+            max_queue_size: Maximum number of spans waiting for export.
+            schedule_delay_millis: Interval between exports.
+            max_export_batch_size: Maximum number of spans per export call.
+            drop_policy: "drop_newest" discards spans ending while the queue
+                is full; "drop_oldest" evicts the oldest queued span instead.
+        """
+        if max_queue_size <= 0 or max_export_batch_size <= 0:
+            raise ValueError("Queue and batch sizes must be positive.")
+        if drop_policy not in ("drop_newest", "drop_oldest"):
+            raise ValueError(f"Unknown drop policy: {drop_policy}")
+        self.exporter = exporter
+        self.max_queue_size = max_queue_size
+        self.schedule_delay = schedule_delay_millis / 1000
+        self.max_export_batch_size = min(max_export_batch_size, max_queue_size)
+        self.drop_policy = drop_policy
+
+        self.exported_spans = 0
+        self.dropped_spans = 0
+        self.failed_spans = 0
+        self._reported_drops = 0
+
+        self._queue: collections.deque[ReadableSpan] = collections.deque()
+        self._condition = threading.Condition()
+        self._export_lock = threading.Lock()
+        self._shutdown = False
+        self._worker = threading.Thread(
+            target=self._run,
+            name=f"flock-span-export-{type(exporter).__name__}",
+            daemon=True,
+        )
+        self._worker.start()
+
+    def on_start(self, span, parent_context=None) -> None:
+        """Nothing to do when a span starts."""
+
+    def on_end(self, span: ReadableSpan) -> None:
+        """Queues the ended span; never blocks on export."""
+        if self._shutdown or not span.context.trace_flags.sampled:
+            return
+        with self._condition:
+            if len(self._queue) >= self.max_queue_size:
+                self.dropped_spans += 1
+                if self.drop_policy == "drop_newest":
+                    return
+                self._queue.popleft()
+            self._queue.append(span)
+            if len(self._queue) >= self.max_export_batch_size:
+                self._condition.notify()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Counts of queued, exported, dropped and failed spans."""
+        return {
+            "queued": len(self._queue),
+            "exported": self.exported_spans,
+            "dropped": self.dropped_spans,
+            "failed": self.failed_spans,
+        }
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._shutdown and (
+                    len(self._queue) < self.max_export_batch_size
+                ):
+                    self._condition.wait(self.schedule_delay)
+                if self._shutdown:
+                    return
+            self._export_pending()
+
+    def _export_pending(self) -> None:
+        """Exports everything queued so far, batch by batch."""
+        with self._export_lock:
+            while True:
+                with self._condition:
+                    batch = [
+                        self._queue.popleft()
+                        for _ in range(
+                            min(len(self._queue), self.max_export_batch_size)
+                        )
+                    ]
+                if not batch:
+                    break
+                self._export_batch(batch)
+        self._report_drops()
+
+    def _export_batch(self, batch: Sequence[ReadableSpan]) -> None:
+        try:
+            result = self.exporter.export(batch)
+        except Exception as e:
+            logger.warning(
+                f"Span export via {type(self.exporter).__name__} failed: {e}"
+            )
+            result = SpanExportResult.FAILURE
+        if result is SpanExportResult.FAILURE:
+            self.failed_spans += len(batch)
+        else:
+            self.exported_spans += len(batch)
+
+    def _report_drops(self) -> None:
+        dropped = self.dropped_spans
+        if dropped > self._reported_drops:
+            logger.warning(
+                f"Telemetry queue for {type(self.exporter).__name__} was full: "
+                f"dropped {dropped - self._reported_drops} spans "
+                f"({dropped} total, policy {self.drop_policy})."
+            )
+            self._reported_drops = dropped
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Exports all queued spans synchronously and flushes the exporter."""
+        self._export_pending()
+        return self.exporter.force_flush(timeout_millis)
+
+    def shutdown(self) -> None:
+        """Stops the worker, exports the rest and shuts the exporter down."""
+        if self._shutdown:
+            return
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify_all()
+        self._worker.join(timeout=self.schedule_delay + 5)
+        self._export_pending()
+        self.exporter.shutdown()
@@ -0,0 +1,201 @@
+"""Head and tail sampling for Flock traces."""
+
+import collections
+import threading
+from collections.abc import Sequence
+
+from opentelemetry.context import Context
+from opentelemetry.sdk.trace import ReadableSpan, SpanProcessor
+from opentelemetry.sdk.trace.sampling import (
+    Decision,
+    Sampler,
+    SamplingResult,
+    TraceIdRatioBased,
+)
+from opentelemetry.trace import StatusCode, get_current_span
+
+_TRACE_ID_LIMIT = 1 << 64
+
+
+def _in_ratio(trace_id: int, ratio: float) -> bool:
+    # Same rule as TraceIdRatioBased, so decisions are stable per trace
+    return (trace_id & (_TRACE_ID_LIMIT - 1)) < round(ratio * _TRACE_ID_LIMIT)
+
+
+class AgentRatioSampler(Sampler):
+    """Head sampler with a default ratio and per-agent overrides.
+
+    Root spans are sampled with `ratio` (the ratio of this service). Spans
+    started with an `agent.name` attribute that has an entry in
+    `agent_ratios` are sampled with that ratio instead, which drops (or
+    keeps) the agent's whole subtree. All other spans follow their parent.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 1.0,
+        agent_ratios: dict[str, float] | None = None,
+    ):
+        """Creates the sampler.
+
+        Args:
+            ratio: Fraction of traces started by this service to record.
+            agent_ratios: Fraction of runs to record per agent name.
+        """
+        self._root = TraceIdRatioBased(ratio)
+        self._agents = {
+            name: TraceIdRatioBased(agent_ratio)
+            for name, agent_ratio in (agent_ratios or {}).items()
+        }
+
+    def should_sample(
+        self,
+        parent_context: Context | None,
+        trace_id: int,
+        name: str,
+        kind=None,
+        attributes=None,
+        links=None,
+        trace_state=None,
+    ) -> SamplingResult:
+        """Decides whether a span is recorded and exported."""
+        parent = get_current_span(parent_context).get_span_context()
+        if parent.is_valid and not parent.trace_flags.sampled:
+            return SamplingResult(Decision.DROP, None, parent.trace_state)
+
+        agent_sampler = self._agents.get((attributes or {}).get("agent.name"))
+        if agent_sampler is not None:
+            sampler = agent_sampler
+        elif parent.is_valid:
+            return SamplingResult(
+                Decision.RECORD_AND_SAMPLE, attributes, parent.trace_state
+            )
+        else:
+            sampler = self._root
+        return sampler.should_sample(
+            parent_context, trace_id, name, kind, attributes, links
+        )
+
+    def get_description(self) -> str:
+        """Description of the sampler."""
+        agents = ", ".join(
+            f"{name}={sampler.rate}" for name, sampler in self._agents.items()
+        )
+        return f"AgentRatioSampler{{{self._root.rate}, agents=[{agents}]}}"
+
+
+class TailSamplingSpanProcessor(SpanProcessor):
+    """Buffers each trace until it completes, then keeps or drops it.
+
+    Traces containing an error (ERROR status or a recorded exception) and
+    traces whose local root ran for at least `latency_threshold_ms` are
+    always kept; of the remaining healthy traces only `keep_ratio` are
+    forwarded to the wrapped processors (usually the batch exporters).
+    """
+
+    def __init__(
+        self,
+        processors: Sequence[SpanProcessor],
+        keep_ratio: float = 0.1,
+        latency_threshold_ms: float | None = 10_000,
+        max_pending_traces: int = 1000,
+    ):
+        """Creates the processor.
+
+        Args:
+            processors: Processors receiving the spans of kept traces.
+            keep_ratio: Fraction of healthy, fast traces to keep.
+            latency_threshold_ms: Always keep traces at least this slow.
+            max_pending_traces: Incomplete traces held in memory; beyond
+                this the oldest trace is decided early.
+        """
+        if not 0.0 <= keep_ratio <= 1.0:
+            raise ValueError("keep_ratio must be between 0 and 1.")
+        self.processors = list(processors)
+        self.keep_ratio = keep_ratio
+        self.latency_threshold_ms = latency_threshold_ms
+        self.max_pending_traces = max_pending_traces
+        self.kept_traces = 0
+        self.dropped_traces = 0
+        self._pending: collections.OrderedDict[int, list[ReadableSpan]] = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def on_start(self, span, parent_context=None) -> None:
+        """Forwards span starts to the wrapped processors."""
+        for processor in self.processors:
+            processor.on_start(span, parent_context=parent_context)
+
+    def on_end(self, span: ReadableSpan) -> None:
+        """Buffers the span; decides the trace once its local root ends."""
+        if not span.context.trace_flags.sampled:
+            return
+        trace_id = span.context.trace_id
+        is_root = span.parent is None or span.parent.is_remote
+        with self._lock:
+            self._pending.setdefault(trace_id, []).append(span)
+            if is_root:
+                decided = [(self._pending.pop(trace_id), span)]
+            else:
+                decided = []
+                while len(self._pending) > self.max_pending_traces:
+                    decided.append((self._pending.popitem(last=False)[1], None))
+        for spans, root in decided:
+            self._decide(spans, root)
+
+    def _decide(
+        self, spans: list[ReadableSpan], root: ReadableSpan | None
+    ) -> None:
+        if self.should_keep(spans, root):
+            self.kept_traces += 1
+            for span in spans:
+                for processor in self.processors:
+                    processor.on_end(span)
+        else:
+            self.dropped_traces += 1
+
+    def should_keep(
+        self, spans: Sequence[ReadableSpan], root: ReadableSpan | None
+    ) -> bool:
+        """The tail-sampling rule for one (possibly incomplete) trace."""
+        for span in spans:
+            if span.status.status_code is StatusCode.ERROR or any(
+                event.name == "exception" for event in span.events
+            ):
+                return True
+        if (
+            root is not None
+            and self.latency_threshold_ms is not None
+            and root.end_time is not None
+            and (root.end_time - root.start_time) / 1e6
+            >= self.latency_threshold_ms
+        ):
+            return True
+        return _in_ratio(spans[0].context.trace_id, self.keep_ratio)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Counts of kept, dropped and still pending traces."""
+        return {
+            "kept": self.kept_traces,
+            "dropped": self.dropped_traces,
+            "pending": len(self._pending),
+        }
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Flushes the wrapped processors (pending traces stay buffered)."""
+        return all(
+            processor.force_flush(timeout_millis)
+            for processor in self.processors
+        )
+
+    def shutdown(self) -> None:
+        """Decides all pending traces and shuts the processors down."""
+        with self._lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+        for spans in pending:
+            self._decide(spans, None)
+        for processor in self.processors:
+            processor.shutdown()
@@ -1,16 +1,33 @@
-"""This module sets up OpenTelemetry tracing for a service."""
+"""This module sets up OpenTelemetry tracing and metrics for a service.
+
+Setup is lazy: importing Flock only registers a lightweight global tracer
+provider. Exporters (and their files/databases) are created on the first
+span, or when `setup_tracing()` is called explicitly, and only once per
+process. The meter provider with the local metric exporters is installed at
+the same time.
+"""
 
 import sys
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
 
-from opentelemetry import trace
+from opentelemetry import metrics, trace
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import SimpleSpanProcessor
 from temporalio import workflow
 
 from flock.core.logging.span_middleware.baggage_span_processor import (
     BaggageAttributeSpanProcessor,
 )
+from flock.core.logging.span_middleware.batch_span_processor import (
+    QueuedBatchSpanProcessor,
+)
+from flock.core.logging.span_middleware.sampling import (
+    AgentRatioSampler,
+    TailSamplingSpanProcessor,
+)
 
 with workflow.unsafe.imports_passed_through():
     from flock.core.logging.telemetry_exporter.file_exporter import (
@@ -20,6 +37,62 @@ with workflow.unsafe.imports_passed_through():
         SqliteTelemetryExporter,
     )
 
+if TYPE_CHECKING:
+    from opentelemetry.sdk.metrics import MeterProvider
+
+
+class _LazyTracer(trace.Tracer):
+    """Tracer that resolves its real tracer when the first span starts."""
+
+    def __init__(self, config: "TelemetryConfig", *args, **kwargs):
+        self._config = config
+        self._args = args
+        self._kwargs = kwargs
+        self._real_tracer: trace.Tracer | None = None
+
+    @property
+    def _tracer(self) -> trace.Tracer:
+        if self._real_tracer is not None:
+            return self._real_tracer
+        provider = self._config.get_tracer_provider()
+        tracer = provider.get_tracer(*self._args, **self._kwargs)
+        # Telemetry may still be enabled later; keep only the real tracer
+        if self._config.is_initialized:
+            self._real_tracer = tracer
+        return tracer
+
+    def start_span(self, *args, **kwargs) -> trace.Span:
+        """Starts a span, setting up telemetry first if needed."""
+        return self._tracer.start_span(*args, **kwargs)
+
+    @contextmanager
+    def start_as_current_span(self, *args, **kwargs) -> Iterator[trace.Span]:
+        """Starts a current span, setting up telemetry first if needed."""
+        with self._tracer.start_as_current_span(*args, **kwargs) as span:
+            yield span
+
+
+class _LazyTracerProvider(trace.TracerProvider):
+    """Global tracer provider that defers telemetry setup to the first span."""
+
+    def __init__(self, config: "TelemetryConfig"):
+        self._config = config
+
+    def get_tracer(self, *args, **kwargs) -> trace.Tracer:
+        """Returns a tracer that sets up telemetry on its first span.
+
+        Once telemetry is set up, tracers come from the SDK provider.
+        """
+        if self._config.is_initialized:
+            return self._config.provider.get_tracer(*args, **kwargs)
+        return _LazyTracer(self._config, *args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        # SDK provider API (add_span_processor, force_flush, shutdown, ...)
+        # for code that uses trace.get_tracer_provider() directly
+        provider = self._config.get_tracer_provider()
+        return getattr(provider, name)
+
 
 class TelemetryConfig:
     """This configuration class sets up OpenTelemetry tracing.
@@ -43,13 +116,37 @@ class TelemetryConfig:
         enable_file: bool = True,
         enable_sql: bool = True,
         batch_processor_options: dict | None = None,
+        enabled: bool = True,
+        sqlite_retention_days: float | None = None,
+        sample_ratio: float = 1.0,
+        agent_sample_ratios: dict[str, float] | None = None,
+        tail_sampling_options: dict | None = None,
+        file_exporter_options: dict | None = None,
+        enable_metrics: bool = True,
+        metrics_file_name: str | None = None,
+        metric_export_interval_millis: float = 60_000,
     ):
         """:param service_name: Name of your service.
 
         :param jaeger_endpoint: The Jaeger collector gRPC endpoint (e.g., "localhost:14250").
         :param file_export_path: If provided, spans will be written to this file.
         :param sqlite_db_path: If provided, spans will be stored in this SQLite DB.
-        :param batch_processor_options: Dict of options for BatchSpanProcessor (e.g., {"max_export_batch_size": 10}).
+        :param batch_processor_options: Dict of options for QueuedBatchSpanProcessor (max_queue_size, schedule_delay_millis, max_export_batch_size, drop_policy).
+        :param enabled: If False, spans are no-ops and no exporter is created.
+        :param sqlite_retention_days: Delete stored spans older than this many days.
+        :param sample_ratio: Head sampling ratio for traces of this service.
+        :param agent_sample_ratios: Head sampling ratio per agent name.
+        :param tail_sampling_options: If provided, options for
+            TailSamplingSpanProcessor (keep_ratio, latency_threshold_ms,
+            max_pending_traces); errors and slow traces are always kept.
+        :param file_exporter_options: Dict of options for FileSpanExporter
+            (max_bytes, rotate_interval_seconds, compression, max_segments).
+        :param enable_metrics: Export the Flock metric instruments (to the
+            SQLite database and metrics_file_name) alongside the spans.
+        :param metrics_file_name: If provided, metric data points are
+            appended to this JSONL file.
+        :param metric_export_interval_millis: How often metrics are
+            aggregated and exported.
         """
         self.service_name = service_name
         self.jaeger_endpoint = jaeger_endpoint
@@ -61,14 +158,72 @@ class TelemetryConfig:
         self.enable_jaeger = enable_jaeger
         self.enable_file = enable_file
         self.enable_sql = enable_sql
+        self.enabled = enabled
+        self.sqlite_retention_days = sqlite_retention_days
+        self.sample_ratio = sample_ratio
+        self.agent_sample_ratios = agent_sample_ratios or {}
+        self.tail_sampling_options = tail_sampling_options
+        self.tail_sampler: TailSamplingSpanProcessor | None = None
+        self.file_exporter_options = file_exporter_options or {}
+        self.enable_metrics = enable_metrics
+        self.metrics_file_name = metrics_file_name
+        self.metric_export_interval_millis = metric_export_interval_millis
+        self.meter_provider: MeterProvider | None = None
         self.global_tracer = None
+        self.provider: TracerProvider | None = None
+        self.span_processors: list[QueuedBatchSpanProcessor] = []
+        self._setup_lock = threading.Lock()
+        self._previous_excepthook = None
+
+    @property
+    def is_initialized(self) -> bool:
+        """True once the exporters have been set up."""
+        return self.provider is not None
+
+    def install(self) -> None:
+        """Registers the lazy global tracer provider.
+
+        Nothing is exported (and no file or database is opened) until the
+        first span starts; after setup the registered provider forwards to
+        the SDK provider. If the application already registered its own
+        tracer provider, that provider is kept.
+        """
+        trace.set_tracer_provider(_LazyTracerProvider(self))
+
+    def configure(self, enabled: bool) -> None:
+        """Enables or disables telemetry for this process.
+
+        Has no effect on exporters that were already set up.
+        """
+        self.enabled = enabled
+
+    def get_tracer_provider(self) -> trace.TracerProvider:
+        """Returns the SDK provider, setting it up on first use."""
+        if not self.enabled:
+            return trace.NoOpTracerProvider()
+        self.setup_tracing()
+        return self.provider
 
     def setup_tracing(self):
-        """Set up OpenTelemetry tracing with the specified exporters."""
+        """Set up OpenTelemetry tracing with the specified exporters.
+
+        Idempotent: only the first call creates the provider and exporters.
+        """
+        if self.provider is not None:
+            return
+        with self._setup_lock:
+            if self.provider is None:
+                self._setup_tracing()
+
+    def _setup_tracing(self):
         # Create a Resource with the service name.
         resource = Resource(attributes={"service.name": self.service_name})
-        provider = TracerProvider(resource=resource)
-        trace.set_tracer_provider(provider)
+        provider = TracerProvider(
+            resource=resource,
+            sampler=AgentRatioSampler(
+                self.sample_ratio, self.agent_sample_ratios
+            ),
+        )
 
         # List to collect our span processors.
         span_processors = []
@@ -95,31 +250,111 @@ class TelemetryConfig:
                     "Invalid JAEGER_TRANSPORT specified. Use 'grpc' or 'http'."
                 )
 
-            span_processors.append(SimpleSpanProcessor(jaeger_exporter))
+            span_processors.append(self._batch_processor(jaeger_exporter))
 
         # If a file path is provided, add the custom file exporter.
         if self.file_export_name and self.enable_file:
             file_exporter = FileSpanExporter(
-                self.local_logging_dir, self.file_export_name
+                self.local_logging_dir,
+                self.file_export_name,
+                **self.file_exporter_options,
             )
-            span_processors.append(SimpleSpanProcessor(file_exporter))
+            span_processors.append(self._batch_processor(file_exporter))
 
         # If a SQLite database path is provided, ensure the DB exists and add the SQLite exporter.
         if self.sqlite_db_name and self.enable_sql:
             sqlite_exporter = SqliteTelemetryExporter(
-                self.local_logging_dir, self.sqlite_db_name
+                self.local_logging_dir,
+                self.sqlite_db_name,
+                retention_days=self.sqlite_retention_days,
             )
-            span_processors.append(SimpleSpanProcessor(sqlite_exporter))
+            span_processors.append(self._batch_processor(sqlite_exporter))
 
-        # Register all span processors with the provider.
-        for processor in span_processors:
-            provider.add_span_processor(processor)
+        # Register all span processors with the provider, behind the tail
+        # sampler if enabled so dropped traces never reach the exporters.
+        if self.tail_sampling_options is not None:
+            self.tail_sampler = TailSamplingSpanProcessor(
+                span_processors, **self.tail_sampling_options
+            )
+            provider.add_span_processor(self.tail_sampler)
+        else:
+            for processor in span_processors:
+                provider.add_span_processor(processor)
 
         provider.add_span_processor(
             BaggageAttributeSpanProcessor(baggage_keys=["session_id", "run_id"])
         )
-        # self.global_tracer = trace.get_tracer("flock")
+        self.span_processors = span_processors
+        if self.enable_metrics:
+            self._setup_metrics(resource)
+        self.global_tracer = provider.get_tracer("flock")
+        self._previous_excepthook = sys.excepthook
         sys.excepthook = self.log_exception_to_otel
+        self.provider = provider
+
+    def _setup_metrics(self, resource: Resource) -> None:
+        # The metrics SDK is only imported when metrics are set up
+        from opentelemetry.sdk.metrics import MeterProvider
+        from opentelemetry.sdk.metrics.export import (
+            PeriodicExportingMetricReader,
+        )
+
+        with workflow.unsafe.imports_passed_through():
+            from flock.core.logging.telemetry_exporter.metric_exporter import (
+                FileMetricExporter,
+                SqliteMetricExporter,
+            )
+
+        exporters = []
+        if self.metrics_file_name and self.enable_file:
+            exporters.append(
+                FileMetricExporter(
+                    self.local_logging_dir, self.metrics_file_name
+                )
+            )
+        if self.sqlite_db_name and self.enable_sql:
+            exporters.append(
+                SqliteMetricExporter(
+                    self.local_logging_dir,
+                    self.sqlite_db_name,
+                    retention_days=self.sqlite_retention_days,
+                )
+            )
+        if not exporters:
+            return
+        # Aggregation happens in memory; exporters only see one row per
+        # instrument and attribute set per interval
+        self.meter_provider = MeterProvider(
+            resource=resource,
+            metric_readers=[
+                PeriodicExportingMetricReader(
+                    exporter,
+                    export_interval_millis=self.metric_export_interval_millis,
+                )
+                for exporter in exporters
+            ],
+        )
+        metrics.set_meter_provider(self.meter_provider)
+
+    def _batch_processor(self, exporter) -> QueuedBatchSpanProcessor:
+        # Exports run on a background thread, off the span hot path
+        return QueuedBatchSpanProcessor(
+            exporter, **self.batch_processor_options
+        )
+
+    def get_export_stats(self) -> dict[str, dict[str, int]]:
+        """Queued/exported/dropped/failed span counts per exporter."""
+        return {
+            type(processor.exporter).__name__: processor.stats
+            for processor in self.span_processors
+        }
+
+    def force_flush(self) -> None:
+        """Exports queued spans and metrics now (e.g. before reading the DB)."""
+        for processor in self.span_processors:
+            processor.force_flush()
+        if self.meter_provider is not None:
+            self.meter_provider.force_flush()
 
     def log_exception_to_otel(self, exc_type, exc_value, exc_traceback):
         """Log unhandled exceptions to OpenTelemetry."""
@@ -136,3 +371,7 @@ class TelemetryConfig:
             span.set_status(
                 trace.Status(trace.StatusCode.ERROR, str(exc_value))
             )
+        # Keep the default (or previously installed) reporting
+        (self._previous_excepthook or sys.__excepthook__)(
+            exc_type, exc_value, exc_traceback
+        )
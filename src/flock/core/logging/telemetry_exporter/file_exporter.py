@@ -1,11 +1,21 @@
-"""A simple exporter that writes span data as JSON lines into a file."""
+"""An exporter that writes span data as JSON lines into rotating files."""
 
+import gzip
+import io
 import json
+import os
+import shutil
+import threading
+import time
+from collections.abc import Iterator
+from datetime import datetime
+from typing import IO, Any, Literal
 
 from opentelemetry.sdk.trace.export import SpanExportResult
 from opentelemetry.trace import Status, StatusCode
 from temporalio import workflow
 
+from flock.core.logging.logging import get_logger
 from flock.core.logging.telemetry_exporter.base_exporter import (
     TelemetryExporter,
 )
@@ -13,16 +23,142 @@ from flock.core.logging.telemetry_exporter.base_exporter import (
 with workflow.unsafe.imports_passed_through():
     from pathlib import Path
 
+Compression = Literal["gzip", "zstd"]
+COMPRESSION_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+
+logger = get_logger("telemetry")
+
+
+def _require_zstandard():
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            "zstd compression requires 'zstandard': pip install zstandard"
+        ) from e
+    return zstandard
+
+
+def _open_segment(path: Path) -> IO[str]:
+    """Opens a plain, gzip or zstd JSONL segment for reading text."""
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8")
+    if path.suffix == ".zst":
+        reader = (
+            _require_zstandard()
+            .ZstdDecompressor()
+            .stream_reader(open(path, "rb"), closefd=True)  # noqa: SIM115
+        )
+        return io.TextIOWrapper(reader, encoding="utf-8")
+    return open(path, encoding="utf-8")
+
+
+def span_segments(dir: str | Path, file_name: str = "flock_events.jsonl"):
+    """Rotated segments (oldest first) followed by the active file."""
+    directory = Path(dir)
+    stem, suffix = os.path.splitext(file_name)
+    segments = sorted(directory.glob(f"{stem}.*{suffix}*"))
+    active = directory / file_name
+    return [p for p in segments if p != active] + (
+        [active] if active.exists() else []
+    )
+
+
+def read_spans(
+    dir: str | Path,
+    file_name: str = "flock_events.jsonl",
+    since_ns: int | None = None,
+    name: str | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Streams spans written by FileSpanExporter, including rotated segments.
+
+    Segments are read lazily, one line at a time, so arbitrarily large
+    histories can be scanned without loading them into memory.
+
+    Args:
+        dir: Directory the exporter writes to.
+        file_name: Name of the active JSONL file.
+        since_ns: Only spans that started at or after this epoch time.
+        name: Only spans with this name.
+    """
+    # Spans are written with json.dumps, so the name appears encoded the same
+    name_field = f'"name": {json.dumps(name)}' if name is not None else None
+    for segment in span_segments(dir, file_name):
+        with _open_segment(segment) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                # Cheap substring check before parsing the whole line
+                if name_field is not None and name_field not in line:
+                    continue
+                span = json.loads(line)
+                if name is not None and span["name"] != name:
+                    continue
+                if (
+                    since_ns is not None
+                    and (span["start_time"] or 0) < since_ns
+                ):
+                    continue
+                yield span
+
 
 class FileSpanExporter(TelemetryExporter):
-    """A simple exporter that writes span data as JSON lines into a file."""
+    """Writes span data as JSON lines into a file, with rotation.
+
+    The file handle stays open and is buffered; a background timer flushes
+    it every `flush_interval_seconds`, even when no new spans arrive, and
+    applies time-based rotation. When the file exceeds `max_bytes` or is older
+    than `rotate_interval_seconds`, it is renamed to a timestamped segment
+    (e.g. `flock_events.20250101-120000-000000.jsonl.gz`), optionally
+    compressed, and a new file is started. Use `read_spans` to read spans
+    back across segments.
+    """
 
-    def __init__(self, dir: str, file_path: str = "flock_events.jsonl"):
-        """Initialize the exporter with a file path."""
+    def __init__(
+        self,
+        dir: str,
+        file_path: str = "flock_events.jsonl",
+        max_bytes: int | None = 50 * 1024 * 1024,
+        rotate_interval_seconds: float | None = None,
+        compression: Compression | None = "gzip",
+        max_segments: int | None = None,
+        flush_interval_seconds: float = 1.0,
+        buffer_size: int = 64 * 1024,
+    ):
+        """Initialize the exporter with a file path.
+
+        Args:
+            dir: Directory of the span files
+            file_path: Name of the active JSONL file
+            max_bytes: Rotate once the file reaches this size (None: never)
+            rotate_interval_seconds: Rotate files older than this
+            compression: Compress rotated segments ("gzip", "zstd" or None)
+            max_segments: Keep at most this many rotated segments
+            flush_interval_seconds: Maximum time spans stay in the buffer
+            buffer_size: Size of the write buffer in bytes
+        """
         super().__init__()
+        if compression not in (None, *COMPRESSION_SUFFIXES):
+            raise ValueError(f"Unknown compression: {compression}")
+        if compression == "zstd":
+            _require_zstandard()
         self.telemetry_path = Path(dir)
         self.telemetry_path.mkdir(parents=True, exist_ok=True)
+        self.file_name = file_path
         self.file_path = self.telemetry_path.joinpath(file_path).__str__()
+        self.max_bytes = max_bytes
+        self.rotate_interval_seconds = rotate_interval_seconds
+        self.compression = compression
+        self.max_segments = max_segments
+        self.flush_interval_seconds = flush_interval_seconds
+        self.buffer_size = buffer_size
+        self._file: IO[str] | None = None
+        self._size = 0
+        self._opened_at = 0.0
+        self._last_flush = 0.0
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._timer: threading.Thread | None = None
 
     def _span_to_json(self, span):
         """Convert a ReadableSpan to a JSON-serializable dict."""
@@ -69,17 +205,137 @@ class FileSpanExporter(TelemetryExporter):
             },
         }
 
+    def _open(self) -> IO[str]:
+        if self._file is None:
+            self._file = open(  # noqa: SIM115
+                self.file_path,
+                "a",
+                buffering=self.buffer_size,
+                encoding="utf-8",
+            )
+            self._size = self._file.tell()
+            self._opened_at = time.monotonic()
+            self._last_flush = self._opened_at
+            self._start_timer()
+        return self._file
+
+    def _start_timer(self) -> None:
+        if self._timer is not None or self._stopped.is_set():
+            return
+        self._timer = threading.Thread(
+            target=self._run_timer,
+            name=f"flock-span-file-{self.file_name}",
+            daemon=True,
+        )
+        self._timer.start()
+
+    def _run_timer(self) -> None:
+        while not self._stopped.wait(self.flush_interval_seconds):
+            try:
+                with self._lock:
+                    if self._file is None:
+                        continue
+                    self._file.flush()
+                    self._last_flush = time.monotonic()
+                    if self._should_rotate():
+                        self._rotate()
+            except Exception as e:
+                logger.warning(
+                    f"Flushing span file {self.file_path} failed: {e}"
+                )
+
+    def _should_rotate(self) -> bool:
+        if self.max_bytes and self._size >= self.max_bytes:
+            return True
+        return bool(
+            self.rotate_interval_seconds
+            and self._size
+            and time.monotonic() - self._opened_at
+            >= self.rotate_interval_seconds
+        )
+
+    def rotate(self) -> Path | None:
+        """Closes the active file and moves it into a rotated segment.
+
+        Returns:
+            The path of the new segment, or None if the file was empty.
+        """
+        with self._lock:
+            return self._rotate()
+
+    def _rotate(self) -> Path | None:
+        self._close()
+        active = Path(self.file_path)
+        if not active.exists() or active.stat().st_size == 0:
+            return None
+        stem, suffix = os.path.splitext(self.file_name)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        segment = self.telemetry_path / f"{stem}.{stamp}{suffix}"
+        active.rename(segment)
+        if self.compression:
+            segment = self._compress(segment)
+        self._prune_segments()
+        return segment
+
+    def _compress(self, segment: Path) -> Path:
+        target = segment.with_name(
+            segment.name + COMPRESSION_SUFFIXES[self.compression]
+        )
+        with open(segment, "rb") as src:
+            if self.compression == "gzip":
+                with gzip.open(target, "wb") as dst:
+                    shutil.copyfileobj(src, dst)
+            else:
+                compressor = _require_zstandard().ZstdCompressor()
+                with open(target, "wb") as dst:
+                    compressor.copy_stream(src, dst)
+        segment.unlink()
+        return target
+
+    def _prune_segments(self) -> None:
+        if self.max_segments is None:
+            return
+        segments = span_segments(self.telemetry_path, self.file_name)
+        rotated = [p for p in segments if p != Path(self.file_path)]
+        for old in rotated[: max(0, len(rotated) - self.max_segments)]:
+            old.unlink(missing_ok=True)
+
     def export(self, spans):
-        """Write spans to a log file."""
+        """Write spans to the buffered log file, rotating if needed."""
         try:
-            with open(self.file_path, "a") as f:
+            with self._lock:
+                f = self._open()
                 for span in spans:
-                    json_span = self._span_to_json(span)
-                    f.write(f"{json.dumps(json_span)}\n")
+                    line = f"{json.dumps(self._span_to_json(span))}\n"
+                    f.write(line)
+                    self._size += len(line.encode("utf-8"))
+                now = time.monotonic()
+                if now - self._last_flush >= self.flush_interval_seconds:
+                    f.flush()
+                    self._last_flush = now
+                if self._should_rotate():
+                    self._rotate()
             return SpanExportResult.SUCCESS
         except Exception:
             return SpanExportResult.FAILURE
 
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Flushes buffered spans to disk."""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+                self._last_flush = time.monotonic()
+        return True
+
+    def _close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
     def shutdown(self) -> None:
-        # Nothing special needed on shutdown.
-        pass
+        """Stops the flush timer, then flushes and closes the file."""
+        self._stopped.set()
+        if self._timer is not None:
+            self._timer.join(timeout=5)
+        with self._lock:
+            self._close()
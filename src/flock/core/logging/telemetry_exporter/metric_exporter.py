@@ -0,0 +1,235 @@
+"""Local exporters for OpenTelemetry metrics (JSON lines and SQLite).
+
+Both exporters request delta temporality for counters and histograms, so
+every exported row holds the aggregate of one export interval (e.g. "12 LLM calls, 3 of them cached, in
+the last minute") rather than a running total.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from opentelemetry.sdk.metrics import (
+    Counter,
+    Histogram,
+    ObservableCounter,
+    ObservableUpDownCounter,
+    UpDownCounter,
+)
+from opentelemetry.sdk.metrics.export import (
+    AggregationTemporality,
+    HistogramDataPoint,
+    MetricExporter,
+    MetricExportResult,
+    MetricsData,
+)
+
+from flock.core.logging.logging import get_logger
+
+logger = get_logger("telemetry")
+
+# Seconds between retention runs of the SQLite exporter
+PRUNE_INTERVAL_SECONDS = 3600
+
+# Delta for counters and histograms; up-down counters stay cumulative
+_TEMPORALITY = {
+    Counter: AggregationTemporality.DELTA,
+    UpDownCounter: AggregationTemporality.CUMULATIVE,
+    Histogram: AggregationTemporality.DELTA,
+    ObservableCounter: AggregationTemporality.DELTA,
+    ObservableUpDownCounter: AggregationTemporality.CUMULATIVE,
+}
+
+
+def metric_rows(metrics_data: MetricsData) -> Iterator[dict[str, Any]]:
+    """Flattens exported metrics into one dict per data point."""
+    for resource_metrics in metrics_data.resource_metrics:
+        for scope_metrics in resource_metrics.scope_metrics:
+            for metric in scope_metrics.metrics:
+                kind = type(metric.data).__name__.lower()
+                for point in metric.data.data_points:
+                    row = {
+                        "name": metric.name,
+                        "kind": kind,
+                        "unit": metric.unit or "",
+                        "start_time": point.start_time_unix_nano,
+                        "time": point.time_unix_nano,
+                        "attributes": dict(point.attributes or {}),
+                    }
+                    if isinstance(point, HistogramDataPoint):
+                        row.update(
+                            count=point.count,
+                            sum=point.sum,
+                            min=point.min,
+                            max=point.max,
+                            bucket_counts=list(point.bucket_counts),
+                            explicit_bounds=list(point.explicit_bounds),
+                        )
+                    else:
+                        row["value"] = point.value
+                    yield row
+
+
+class FileMetricExporter(MetricExporter):
+    """Appends metric data points as JSON lines to a file."""
+
+    def __init__(self, dir: str, file_name: str = "flock_metrics.jsonl"):
+        """Initialize the exporter.
+
+        Args:
+            dir: Directory of the file
+            file_name: Name of the JSONL file
+        """
+        super().__init__(preferred_temporality=_TEMPORALITY)
+        self.telemetry_path = Path(dir)
+        self.telemetry_path.mkdir(parents=True, exist_ok=True)
+        self.file_path = self.telemetry_path / file_name
+        self._lock = threading.Lock()
+
+    def export(
+        self,
+        metrics_data: MetricsData,
+        timeout_millis: float = 10_000,
+        **kwargs,
+    ) -> MetricExportResult:
+        """Writes one line per data point."""
+        lines = [
+            json.dumps(row, separators=(",", ":")) + "\n"
+            for row in metric_rows(metrics_data)
+        ]
+        if not lines:
+            return MetricExportResult.SUCCESS
+        try:
+            with self._lock, open(self.file_path, "a", encoding="utf-8") as f:
+                f.writelines(lines)
+            return MetricExportResult.SUCCESS
+        except OSError as e:
+            logger.error(f"Error exporting metrics to file: {e}")
+            return MetricExportResult.FAILURE
+
+    def force_flush(self, timeout_millis: float = 10_000) -> bool:
+        """Lines are written on export; nothing is buffered."""
+        return True
+
+    def shutdown(self, timeout_millis: float = 30_000, **kwargs) -> None:
+        """Nothing to release."""
+
+
+class SqliteMetricExporter(MetricExporter):
+    """Stores metric data points in the `otel_metrics` table of a database.
+
+    The table can live in the same (WAL-mode) database as the spans.
+    """
+
+    def __init__(
+        self,
+        dir: str,
+        db_path: str = "flock_events.db",
+        retention_days: float | None = None,
+    ):
+        """Initialize the exporter.
+
+        Args:
+            dir: Directory of the database file
+            db_path: Name of the SQLite database file
+            retention_days: Delete data points older than this (None keeps
+                all)
+        """
+        super().__init__(preferred_temporality=_TEMPORALITY)
+        telemetry_path = Path(dir)
+        telemetry_path.mkdir(parents=True, exist_ok=True)
+        self.db_path = str(telemetry_path.joinpath(db_path).resolve())
+        self.retention_days = retention_days
+        self._last_prune = 0.0
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS otel_metrics (
+                name TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                unit TEXT,
+                start_time INTEGER,
+                time INTEGER NOT NULL,
+                attributes TEXT,
+                value REAL,
+                count INTEGER,
+                sum REAL,
+                min REAL,
+                max REAL,
+                bucket_counts TEXT,
+                explicit_bounds TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_otel_metrics_name_time
+                ON otel_metrics (name, time);
+            """
+        )
+        self.conn.commit()
+
+    def export(
+        self,
+        metrics_data: MetricsData,
+        timeout_millis: float = 10_000,
+        **kwargs,
+    ) -> MetricExportResult:
+        """Inserts all data points in one transaction."""
+        rows = [
+            (
+                row["name"],
+                row["kind"],
+                row["unit"],
+                row["start_time"],
+                row["time"],
+                json.dumps(row["attributes"], sort_keys=True),
+                row.get("value"),
+                row.get("count"),
+                row.get("sum"),
+                row.get("min"),
+                row.get("max"),
+                json.dumps(row["bucket_counts"])
+                if "bucket_counts" in row
+                else None,
+                json.dumps(row["explicit_bounds"])
+                if "explicit_bounds" in row
+                else None,
+            )
+            for row in metric_rows(metrics_data)
+        ]
+        try:
+            with self._lock, self.conn:
+                if rows:
+                    self.conn.executemany(
+                        "INSERT INTO otel_metrics VALUES "
+                        "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        rows,
+                    )
+                if (
+                    self.retention_days
+                    and time.monotonic() - self._last_prune
+                    > PRUNE_INTERVAL_SECONDS
+                ):
+                    self._last_prune = time.monotonic()
+                    cutoff = time.time() - self.retention_days * 86400
+                    self.conn.execute(
+                        "DELETE FROM otel_metrics WHERE time < ?",
+                        (int(cutoff * 1e9),),
+                    )
+            return MetricExportResult.SUCCESS
+        except sqlite3.Error as e:
+            logger.error(f"Error exporting metrics to SQLite: {e}")
+            return MetricExportResult.FAILURE
+
+    def force_flush(self, timeout_millis: float = 10_000) -> bool:
+        """Rows are committed on export; nothing is buffered."""
+        return True
+
+    def shutdown(self, timeout_millis: float = 30_000, **kwargs) -> None:
+        """Closes the database connection."""
+        with self._lock:
+            self.conn.close()
@@ -0,0 +1,251 @@
+"""SQLite storage and offline queries for exported spans."""
+
+import json
+import math
+import sqlite3
+import threading
+import time
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+NS_PER_DAY = 86_400 * 1_000_000_000
+
+SPAN_COLUMNS = {
+    "id": "TEXT PRIMARY KEY",
+    "name": "TEXT",
+    "trace_id": "TEXT",
+    "span_id": "TEXT",
+    "start_time": "INTEGER",
+    "end_time": "INTEGER",
+    "attributes": "TEXT",
+    "status": "TEXT",
+    # Added later; older databases are migrated in place
+    "parent_id": "TEXT",
+    "duration_ns": "INTEGER",
+    "agent_name": "TEXT",
+}
+
+
+def _serialize_attributes(attributes: Any) -> str:
+    """Converts span/event attributes to a JSON string."""
+    serializable_attrs = {}
+    for key, value in dict(attributes or {}).items():
+        # Convert complex types to strings if needed
+        if isinstance(value, dict | list | tuple):
+            serializable_attrs[key] = json.dumps(value)
+        else:
+            serializable_attrs[key] = str(value)
+    return json.dumps(serializable_attrs)
+
+
+def _percentile(sorted_values: list[int], percentile: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    rank = max(1, math.ceil(percentile / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class SpanStore:
+    """Spans and span events in SQLite (WAL mode), with retention.
+
+    Used by SqliteTelemetryExporter for writing and usable offline for
+    analysis, e.g. `SpanStore("logs/flock_events.db").slowest_spans()`.
+    """
+
+    def __init__(self, db_path: str | Path):
+        """Opens (or creates and migrates) the database.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = str(db_path)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._initialize_database()
+
+    def _initialize_database(self) -> None:
+        columns = ", ".join(f"{n} {t}" for n, t in SPAN_COLUMNS.items())
+        with self._lock:
+            self.conn.execute(f"CREATE TABLE IF NOT EXISTS spans ({columns})")
+            existing = {
+                row[1] for row in self.conn.execute("PRAGMA table_info(spans)")
+            }
+            for name, column_type in SPAN_COLUMNS.items():
+                if name not in existing:
+                    self.conn.execute(
+                        f"ALTER TABLE spans ADD COLUMN {name} {column_type}"
+                    )
+            self.conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS span_events (
+                    span_id TEXT NOT NULL,
+                    trace_id TEXT,
+                    name TEXT,
+                    timestamp INTEGER,
+                    attributes TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_spans_trace_id ON spans (trace_id);
+                CREATE INDEX IF NOT EXISTS idx_spans_name ON spans (name);
+                CREATE INDEX IF NOT EXISTS idx_spans_start_time ON spans (start_time);
+                CREATE INDEX IF NOT EXISTS idx_spans_agent_name ON spans (agent_name);
+                CREATE INDEX IF NOT EXISTS idx_span_events_span_id ON span_events (span_id);
+                """
+            )
+            self.conn.commit()
+
+    def insert_spans(self, spans: Sequence[Any]) -> None:
+        """Bulk-inserts ReadableSpans and their events in one transaction."""
+        span_rows = []
+        event_rows = []
+        for span in spans:
+            span_id = format(span.context.span_id, "016x")
+            trace_id = format(span.context.trace_id, "032x")
+            attributes = span.attributes or {}
+            duration = (
+                span.end_time - span.start_time
+                if span.end_time and span.start_time
+                else None
+            )
+            span_rows.append(
+                (
+                    span_id,
+                    span.name,
+                    trace_id,
+                    span_id,
+                    span.start_time,
+                    span.end_time,
+                    _serialize_attributes(attributes),
+                    span.status.status_code.name,
+                    format(span.parent.span_id, "016x")
+                    if span.parent
+                    else None,
+                    duration,
+                    attributes.get("agent.name"),
+                )
+            )
+            event_rows.extend(
+                (
+                    span_id,
+                    trace_id,
+                    event.name,
+                    event.timestamp,
+                    _serialize_attributes(event.attributes),
+                )
+                for event in span.events
+            )
+
+        placeholders = ", ".join("?" * len(SPAN_COLUMNS))
+        with self._lock, self.conn:
+            self.conn.executemany(
+                f"INSERT OR REPLACE INTO spans ({', '.join(SPAN_COLUMNS)}) "
+                f"VALUES ({placeholders})",
+                span_rows,
+            )
+            # Re-exported spans replace their events instead of adding to them
+            self.conn.executemany(
+                "DELETE FROM span_events WHERE span_id = ?",
+                [(row[0],) for row in span_rows],
+            )
+            if event_rows:
+                self.conn.executemany(
+                    "INSERT INTO span_events "
+                    "(span_id, trace_id, name, timestamp, attributes) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    event_rows,
+                )
+
+    def prune(self, retention_days: float) -> int:
+        """Deletes spans (and their events) older than retention_days.
+
+        Returns:
+            The number of spans removed.
+        """
+        cutoff = time.time_ns() - int(retention_days * NS_PER_DAY)
+        with self._lock, self.conn:
+            self.conn.execute(
+                "DELETE FROM span_events WHERE span_id IN "
+                "(SELECT id FROM spans WHERE start_time < ?)",
+                (cutoff,),
+            )
+            deleted = self.conn.execute(
+                "DELETE FROM spans WHERE start_time < ?", (cutoff,)
+            ).rowcount
+        return deleted
+
+    def compact(self, vacuum: bool = True) -> None:
+        """Truncates the WAL and (if vacuum) reclaims space freed by pruning."""
+        with self._lock:
+            self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            if vacuum:
+                self.conn.execute("VACUUM")
+
+    def slowest_spans(
+        self,
+        limit: int = 10,
+        name: str | None = None,
+        since_ns: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Returns the longest-running spans, optionally filtered.
+
+        Args:
+            limit: Maximum number of spans to return.
+            name: Only spans with this name (e.g. "agent.run").
+            since_ns: Only spans that started at or after this epoch time.
+        """
+        query = (
+            "SELECT name, trace_id, span_id, agent_name, duration_ns, "
+            "start_time, status FROM spans WHERE duration_ns IS NOT NULL"
+        )
+        params: list[Any] = []
+        if name is not None:
+            query += " AND name = ?"
+            params.append(name)
+        if since_ns is not None:
+            query += " AND start_time >= ?"
+            params.append(since_ns)
+        query += " ORDER BY duration_ns DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            cursor = self.conn.execute(query, params)
+            columns = [c[0] for c in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def agent_latency_percentiles(
+        self,
+        span_name: str = "agent.run",
+        percentiles: Sequence[float] = (50, 90, 99),
+        since_ns: int | None = None,
+    ) -> dict[str, dict[str, float]]:
+        """Latency percentiles (in ms) of `span_name` spans per agent."""
+        query = (
+            "SELECT agent_name, duration_ns FROM spans "
+            "WHERE name = ? AND agent_name IS NOT NULL "
+            "AND duration_ns IS NOT NULL"
+        )
+        params: list[Any] = [span_name]
+        if since_ns is not None:
+            query += " AND start_time >= ?"
+            params.append(since_ns)
+        query += " ORDER BY agent_name, duration_ns"
+        with self._lock:
+            rows = self.conn.execute(query, params).fetchall()
+
+        durations: dict[str, list[int]] = {}
+        for agent_name, duration in rows:
+            durations.setdefault(agent_name, []).append(duration)
+        return {
+            agent_name: {
+                "count": len(values),
+                **{
+                    f"p{p:g}": _percentile(values, p) / 1e6 for p in percentiles
+                },
+            }
+            for agent_name, values in durations.items()
+        }
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        with self._lock:
+            self.conn.close()
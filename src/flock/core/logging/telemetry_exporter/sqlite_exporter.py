@@ -1,98 +1,59 @@
 """Exporter for storing OpenTelemetry spans in SQLite."""
 
-import json
-import sqlite3
+import time
 from pathlib import Path
-from typing import Any
 
 from opentelemetry.sdk.trace.export import SpanExportResult
 
 from flock.core.logging.telemetry_exporter.base_exporter import (
     TelemetryExporter,
 )
+from flock.core.logging.telemetry_exporter.span_store import SpanStore
+
+# Retention is enforced at most this often while exporting
+PRUNE_INTERVAL_SECONDS = 3600
 
 
 class SqliteTelemetryExporter(TelemetryExporter):
     """Exporter for storing OpenTelemetry spans in SQLite."""
 
-    def __init__(self, dir: str, db_path: str = "flock_events.db"):
+    def __init__(
+        self,
+        dir: str,
+        db_path: str = "flock_events.db",
+        retention_days: float | None = None,
+    ):
         """Initialize the SQLite exporter.
 
         Args:
+            dir: Directory of the database file
             db_path: Path to the SQLite database file
+            retention_days: Delete spans older than this (None keeps all)
         """
         super().__init__()
         self.telemetry_path = Path(dir)
         self.telemetry_path.mkdir(parents=True, exist_ok=True)
         # Create an absolute path to the database file:
         self.db_path = self.telemetry_path.joinpath(db_path).resolve().__str__()
-        # Use the absolute path when connecting:
-        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        self._initialize_database()
-
-    def _initialize_database(self):
-        """Set up the SQLite database schema."""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS spans (
-                id TEXT PRIMARY KEY,
-                name TEXT,
-                trace_id TEXT,
-                span_id TEXT,
-                start_time INTEGER,
-                end_time INTEGER,
-                attributes TEXT,
-                status TEXT
-            )
-            """
-        )
-        self.conn.commit()
-
-    def _convert_attributes(self, attributes: dict[str, Any]) -> str:
-        """Convert span attributes to a JSON string.
+        self.store = SpanStore(self.db_path)
+        self.conn = self.store.conn
+        self.retention_days = retention_days
+        self._last_prune = 0.0
+        self._apply_retention()
 
-        Args:
-            attributes: Dictionary of span attributes
-
-        Returns:
-            JSON string representation of attributes
-        """
-        # Convert attributes to a serializable format
-        serializable_attrs = {}
-        for key, value in attributes.items():
-            # Convert complex types to strings if needed
-            if isinstance(value, dict | list | tuple):
-                serializable_attrs[key] = json.dumps(value)
-            else:
-                serializable_attrs[key] = str(value)
-        return json.dumps(serializable_attrs)
+    def _apply_retention(self) -> None:
+        if not self.retention_days:
+            return
+        self._last_prune = time.monotonic()
+        if self.store.prune(self.retention_days):
+            self.store.compact(vacuum=False)
 
     def export(self, spans) -> SpanExportResult:
         """Export spans to SQLite."""
         try:
-            cursor = self.conn.cursor()
-            for span in spans:
-                span_id = format(span.context.span_id, "016x")
-                trace_id = format(span.context.trace_id, "032x")
-                cursor.execute(
-                    """
-                    INSERT OR REPLACE INTO spans 
-                    (id, name, trace_id, span_id, start_time, end_time, attributes, status)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        span_id,
-                        span.name,
-                        trace_id,
-                        span_id,
-                        span.start_time,
-                        span.end_time,
-                        self._convert_attributes(span.attributes),
-                        str(span.status),
-                    ),
-                )
-            self.conn.commit()
+            self.store.insert_spans(spans)
+            if time.monotonic() - self._last_prune > PRUNE_INTERVAL_SECONDS:
+                self._apply_retention()
             return SpanExportResult.SUCCESS
         except Exception as e:
             print("Error exporting spans to SQLite:", e)
@@ -0,0 +1,169 @@
+"""OpenTelemetry metric instruments recorded by the Flock core.
+
+Instruments come from the global meter provider. TelemetryConfig installs
+an SDK provider with local exporters (see `telemetry_exporter/
+metric_exporter.py`) together with the span exporters; until then, or when
+telemetry is disabled, recording is a no-op.
+
+Instruments:
+    flock.agent.duration: Agent runs (s), by agent and status.
+    flock.hop.duration: Workflow hops incl. routing and handoff (s).
+    flock.llm.duration: LLM phase of evaluations (s), by agent and model.
+    flock.llm.calls / flock.llm.cache_hits: LM calls, and those served from
+        the cache.
+    flock.llm.tokens: Tokens (provider-reported, else estimated), by
+        token.type (prompt/completion).
+    flock.llm.cost: Provider-reported cost (USD).
+    flock.router.decisions: Routing results, by router and next agent.
+    flock.tool.calls: Tool invocations, by tool and status.
+"""
+
+import contextlib
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING
+
+from opentelemetry import metrics
+
+if TYPE_CHECKING:
+    from flock.core.util.token_usage import TokenUsage
+
+
+class FlockInstruments:
+    """The instruments of the "flock" meter."""
+
+    def __init__(self, meter: metrics.Meter):
+        """Creates all instruments on meter."""
+        self.agent_duration = meter.create_histogram(
+            "flock.agent.duration", unit="s", description="Agent run duration"
+        )
+        self.hop_duration = meter.create_histogram(
+            "flock.hop.duration",
+            unit="s",
+            description="Workflow hop duration, including routing",
+        )
+        self.llm_duration = meter.create_histogram(
+            "flock.llm.duration",
+            unit="s",
+            description="Duration of the LLM phase of an evaluation",
+        )
+        self.llm_calls = meter.create_counter(
+            "flock.llm.calls", unit="{call}", description="LM calls"
+        )
+        self.llm_cache_hits = meter.create_counter(
+            "flock.llm.cache_hits",
+            unit="{call}",
+            description="LM calls served from the cache",
+        )
+        self.llm_tokens = meter.create_counter(
+            "flock.llm.tokens", unit="{token}", description="LM tokens"
+        )
+        self.llm_cost = meter.create_counter(
+            "flock.llm.cost", unit="USD", description="LM cost"
+        )
+        self.router_decisions = meter.create_counter(
+            "flock.router.decisions",
+            unit="{decision}",
+            description="Handoff decisions of routers",
+        )
+        self.tool_calls = meter.create_counter(
+            "flock.tool.calls", unit="{call}", description="Tool invocations"
+        )
+
+
+_instruments: FlockInstruments | None = None
+_instruments_lock = threading.Lock()
+
+
+def get_instruments() -> FlockInstruments:
+    """Returns the process-wide instruments, creating them on first use."""
+    global _instruments
+    if _instruments is None:
+        with _instruments_lock:
+            if _instruments is None:
+                _instruments = FlockInstruments(metrics.get_meter("flock"))
+    return _instruments
+
+
+def record_agent_duration(
+    agent_name: str, duration_seconds: float, error: Exception | None = None
+) -> None:
+    """Records one agent run."""
+    get_instruments().agent_duration.record(
+        duration_seconds,
+        {
+            "agent.name": agent_name,
+            "status": "error" if error is not None else "ok",
+        },
+    )
+
+
+@contextlib.contextmanager
+def timed_hop(agent_name: str) -> Iterator[None]:
+    """Records the duration of the enclosed run_agent hop."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        get_instruments().hop_duration.record(
+            time.perf_counter() - start, {"agent.name": agent_name}
+        )
+
+
+def record_router_decision(
+    router_name: str, agent_name: str, next_agent: str | None
+) -> None:
+    """Records a routing result; an empty next_agent ends the chain."""
+    get_instruments().router_decisions.add(
+        1,
+        {
+            "router": router_name,
+            "agent.name": agent_name,
+            "next_agent": next_agent or "",
+        },
+    )
+
+
+def record_tool_call(tool_name: str, error: Exception | None = None) -> None:
+    """Records one tool invocation."""
+    get_instruments().tool_calls.add(
+        1,
+        {
+            "tool.name": tool_name,
+            "status": "error" if error is not None else "ok",
+        },
+    )
+
+
+def record_llm_calls(
+    agent_name: str,
+    model: str | None,
+    duration_seconds: float,
+    usages: Iterable["TokenUsage"],
+) -> None:
+    """Records the LLM phase of one evaluation and its LM calls.
+
+    Args:
+        agent_name: The evaluated agent.
+        model: The configured model.
+        duration_seconds: Duration of the LLM phase.
+        usages: The usage of each LM call of this evaluation.
+    """
+    instruments = get_instruments()
+    attributes = {"agent.name": agent_name, "model": model or ""}
+    instruments.llm_duration.record(duration_seconds, attributes)
+    for usage in usages:
+        instruments.llm_calls.add(usage.calls, attributes)
+        if usage.cached_calls:
+            instruments.llm_cache_hits.add(usage.cached_calls, attributes)
+        for token_type, tokens in (
+            ("prompt", usage.prompt_tokens),
+            ("completion", usage.completion_tokens),
+        ):
+            if tokens:
+                instruments.llm_tokens.add(
+                    tokens, {**attributes, "token.type": token_type}
+                )
+        if usage.cost:
+            instruments.llm_cost.add(usage.cost, attributes)
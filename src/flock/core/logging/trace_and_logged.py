@@ -6,6 +6,7 @@ import inspect
 from opentelemetry import trace
 
 from flock.core.logging.logging import get_logger
+from flock.core.logging.span_attributes import set_payload_attribute
 
 logger = get_logger("tools")
 tracer = trace.get_tracer(__name__)
@@ -22,11 +23,11 @@ def traced_and_logged(func):
         @functools.wraps(func)
         async def async_wrapper(*args, **kwargs):
             with tracer.start_as_current_span(func.__name__) as span:
-                span.set_attribute("args", str(args))
-                span.set_attribute("kwargs", str(kwargs))
+                set_payload_attribute(span, "args", args)
+                set_payload_attribute(span, "kwargs", kwargs)
                 try:
                     result = await func(*args, **kwargs)
-                    span.set_attribute("result", str(result))
+                    set_payload_attribute(span, "result", result)
                     logger.debug(
                         f"{func.__name__} executed successfully", result=result
                     )
@@ -42,11 +43,11 @@ def traced_and_logged(func):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             with tracer.start_as_current_span(func.__name__) as span:
-                span.set_attribute("args", str(args))
-                span.set_attribute("kwargs", str(kwargs))
+                set_payload_attribute(span, "args", args)
+                set_payload_attribute(span, "kwargs", kwargs)
                 try:
                     result = func(*args, **kwargs)
-                    span.set_attribute("result", str(result))
+                    set_payload_attribute(span, "result", result)
                     logger.debug(
                         f"{func.__name__} executed successfully", result=result
                     )
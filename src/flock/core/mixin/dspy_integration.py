@@ -1,11 +1,17 @@
 # src/flock/core/mixin/dspy_integration.py
 """Mixin class for integrating with the dspy library."""
 
+import copy
+import functools
+import inspect
 import re  # Import re for parsing
 import typing
+from collections.abc import Callable
 from typing import Any, Literal
 
+from flock.config import LM_HISTORY_SIZE
 from flock.core.logging.logging import get_logger
+from flock.core.logging.telemetry_metrics import record_tool_call
 
 # Import split_top_level (assuming it's moved or copied appropriately)
 # Option 1: If moved to a shared util
@@ -19,6 +25,43 @@ logger = get_logger("mixin.dspy")
 AgentType = Literal["ReAct", "Completion", "ChainOfThought"] | None
 
 
+def _counted_tool(tool: Callable) -> Callable:
+    """Wraps a tool function so its invocations are recorded as metrics.
+
+    The wrapper keeps the name, docstring and signature DSPy reads. Other
+    callables (e.g. dspy.Tool instances) are returned unchanged.
+    """
+    if not (inspect.isfunction(tool) or inspect.ismethod(tool)):
+        return tool
+    name = tool.__name__
+
+    if inspect.iscoroutinefunction(tool):
+
+        @functools.wraps(tool)
+        async def async_wrapper(*args, **kwargs):
+            try:
+                result = await tool(*args, **kwargs)
+            except Exception as e:
+                record_tool_call(name, e)
+                raise
+            record_tool_call(name)
+            return result
+
+        return async_wrapper
+
+    @functools.wraps(tool)
+    def wrapper(*args, **kwargs):
+        try:
+            result = tool(*args, **kwargs)
+        except Exception as e:
+            record_tool_call(name, e)
+            raise
+        record_tool_call(name)
+        return result
+
+    return wrapper
+
+
 # Helper function needed by _resolve_type_string (copied from input_resolver.py/previous response)
 def split_top_level(s: str) -> list[str]:
     """Split a string on commas that are not enclosed within brackets, parentheses, or quotes."""
@@ -169,6 +212,39 @@ def _resolve_type_string(type_str: str) -> type:
     raise KeyError(f"Type '{type_str}' could not be resolved.")
 
 
+# Helper function to build the list-typed variant of a fields spec for packing
+def _listify_fields_spec(fields_spec: str) -> str:
+    """Wraps the type of every field in a fields spec into 'list[...]'.
+
+    'query: str | The query, k: int' becomes
+    'query: list[str] | The query, k: list[int]'.
+    """
+    listified = []
+    for field in split_top_level(fields_spec or ""):
+        parts = field.split("|", 1)
+        main_part = parts[0].strip()
+        desc = parts[1].strip() if len(parts) > 1 else None
+
+        if ":" in main_part:
+            name, type_str = [s.strip() for s in main_part.split(":", 1)]
+        else:
+            name, type_str = main_part, "str"
+
+        packed_field = f"{name}: list[{type_str}]"
+        if desc:
+            packed_field += f" | {desc}"
+        listified.append(packed_field)
+    return ", ".join(listified)
+
+
+PACKING_INSTRUCTIONS = (
+    "You are given several independent items at once. Every input field is a "
+    "list with one entry per item. Solve each item on its own and return "
+    "every output field as a list with exactly one entry per item, in the "
+    "same order as the inputs."
+)
+
+
 class DSPyIntegrationMixin:
     """Mixin class for integrating with the dspy library."""
 
@@ -276,14 +352,94 @@ class DSPyIntegrationMixin:
             raise TypeError(
                 f"Could not create DSPy signature type: {e}") from e
 
+    def create_packed_dspy_signature_class(
+        self, agent_name, description_spec, fields_spec
+    ) -> Any:
+        """Creates the list-typed variant of a DSPy Signature for prompt packing.
+
+        Every input and output field is wrapped into 'list[...]' so that K
+        batch items can be answered with a single LM call.
+        """
+        if "->" in fields_spec:
+            inputs_spec, outputs_spec = fields_spec.split("->", 1)
+        else:
+            inputs_spec, outputs_spec = fields_spec, ""
+
+        packed_fields_spec = (
+            f"{_listify_fields_spec(inputs_spec)} -> "
+            f"{_listify_fields_spec(outputs_spec)}"
+        )
+        packed_description = (
+            f"{description_spec}\n\n{PACKING_INSTRUCTIONS}"
+            if description_spec
+            else PACKING_INSTRUCTIONS
+        )
+        return self.create_dspy_signature_class(
+            f"{agent_name}_packed", packed_description, packed_fields_spec
+        )
+
+    def _unpack_packed_result(
+        self, result: Any, output_field_names: list[str], item_count: int
+    ) -> list[dict[str, Any] | None]:
+        """Splits a packed DSPy result into one output dict per item.
+
+        Items whose outputs cannot be recovered are returned as None so the
+        caller can fall back to single-item calls for them. If any output
+        field is not a list of exactly item_count entries, the alignment
+        between inputs and outputs cannot be trusted and every item fails.
+        """
+        unpacked: list[dict[str, Any] | None] = [None] * item_count
+        if result is None:
+            return unpacked
+
+        field_values = {}
+        for field_name in output_field_names:
+            values = (
+                result.get(field_name)
+                if hasattr(result, "get")
+                else getattr(result, field_name, None)
+            )
+            if not isinstance(values, list) or len(values) != item_count:
+                logger.warning(
+                    f"Packed output field '{field_name}' is not a list of "
+                    f"{item_count} entries. Falling back for all items."
+                )
+                return unpacked
+            field_values[field_name] = values
+
+        for index in range(item_count):
+            item_output = {
+                field_name: values[index]
+                for field_name, values in field_values.items()
+            }
+            if any(value is None for value in item_output.values()):
+                logger.debug(f"Packed item {index} has missing outputs.")
+                continue
+            unpacked[index] = item_output
+        return unpacked
+
     def _configure_language_model(
         self,
         model: str | None,
         use_cache: bool,
         temperature: float,
         max_tokens: int,
-    ) -> None:
-        """Initialize and configure the language model using dspy."""
+    ) -> Any:
+        """Initialize and configure the language model using dspy.
+
+        Returns the LM calls should use: the configured one, or an LM set
+        with dspy.context (which takes precedence). The LM is read right
+        after configuring it; callers bind their task to a _scoped_lm of it
+        since concurrent agents replace the global LM while a call awaits.
+        """
+        try:
+            import dspy
+        except ImportError:
+            logger.error(
+                "DSPy library is not installed. Cannot configure language model."
+            )
+            return None  # Or raise
+
         if model is None:
             logger.warning(
                 "No model specified for DSPy configuration. Using DSPy default."
@@ -292,15 +448,7 @@ class DSPyIntegrationMixin:
             # import dspy
             # if dspy.settings.lm is None:
             #      raise ValueError("No model specified for agent and no global DSPy LM configured.")
-            return
-
-        try:
-            import dspy
-        except ImportError:
-            logger.error(
-                "DSPy library is not installed. Cannot configure language model."
-            )
-            return  # Or raise
+            return dspy.settings.get("lm")
 
         try:
             # Ensure 'cache' parameter is handled correctly (might not exist on dspy.LM directly)
@@ -324,6 +472,50 @@ class DSPyIntegrationMixin:
                 f"Failed to configure DSPy language model '{model}': {e}",
                 exc_info=True,
             )
+        return dspy.settings.get("lm")
+
+    def _scoped_lm(self, lm: Any) -> Any:
+        """Per-call copy of lm whose history holds only this call's entries.
+
+        Shares the client settings and cache with lm. Binding a task to it
+        (set_lm) keeps concurrent or streaming calls on the same LM from
+        seeing each other's history; merge it back with _merge_lm_history.
+        """
+        if lm is None:
+            return None
+        scoped = copy.copy(lm)
+        scoped.history = []
+        return scoped
+
+    def _merge_lm_history(self, lm: Any, scoped: Any) -> list[dict[str, Any]]:
+        """Moves the entries of a scoped LM into lm and bounds the histories.
+
+        Returns:
+            The entries of the calls made through the scoped LM.
+        """
+        if scoped is None:
+            return []
+        entries = scoped.history
+        scoped.history = []
+        lm.history.extend(entries)
+        if len(lm.history) > LM_HISTORY_SIZE:
+            del lm.history[: len(lm.history) - LM_HISTORY_SIZE]
+        self._trim_lm_history()
+        return entries
+
+    def _trim_lm_history(self) -> None:
+        """Bounds DSPy's process-wide LM history to LM_HISTORY_SIZE entries.
+
+        DSPy appends every LM call, including the full provider response,
+        to a global list that is never truncated. Flock accounts usage from
+        the history of the per-call LM instead, so older global entries are
+        dropped.
+        """
+        from dspy.clients import base_lm
+
+        history = base_lm.GLOBAL_HISTORY
+        if len(history) > LM_HISTORY_SIZE:
+            del history[: len(history) - LM_HISTORY_SIZE]
 
     def _select_task(
         self,
@@ -345,7 +537,7 @@ class DSPyIntegrationMixin:
             for tool in tools:
                 # Basic check (Callables are objects with an instance of a __call__ method)
                 if callable(tool):
-                    processed_tools.append(tool)
+                    processed_tools.append(_counted_tool(tool))
                 # Could add more sophisticated tool wrapping/validation here if needed
                 else:
                     logger.warning(
@@ -392,10 +584,8 @@ class DSPyIntegrationMixin:
 
     def _process_result(
         self, result: Any, inputs: dict[str, Any]
-    ) -> tuple[dict[str, Any], float, list]:
+    ) -> dict[str, Any]:
         """Convert the DSPy result object to a dictionary."""
-        import dspy
-
         if result is None:
             logger.warning("DSPy program returned None result.")
             return {}
@@ -417,16 +607,11 @@ class DSPyIntegrationMixin:
                     )
                     output_dict = {"raw_result": result}
 
-            logger.debug(f"Processed DSPy result to dict: {output_dict}")
+            logger.debug(
+                lambda: f"Processed DSPy result to dict: {output_dict}"
+            )
             # Optionally merge inputs back if desired (can make result dict large)
-            final_result = {**inputs, **output_dict}
-
-            lm = dspy.settings.get("lm")
-            cost = sum([x["cost"]
-                       for x in lm.history if x["cost"] is not None])
-            lm_history = lm.inspect_history()
-
-            return final_result, cost, lm_history
+            return {**inputs, **output_dict}
 
         except Exception as conv_error:
             logger.error(
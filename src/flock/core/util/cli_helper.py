@@ -1,14 +1,22 @@
+from functools import cache
 from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING
 
-from rich.console import Console
-from rich.syntax import Text
+if TYPE_CHECKING:
+    from rich.console import Console
 
 try:
     __version__ = version("flock-core")
 except PackageNotFoundError:
     __version__ = "0.2.0"
 
-console = Console()
+
+@cache
+def get_console() -> "Console":
+    """Return the shared rich console, importing rich on first use."""
+    from rich.console import Console
+
+    return Console()
 
 
 def display_hummingbird():
@@ -45,6 +53,9 @@ def display_hummingbird():
 
 def init_console(clear_screen: bool = True, show_banner: bool = True):
     """Display the Flock banner."""
+    from rich.text import Text
+
+    console = get_console()
     banner_text = Text(
         f"""
 🦆    🐓     🐤     🐧
@@ -70,6 +81,9 @@ def init_console(clear_screen: bool = True, show_banner: bool = True):
 
 def display_banner_no_version():
     """Display the Flock banner."""
+    from rich.text import Text
+
+    console = get_console()
     banner_text = Text(
         """
 🦆    🐓     🐤     🐧
@@ -0,0 +1,186 @@
+"""Columnar (Arrow/Parquet) helpers for batch and evaluation inputs/outputs.
+
+Converts tables to per-item records column-wise instead of row by row and
+projects only the columns that are actually needed.
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+from flock.core.logging.logging import get_logger
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pa = None
+    feather = None
+    pq = None
+    PYARROW_AVAILABLE = False
+
+logger = get_logger("flock")
+
+PARQUET_SUFFIXES = {".parquet", ".pq"}
+ARROW_IPC_SUFFIXES = {".arrow", ".feather", ".ipc"}
+COLUMNAR_SUFFIXES = PARQUET_SUFFIXES | ARROW_IPC_SUFFIXES
+
+
+def _require_pyarrow() -> None:
+    if not PYARROW_AVAILABLE:
+        raise ImportError(
+            "Arrow/Parquet support requires 'pyarrow': pip install pyarrow"
+        )
+
+
+def is_columnar_source(source: Any) -> bool:
+    """Returns True for Arrow tables and paths to Parquet/Arrow files."""
+    if PYARROW_AVAILABLE and isinstance(source, pa.Table | pa.RecordBatch):
+        return True
+    if isinstance(source, str | Path):
+        return Path(source).suffix.lower() in COLUMNAR_SUFFIXES
+    return False
+
+
+def read_columnar_table(
+    source: Any, columns: list[str] | None = None
+) -> "pa.Table":
+    """Loads an Arrow table, reading only the given columns.
+
+    Args:
+        source: A pyarrow Table/RecordBatch or a path to a Parquet or Arrow IPC
+            (Feather) file.
+        columns: Columns to project. Files are read with projection pushdown,
+            so unused columns are never loaded. None reads all columns.
+
+    Raises:
+        ValueError: If a requested column does not exist or the file type is
+            not supported.
+    """
+    _require_pyarrow()
+
+    if isinstance(source, pa.RecordBatch):
+        source = pa.Table.from_batches([source])
+
+    if columns is not None:
+        available = columnar_column_names(source)
+        missing = [c for c in columns if c not in available]
+        if missing:
+            raise ValueError(
+                f"Dataset missing required columns: {', '.join(missing)}"
+            )
+
+    if isinstance(source, pa.Table):
+        return source.select(columns) if columns is not None else source
+    if Path(source).suffix.lower() in PARQUET_SUFFIXES:
+        return pq.read_table(source, columns=columns)
+    return feather.read_table(source, columns=columns, memory_map=True)
+
+
+def columnar_column_names(source: Any) -> list[str]:
+    """Column names of an Arrow table or file, read from the schema only.
+
+    Raises:
+        ValueError: If the file type is not supported.
+    """
+    _require_pyarrow()
+
+    if isinstance(source, pa.Table | pa.RecordBatch):
+        return source.schema.names
+    path = Path(source)
+    suffix = path.suffix.lower()
+    if suffix in PARQUET_SUFFIXES:
+        return pq.read_schema(path).names
+    if suffix in ARROW_IPC_SUFFIXES:
+        # Feather v2 is the Arrow IPC file format; only the footer is read
+        with pa.memory_map(str(path)) as f:
+            return pa.ipc.open_file(f).schema.names
+    raise ValueError(f"Unsupported columnar file type: {suffix}")
+
+
+def table_to_records(
+    table: "pa.Table", input_mapping: dict[str, str] | None = None
+) -> list[dict[str, Any]]:
+    """Converts an Arrow table to a list of dicts, one per row.
+
+    If input_mapping is given, only the mapped columns are converted and
+    they are renamed to the agent input keys.
+    """
+    if input_mapping:
+        columns = [c for c in input_mapping if c in table.column_names]
+        for missing in set(input_mapping) - set(columns):
+            logger.warning(
+                f"Input mapping key '{missing}' not found in table columns"
+            )
+        table = table.select(columns).rename_columns(
+            [input_mapping[c] for c in columns]
+        )
+    return table.to_pylist()
+
+
+def dataframe_to_records(
+    df: Any, input_mapping: dict[str, str] | None = None
+) -> list[dict[str, Any]]:
+    """Converts a pandas DataFrame to a list of dicts without iterrows().
+
+    Values keep their column dtype (as native Python objects). If
+    input_mapping is given, only the mapped columns are converted and they
+    are renamed to the agent input keys.
+    """
+    if input_mapping:
+        columns = [c for c in input_mapping if c in df.columns]
+        for missing in set(input_mapping) - set(columns):
+            logger.warning(
+                f"Input mapping key '{missing}' not found in DataFrame columns"
+            )
+        df = df[columns].rename(
+            columns={c: input_mapping[c] for c in columns}
+        )
+    return df.to_dict("records")
+
+
+def records_to_table(records: list[dict[str, Any]]) -> "pa.Table":
+    """Builds an Arrow table from heterogeneous dicts.
+
+    Columns are the union of all keys (in first-seen order). Nested values
+    become struct/list columns; columns whose values Arrow cannot unify are
+    stored as JSON strings instead.
+    """
+    _require_pyarrow()
+
+    column_names: dict[str, None] = {}
+    for record in records:
+        column_names.update(dict.fromkeys(record))
+
+    arrays = {}
+    for name in column_names:
+        values = [record.get(name) for record in records]
+        try:
+            arrays[name] = pa.array(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            arrays[name] = pa.array(
+                [
+                    None if v is None else json.dumps(v, default=str)
+                    for v in values
+                ],
+                type=pa.string(),
+            )
+    return pa.table(arrays)
+
+
+def write_parquet(
+    records: list[dict[str, Any]],
+    path: str | Path,
+    hide_columns: list[str] | None = None,
+) -> None:
+    """Writes records to a Parquet file, dropping hide_columns if present."""
+    table = records_to_table(records)
+    if hide_columns:
+        table = table.drop_columns(
+            [c for c in hide_columns if c in table.column_names]
+        )
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(table, path)
@@ -0,0 +1,220 @@
+"""Low-overhead, in-memory latency profiling of agent lifecycle phases.
+
+`FlockAgent.run_async`, the declarative evaluator and each hop of
+`run_agent` record monotonic timings per agent and phase into fixed-bucket
+histograms. Reports are available as JSON-ready dicts or a text table via
+`Flock.get_latency_report()` and the API's `/profile/latency` endpoint.
+"""
+
+import bisect
+import contextlib
+import threading
+import time
+from collections.abc import Iterator
+from typing import Any
+
+from flock.config import PROFILING_ENABLED
+
+# Upper bucket bounds in milliseconds; the last bucket is unbounded
+BUCKET_BOUNDS_MS = (
+    1,
+    2.5,
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1_000,
+    2_500,
+    5_000,
+    10_000,
+    30_000,
+    60_000,
+)
+
+# Report order; other phases follow alphabetically
+PHASE_ORDER = (
+    "run",
+    "initialize",
+    "pre_evaluate",
+    "evaluate",
+    "evaluator.setup",
+    "rate_limit",
+    "llm",
+    "post_evaluate",
+    "terminate",
+    "hop.resolve_inputs",
+    "hop.execute",
+    "hop.routing",
+    "hop.handoff",
+)
+
+
+class LatencyHistogram:
+    """Count, sum, min/max and bucket counts of durations in milliseconds."""
+
+    __slots__ = ("buckets", "count", "max_ms", "min_ms", "total_ms")
+
+    def __init__(self):
+        """Creates an empty histogram."""
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms = float("inf")
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+
+    def add(self, duration_ms: float) -> None:
+        """Records one duration."""
+        self.count += 1
+        self.total_ms += duration_ms
+        self.min_ms = min(self.min_ms, duration_ms)
+        self.max_ms = max(self.max_ms, duration_ms)
+        self.buckets[bisect.bisect_left(BUCKET_BOUNDS_MS, duration_ms)] += 1
+
+    def percentile(self, percentile: float) -> float:
+        """Estimated percentile: the upper bound of the bucket holding it."""
+        if not self.count:
+            return 0.0
+        rank = max(1, round(percentile / 100 * self.count))
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= rank:
+                if index == len(BUCKET_BOUNDS_MS):
+                    return self.max_ms
+                return min(BUCKET_BOUNDS_MS[index], self.max_ms)
+        return self.max_ms
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summary statistics plus the raw bucket counts."""
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.total_ms / self.count, 3)
+            if self.count
+            else 0.0,
+            "min_ms": round(self.min_ms, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": self.percentile(50),
+            "p90_ms": self.percentile(90),
+            "p99_ms": self.percentile(99),
+            "buckets": {
+                f"le_{bound}": count
+                for bound, count in zip(
+                    (*BUCKET_BOUNDS_MS, "inf"), self.buckets, strict=True
+                )
+            },
+        }
+
+
+def _phase_sort_key(phase: str) -> tuple[int, str]:
+    if phase in PHASE_ORDER:
+        return PHASE_ORDER.index(phase), phase
+    return len(PHASE_ORDER), phase
+
+
+class LatencyProfiler:
+    """Aggregates phase timings per agent into LatencyHistograms."""
+
+    def __init__(self, enabled: bool = True):
+        """Creates the profiler.
+
+        Args:
+            enabled: If False, phase() and record() are no-ops.
+        """
+        self.enabled = enabled
+        self._histograms: dict[tuple[str, str], LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def record(self, agent: str, phase: str, duration_ns: int) -> None:
+        """Records one timing of phase for agent."""
+        if not self.enabled:
+            return
+        key = (agent, phase)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = LatencyHistogram()
+            histogram.add(duration_ns / 1e6)
+
+    @contextlib.contextmanager
+    def phase(self, agent: str, phase: str) -> Iterator[None]:
+        """Times the enclosed block (including awaits) as phase of agent."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record(agent, phase, time.perf_counter_ns() - start)
+
+    def reset(self) -> None:
+        """Discards all recorded timings."""
+        with self._lock:
+            self._histograms.clear()
+
+    def report(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Per-agent, per-phase statistics: {agent: {phase: stats}}."""
+        with self._lock:
+            items = sorted(
+                self._histograms.items(),
+                key=lambda item: (item[0][0], _phase_sort_key(item[0][1])),
+            )
+            report: dict[str, dict[str, dict[str, Any]]] = {}
+            for (agent, phase), histogram in items:
+                report.setdefault(agent, {})[phase] = histogram.to_dict()
+        return report
+
+    def format_report(self) -> str:
+        """The report as a fixed-width text table (milliseconds)."""
+        header = (
+            "agent",
+            "phase",
+            "count",
+            "mean ms",
+            "p50 ms",
+            "p90 ms",
+            "p99 ms",
+            "max ms",
+        )
+        rows = [
+            (
+                agent,
+                phase,
+                str(stats["count"]),
+                *(
+                    f"{stats[key]:.1f}"
+                    for key in ("mean_ms", "p50_ms", "p90_ms", "p99_ms")
+                ),
+                f"{stats['max_ms']:.1f}",
+            )
+            for agent, phases in self.report().items()
+            for phase, stats in phases.items()
+        ]
+        if not rows:
+            return "No latency data recorded."
+        widths = [
+            max(len(row[i]) for row in (header, *rows))
+            for i in range(len(header))
+        ]
+
+        def line(row: tuple[str, ...]) -> str:
+            cells = [
+                cell.ljust(width) if i < 2 else cell.rjust(width)
+                for i, (cell, width) in enumerate(zip(row, widths, strict=True))
+            ]
+            return "  ".join(cells).rstrip()
+
+        separator = "  ".join("-" * width for width in widths)
+        return "\n".join([line(header), separator, *map(line, rows)])
+
+
+_profiler_instance = LatencyProfiler(enabled=PROFILING_ENABLED)
+
+
+def get_profiler() -> LatencyProfiler:
+    """Returns the process-wide LatencyProfiler."""
+    return _profiler_instance
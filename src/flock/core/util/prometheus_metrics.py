@@ -0,0 +1,158 @@
+"""Process-wide Prometheus instruments for agents, runs and batches.
+
+The instruments are created on first use, so `prometheus_client` is only
+imported when something is recorded. FlockAgent records run latency and
+errors, RunStore keeps the in-flight run and batch gauges and counts batch
+items, and MetricsModule (storage_type "prometheus") adds token and memory
+samples. The API serves everything at `/metrics` via `render_metrics()`.
+
+With several uvicorn/gunicorn workers, set `PROMETHEUS_MULTIPROC_DIR` to an
+empty directory before the workers start: every worker then writes its
+values to files in that directory and `render_metrics()` merges them, so a
+scrape of any worker returns the totals of all of them. Gauges use the
+"livesum" mode, i.e. values of exited workers are dropped.
+"""
+
+import os
+import threading
+from typing import Any
+
+from flock.config import PROMETHEUS_ENABLED
+from flock.core.logging.logging import get_logger
+
+logger = get_logger("prometheus")
+
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+# Histogram buckets in seconds, from a cached tool call to a long LLM chain
+LATENCY_BUCKETS_SECONDS = (
+    0.01,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    30,
+    60,
+    120,
+    300,
+)
+
+
+class FlockPrometheusMetrics:
+    """The Flock instruments, registered once in the default registry."""
+
+    def __init__(self):
+        """Creates and registers all instruments."""
+        from prometheus_client import Counter, Gauge, Histogram
+
+        self.agent_latency = Histogram(
+            "flock_agent_latency_seconds",
+            "Duration of agent runs",
+            ["agent_name"],
+            buckets=LATENCY_BUCKETS_SECONDS,
+        )
+        self.agent_errors = Counter(
+            "flock_agent_errors_total",
+            "Failed agent runs",
+            ["agent_name", "error_type"],
+        )
+        self.agent_tokens = Counter(
+            "flock_agent_tokens_total",
+            "Tokens used by agents",
+            ["agent_name", "type"],
+        )
+        self.agent_memory = Gauge(
+            "flock_agent_memory_bytes",
+            "Memory usage measured by agent runs",
+            ["agent_name"],
+            multiprocess_mode="livemax",
+        )
+        self.runs_in_flight = Gauge(
+            "flock_api_runs_in_flight",
+            "API runs that are starting or running",
+            ["kind"],
+            multiprocess_mode="livesum",
+        )
+        self.runs_finished = Counter(
+            "flock_api_runs_finished_total",
+            "API runs that completed or failed",
+            ["kind", "status"],
+        )
+        self.batch_items_total = Counter(
+            "flock_api_batch_items_total",
+            "Items submitted in batch runs",
+        )
+        self.batch_items_completed = Counter(
+            "flock_api_batch_items_completed_total",
+            "Batch items processed; rate() gives the batch throughput",
+        )
+
+
+_metrics: FlockPrometheusMetrics | None = None
+_metrics_lock = threading.Lock()
+_unavailable = not PROMETHEUS_ENABLED
+
+
+def get_prometheus_metrics() -> FlockPrometheusMetrics | None:
+    """Returns the process-wide instruments.
+
+    None if recording is disabled (`FLOCK_PROMETHEUS=False`) or
+    prometheus_client is not installed.
+    """
+    global _metrics, _unavailable
+    if _metrics is not None or _unavailable:
+        return _metrics
+    with _metrics_lock:
+        if _metrics is None and not _unavailable:
+            try:
+                _metrics = FlockPrometheusMetrics()
+            except ImportError:
+                logger.warning(
+                    "Prometheus metrics require 'prometheus-client': "
+                    "pip install prometheus-client"
+                )
+                _unavailable = True
+    return _metrics
+
+
+def record_agent_run(
+    agent_name: str, duration_seconds: float, error: Exception | None = None
+) -> None:
+    """Records the latency (and failure) of one agent run."""
+    metrics = get_prometheus_metrics()
+    if metrics is None:
+        return
+    metrics.agent_latency.labels(agent_name=agent_name).observe(
+        duration_seconds
+    )
+    if error is not None:
+        metrics.agent_errors.labels(
+            agent_name=agent_name, error_type=type(error).__name__
+        ).inc()
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """The exposition text of all metrics and its content type.
+
+    Merges the values of all worker processes when PROMETHEUS_MULTIPROC_DIR
+    is set.
+    """
+    from prometheus_client import (
+        CONTENT_TYPE_LATEST,
+        REGISTRY,
+        CollectorRegistry,
+        generate_latest,
+    )
+
+    get_prometheus_metrics()
+    registry: Any = REGISTRY
+    if os.environ.get(MULTIPROC_DIR_ENV):
+        from prometheus_client import multiprocess
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry), CONTENT_TYPE_LATEST
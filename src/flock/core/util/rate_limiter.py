@@ -0,0 +1,202 @@
+"""Process-wide token-bucket rate limiting for LLM calls.
+
+All LLM call sites (evaluators, routers, modules) acquire from the shared
+limiter before calling a model, so batch runs, evaluations and API requests
+running in the same process share one requests-per-minute and
+tokens-per-minute budget per model.
+"""
+
+import asyncio
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from opentelemetry import trace
+
+from flock.config import RATE_LIMIT_RPM, RATE_LIMIT_TPM
+from flock.core.logging.logging import get_logger
+
+logger = get_logger("rate_limiter")
+
+# Rough heuristic used by most providers for English text
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(value: Any) -> int:
+    """Estimates the prompt tokens of a value from its string length."""
+    if value is None:
+        return 0
+    return math.ceil(len(str(value)) / CHARS_PER_TOKEN)
+
+
+@dataclass
+class RateLimit:
+    """Per-model limits. None or 0 means unlimited."""
+
+    requests_per_minute: float | None = None
+    tokens_per_minute: float | None = None
+
+    @property
+    def is_unlimited(self) -> bool:
+        """True if neither requests nor tokens are limited."""
+        return not self.requests_per_minute and not self.tokens_per_minute
+
+
+class TokenBucket:
+    """A token bucket refilled continuously at `rate_per_minute`.
+
+    The capacity equals one minute of budget, so bursts up to the per-minute
+    limit are allowed.
+    """
+
+    def __init__(self, rate_per_minute: float):
+        """Creates a full bucket for the given per-minute rate."""
+        self.capacity = float(rate_per_minute)
+        self.rate_per_second = rate_per_minute / 60.0
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self.updated_at
+        self.tokens = min(
+            self.capacity, self.tokens + elapsed * self.rate_per_second
+        )
+        self.updated_at = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until `amount` can be consumed (0 if available now)."""
+        self._refill(now)
+        # Requests larger than the bucket would never fit; cap them
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate_per_second
+
+    def consume(self, amount: float) -> None:
+        """Removes `amount` (capped at capacity) from the bucket."""
+        self.tokens -= min(amount, self.capacity)
+
+
+class ModelRateLimiter:
+    """Shared limiter keyed by model string.
+
+    Models without an explicit configuration use the default limits from
+    FLOCK_RATE_LIMIT_RPM / FLOCK_RATE_LIMIT_TPM (unlimited if unset).
+    """
+
+    def __init__(self, default_limit: RateLimit | None = None):
+        """Creates a limiter; default_limit applies to unconfigured models."""
+        self.default_limit = default_limit or RateLimit()
+        self._limits: dict[str, RateLimit] = {}
+        self._buckets: dict[
+            str, tuple[TokenBucket | None, TokenBucket | None]
+        ] = {}
+        self._lock = threading.Lock()
+
+    def configure(
+        self,
+        model: str | None = None,
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+    ) -> None:
+        """Sets the limits for a model, or the default limits if model is None."""
+        limit = RateLimit(requests_per_minute, tokens_per_minute)
+        with self._lock:
+            if model is None:
+                self.default_limit = limit
+                self._buckets.clear()
+            else:
+                self._limits[model] = limit
+                self._buckets.pop(model, None)
+        logger.info(
+            f"Rate limit for '{model or 'default'}': "
+            f"rpm={requests_per_minute}, tpm={tokens_per_minute}"
+        )
+
+    def get_limit(self, model: str) -> RateLimit:
+        """Returns the limits that apply to the given model."""
+        return self._limits.get(model, self.default_limit)
+
+    def reset(self) -> None:
+        """Removes all per-model limits and bucket state."""
+        with self._lock:
+            self._limits.clear()
+            self._buckets.clear()
+
+    def _get_buckets(
+        self, model: str
+    ) -> tuple[TokenBucket | None, TokenBucket | None]:
+        if model not in self._buckets:
+            limit = self.get_limit(model)
+            self._buckets[model] = (
+                TokenBucket(limit.requests_per_minute)
+                if limit.requests_per_minute
+                else None,
+                TokenBucket(limit.tokens_per_minute)
+                if limit.tokens_per_minute
+                else None,
+            )
+        return self._buckets[model]
+
+    def _try_acquire(self, model: str, estimated_tokens: int) -> float:
+        """Consumes budget if available, else returns the seconds to wait."""
+        with self._lock:
+            request_bucket, token_bucket = self._get_buckets(model)
+            now = time.monotonic()
+            wait = 0.0
+            if request_bucket:
+                wait = max(wait, request_bucket.wait_time(1, now))
+            if token_bucket:
+                wait = max(wait, token_bucket.wait_time(estimated_tokens, now))
+            if wait > 0:
+                return wait
+            if request_bucket:
+                request_bucket.consume(1)
+            if token_bucket:
+                token_bucket.consume(estimated_tokens)
+            return 0.0
+
+    async def acquire(
+        self, model: str | None, estimated_tokens: int = 0
+    ) -> float:
+        """Waits until one request of `estimated_tokens` fits the model's budget.
+
+        The queue-wait time is recorded on the current span.
+
+        Args:
+            model: The model string the call is made with.
+            estimated_tokens: Estimated prompt plus completion tokens.
+
+        Returns:
+            The time spent waiting, in seconds.
+        """
+        if not model or self.get_limit(model).is_unlimited:
+            return 0.0
+
+        start = time.monotonic()
+        waited = 0.0
+        while (wait := self._try_acquire(model, estimated_tokens)) > 0:
+            await asyncio.sleep(wait)
+            waited = time.monotonic() - start
+
+        span = trace.get_current_span()
+        span.set_attribute("rate_limit.model", model)
+        span.set_attribute("rate_limit.estimated_tokens", estimated_tokens)
+        span.set_attribute("rate_limit.wait_ms", round(waited * 1000, 3))
+        if waited > 0:
+            logger.debug(
+                f"Rate limit for '{model}' delayed call by {waited:.2f}s"
+            )
+        return waited
+
+
+_rate_limiter_instance = ModelRateLimiter(
+    RateLimit(RATE_LIMIT_RPM or None, RATE_LIMIT_TPM or None)
+)
+
+
+def get_rate_limiter() -> ModelRateLimiter:
+    """Returns the process-wide ModelRateLimiter."""
+    return _rate_limiter_instance
@@ -0,0 +1,162 @@
+"""Token accounting from provider-reported LM usage.
+
+Every LM call made through DSPy leaves a history entry with the usage the
+provider reported (via litellm). Those numbers are exact and free, so they
+are used whenever present; only entries without usage are estimated with a
+tokenizer that is loaded once per model. Per-evaluation usage is summed per
+agent and per run under the `flock.token_usage` context variable.
+"""
+
+import functools
+from typing import Any
+
+from pydantic import BaseModel
+
+from flock.core.context.context import FlockContext
+from flock.core.context.context_vars import FLOCK_TOKEN_USAGE
+from flock.core.logging.logging import get_logger
+from flock.core.util.rate_limiter import estimate_tokens
+
+logger = get_logger("token_usage")
+
+
+class TokenUsage(BaseModel):
+    """Tokens and cost of one or more LM calls."""
+
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    # Provider-reported cost in USD (0 when unknown)
+    cost: float = 0.0
+    calls: int = 0
+    cached_calls: int = 0
+    # True if any of the counts was estimated rather than reported
+    estimated: bool = False
+
+    @property
+    def total_tokens(self) -> int:
+        """Prompt plus completion tokens."""
+        return self.prompt_tokens + self.completion_tokens
+
+    def __add__(self, other: "TokenUsage") -> "TokenUsage":
+        """Sum of both usages."""
+        return TokenUsage(
+            prompt_tokens=self.prompt_tokens + other.prompt_tokens,
+            completion_tokens=self.completion_tokens + other.completion_tokens,
+            cost=self.cost + other.cost,
+            calls=self.calls + other.calls,
+            cached_calls=self.cached_calls + other.cached_calls,
+            estimated=self.estimated or other.estimated,
+        )
+
+
+@functools.lru_cache(maxsize=32)
+def get_tokenizer(model: str | None):
+    """The tiktoken encoding for model (cached).
+
+    None without tiktoken or if the encoding cannot be loaded (tiktoken
+    downloads encodings on first use), so callers fall back to an estimate.
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    # "openai/gpt-4o" -> "gpt-4o"
+    name = (model or "").rsplit("/", 1)[-1]
+    try:
+        try:
+            return tiktoken.encoding_for_model(name)
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(f"No tokenizer for {model}, estimating tokens: {e}")
+        return None
+
+
+def count_tokens(text: str, model: str | None = None) -> int:
+    """Tokens of text for model; a length-based estimate without tiktoken."""
+    if not text:
+        return 0
+    tokenizer = get_tokenizer(model)
+    if tokenizer is None:
+        return estimate_tokens(text)
+    return len(tokenizer.encode(text, disallowed_special=()))
+
+
+def usage_from_history_entry(
+    entry: dict[str, Any], model: str | None = None
+) -> TokenUsage:
+    """Usage of one DSPy LM history entry.
+
+    DSPy clears the usage of responses served from its cache, so an empty
+    usage dict is a cache hit without token cost. Entries that carry no
+    usage at all are estimated from their messages and outputs.
+    """
+    usage = entry.get("usage")
+    if usage == {}:
+        return TokenUsage(calls=1, cached_calls=1)
+    if usage and usage.get("prompt_tokens") is not None:
+        return TokenUsage(
+            prompt_tokens=usage["prompt_tokens"],
+            completion_tokens=usage.get("completion_tokens") or 0,
+            cost=entry.get("cost") or 0.0,
+            calls=1,
+        )
+    model = entry.get("model") or model
+    messages = entry.get("messages") or [{"content": entry.get("prompt")}]
+    prompt = "\n".join(str(m.get("content") or "") for m in messages)
+    completion = "\n".join(str(o) for o in entry.get("outputs") or [])
+    return TokenUsage(
+        prompt_tokens=count_tokens(prompt, model),
+        completion_tokens=count_tokens(completion, model),
+        cost=entry.get("cost") or 0.0,
+        calls=1,
+        estimated=True,
+    )
+
+
+def record_token_usage(
+    context: FlockContext, agent_name: str, usage: TokenUsage
+) -> None:
+    """Adds usage to the run and agent totals in the context.
+
+    The `flock.token_usage` variable holds
+    `{"run": {...}, "agents": {agent_name: {...}}, "last": {...}}` with the
+    fields of TokenUsage, so it survives context serialization. "last" is
+    the usage of each agent's most recent evaluation in this run.
+    """
+    totals = context.get_variable(FLOCK_TOKEN_USAGE) or {
+        "run": {},
+        "agents": {},
+    }
+    run = TokenUsage(**totals["run"]) + usage
+    agent = TokenUsage(**totals["agents"].get(agent_name, {})) + usage
+    context.set_variable(
+        FLOCK_TOKEN_USAGE,
+        {
+            "run": run.model_dump(),
+            "agents": {**totals["agents"], agent_name: agent.model_dump()},
+            "last": {
+                **totals.get("last", {}),
+                agent_name: usage.model_dump(),
+            },
+        },
+    )
+
+
+def get_token_usage(
+    context: FlockContext, agent_name: str | None = None
+) -> TokenUsage:
+    """Token usage of the run, or of one agent, recorded in the context."""
+    totals = context.get_variable(FLOCK_TOKEN_USAGE) or {}
+    if agent_name is None:
+        return TokenUsage(**totals.get("run", {}))
+    return TokenUsage(**totals.get("agents", {}).get(agent_name, {}))
+
+
+def get_last_token_usage(
+    context: FlockContext, agent_name: str
+) -> TokenUsage | None:
+    """Usage of the agent's most recent evaluation in this run, if any."""
+    totals = context.get_variable(FLOCK_TOKEN_USAGE) or {}
+    last = totals.get("last", {}).get(agent_name)
+    return TokenUsage(**last) if last is not None else None
@@ -1,17 +1,33 @@
+import time
 from collections.abc import Generator
 from typing import Any
 
-import dspy
 from pydantic import Field
-from rich.console import Console
 
 from flock.core.flock_agent import FlockAgent
 from flock.core.flock_evaluator import FlockEvaluator, FlockEvaluatorConfig
 from flock.core.logging.logging import get_logger
+from flock.core.logging.telemetry_metrics import record_llm_calls
 from flock.core.mixin.dspy_integration import DSPyIntegrationMixin
 from flock.core.mixin.prompt_parser import PromptParserMixin
+from flock.core.util.cli_helper import get_console
+from flock.core.util.profiler import get_profiler
+from flock.core.util.rate_limiter import estimate_tokens, get_rate_limiter
+from flock.core.util.token_usage import (
+    TokenUsage,
+    record_token_usage,
+    usage_from_history_entry,
+)
 
-console = Console()
+# Kept from DSPy history entries; the raw provider response is dropped
+_LM_HISTORY_KEYS = (
+    "model",
+    "messages",
+    "outputs",
+    "usage",
+    "cost",
+    "timestamp",
+)
 
 logger = get_logger("evaluators.declarative")
 
@@ -44,12 +60,20 @@ class DeclarativeEvaluator(FlockEvaluator, DSPyIntegrationMixin, PromptParserMix
     )
 
     cost: float = 0.0
+    # History entries (without raw responses) of the last evaluation's calls
     lm_history: list = Field(default_factory=list)
+    token_usage: TokenUsage | None = Field(
+        default=None,
+        description="Token usage of the last evaluation.",
+    )
 
     async def evaluate(
         self, agent: FlockAgent, inputs: dict[str, Any], tools: list[Any]
     ) -> dict[str, Any]:
         """Evaluate using DSPy, with optional asynchronous streaming."""
+        profiler = get_profiler()
+        setup_start = time.perf_counter_ns()
+        self.token_usage = None
         # --- Setup Signature and LM ---
         # TODO: MODEL CONTEXT PROTOCOL LOGIC HERE
         try:
@@ -67,7 +91,7 @@ class DeclarativeEvaluator(FlockEvaluator, DSPyIntegrationMixin, PromptParserMix
                 )
             # -----------------------------
 
-            self._configure_language_model(
+            lm = self._configure_language_model(
                 model=self.config.model or agent.model,
                 use_cache=self.config.use_cache,
                 temperature=self.config.temperature,
@@ -79,6 +103,11 @@ class DeclarativeEvaluator(FlockEvaluator, DSPyIntegrationMixin, PromptParserMix
                 tools=tools,
                 kwargs=self.config.kwargs,
             )
+            # Keeps this call on its LM while the rate limiter waits, with
+            # a history of its own for usage accounting
+            call_lm = self._scoped_lm(lm)
+            if call_lm is not None:
+                agent_task.set_lm(call_lm)
         except Exception as setup_error:
             logger.error(
                 f"Error setting up DSPy task for agent '{agent.name}': {setup_error}",
@@ -87,6 +116,15 @@ class DeclarativeEvaluator(FlockEvaluator, DSPyIntegrationMixin, PromptParserMix
             raise RuntimeError(
                 f"DSPy task setup failed: {setup_error}"
             ) from setup_error
+        profiler.record(
+            agent.name, "evaluator.setup", time.perf_counter_ns() - setup_start
+        )
+
+        with profiler.phase(agent.name, "rate_limit"):
+            await get_rate_limiter().acquire(
+                self.config.model or agent.model,
+                estimate_tokens(inputs) + self.config.max_tokens,
+            )
 
         # --- Conditional Evaluation (Stream vs No Stream) ---
         if self.config.stream:
@@ -95,10 +133,14 @@ class DeclarativeEvaluator(FlockEvaluator, DSPyIntegrationMixin, PromptParserMix
                 logger.error("agent_task is not callable, cannot stream.")
                 raise TypeError("DSPy task could not be created or is not callable.")
 
+            import dspy
+
+            llm_start = time.perf_counter_ns()
             streaming_task = dspy.streamify(agent_task)
             stream_generator: Generator = streaming_task(**inputs)
             delta_content = ""
 
+            console = get_console()
             console.print("\n")
             async for chunk in stream_generator:
                 if (
@@ -113,13 +155,12 @@ class DeclarativeEvaluator(FlockEvaluator, DSPyIntegrationMixin, PromptParserMix
                 if delta_content:
                     console.print(delta_content, end="")
 
-                result_dict, cost, lm_history = self._process_result(
-                    chunk, inputs
-                )
-                self.cost = cost
-                self.lm_history = lm_history
+                result_dict = self._process_result(chunk, inputs)
 
             console.print("\n")
+            llm_duration_ns = time.perf_counter_ns() - llm_start
+            profiler.record(agent.name, "llm", llm_duration_ns)
+            self._record_lm_usage(agent, lm, call_lm, llm_duration_ns)
             return self.filter_thought_process(
                 result_dict, self.config.include_thought_process
             )
@@ -128,12 +169,16 @@ class DeclarativeEvaluator(FlockEvaluator, DSPyIntegrationMixin, PromptParserMix
             logger.info(f"Evaluating agent '{agent.name}' without streaming.")
             try:
                 # Ensure the call is awaited if the underlying task is async
-                result_obj = agent_task(**inputs)
-                result_dict, cost, lm_history = self._process_result(
-                    result_obj, inputs
+                llm_start = time.perf_counter_ns()
+                with profiler.phase(agent.name, "llm"):
+                    result_obj = agent_task(**inputs)
+                self._record_lm_usage(
+                    agent,
+                    lm,
+                    call_lm,
+                    time.perf_counter_ns() - llm_start,
                 )
-                self.cost = cost
-                self.lm_history = lm_history
+                result_dict = self._process_result(result_obj, inputs)
                 return self.filter_thought_process(
                     result_dict, self.config.include_thought_process
                 )
@@ -144,6 +189,121 @@ class DeclarativeEvaluator(FlockEvaluator, DSPyIntegrationMixin, PromptParserMix
                 )
                 raise RuntimeError(f"Evaluation failed: {e}") from e
 
+    async def evaluate_packed(
+        self,
+        agent: FlockAgent,
+        items: list[dict[str, Any]],
+        tools: list[Any],
+    ) -> list[dict[str, Any] | None]:
+        """Evaluate several items with a single LM call (prompt packing).
+
+        Uses the list-typed variant of the agent's signature. Returns one
+        result dict per item, or None for items whose outputs could not be
+        parsed so the caller can re-run them individually.
+        """
+        try:
+            _packed_signature = self.create_packed_dspy_signature_class(
+                agent.name,
+                agent.description,
+                f"{agent.input} -> {agent.output}",
+            )
+            input_field_names = list(_packed_signature.input_fields.keys())
+            output_field_names = list(_packed_signature.output_fields.keys())
+
+            lm = self._configure_language_model(
+                model=self.config.model or agent.model,
+                use_cache=self.config.use_cache,
+                temperature=self.config.temperature,
+                max_tokens=self.config.max_tokens,
+            )
+            agent_task = self._select_task(
+                _packed_signature,
+                override_evaluator_type=self.config.override_evaluator_type,
+                tools=tools,
+                kwargs=self.config.kwargs,
+            )
+            call_lm = self._scoped_lm(lm)
+            if call_lm is not None:
+                agent_task.set_lm(call_lm)
+        except Exception as setup_error:
+            logger.error(
+                f"Error setting up packed DSPy task for agent '{agent.name}': {setup_error}",
+                exc_info=True,
+            )
+            raise RuntimeError(
+                f"Packed DSPy task setup failed: {setup_error}"
+            ) from setup_error
+
+        packed_inputs = {
+            field_name: [item.get(field_name) for item in items]
+            for field_name in input_field_names
+        }
+        logger.info(
+            f"Evaluating {len(items)} packed items for agent '{agent.name}'."
+        )
+        await get_rate_limiter().acquire(
+            self.config.model or agent.model,
+            estimate_tokens(packed_inputs) + self.config.max_tokens,
+        )
+        llm_start = time.perf_counter_ns()
+        try:
+            result_obj = agent_task(**packed_inputs)
+        except Exception as e:
+            logger.warning(
+                f"Packed evaluation failed for agent '{agent.name}': {e}"
+            )
+            return [None] * len(items)
+        self._record_lm_usage(
+            agent, lm, call_lm, time.perf_counter_ns() - llm_start
+        )
+
+        # Shared fields such as 'reasoning' apply to the whole pack
+        shared_output = {
+            k: v
+            for k, v in result_obj.items()
+            if k not in output_field_names
+        }
+        unpacked = self._unpack_packed_result(
+            result_obj, output_field_names, len(items)
+        )
+        return [
+            self.filter_thought_process(
+                {**item, **shared_output, **output},
+                self.config.include_thought_process,
+            )
+            if output is not None
+            else None
+            for item, output in zip(items, unpacked)
+        ]
+
+    def _record_lm_usage(
+        self,
+        agent: FlockAgent,
+        lm: Any,
+        call_lm: Any,
+        llm_duration_ns: int,
+    ) -> None:
+        """Accounts the calls made through call_lm, the scoped copy of lm.
+
+        Uses provider-reported usage and adds it to the evaluator's
+        token_usage, cost and lm_history, the run and agent totals in the
+        context and the metrics. Only this call's entries are read, so other
+        calls to lm never leak in and the cost does not grow with the length
+        of the LM history.
+        """
+        model = self.config.model or agent.model
+        entries = self._merge_lm_history(lm, call_lm)
+        usages = [usage_from_history_entry(entry, model) for entry in entries]
+        self.token_usage = sum(usages, TokenUsage())
+        self.cost = self.token_usage.cost
+        self.lm_history = [
+            {key: entry.get(key) for key in _LM_HISTORY_KEYS}
+            for entry in entries
+        ]
+        record_llm_calls(agent.name, model, llm_duration_ns / 1e9, usages)
+        if agent.context is not None:
+            record_token_usage(agent.context, agent.name, self.token_usage)
+
     def filter_thought_process(
         self, result_dict: dict[str, Any], include_thought_process: bool
     ) -> dict[str, Any]:
@@ -13,6 +13,7 @@ from flock.core.context.context import FlockContext
 from flock.core.flock_agent import FlockAgent
 from flock.core.flock_module import FlockModule, FlockModuleConfig
 from flock.core.logging.logging import get_logger
+from flock.core.util.rate_limiter import estimate_tokens, get_rate_limiter
 from flock.modules.memory.memory_parser import MemoryMappingParser
 from flock.modules.memory.memory_storage import FlockMemoryStore, MemoryEntry
 
@@ -274,14 +275,22 @@ class MemoryModule(FlockModule):
             f"{input_signature} -> concepts: list[str] | Max {number_of_concepts} key concepts all lower case",
         )
 
-        agent._configure_language_model(agent.model, True, 0.0, 8192)
+        lm = agent._configure_language_model(agent.model, True, 0.0, 8192)
         predictor = agent._select_task(concept_signature, "Completion")
+        # Keeps this call on its LM while the rate limiter waits
+        call_lm = agent._scoped_lm(lm)
+        if call_lm is not None:
+            predictor.set_lm(call_lm)
+        await get_rate_limiter().acquire(
+            agent.model, estimate_tokens(text) + 8192
+        )
         result_obj = predictor(
             text=text,
             existing_concepts=list(existing_concepts)
             if existing_concepts
             else None,
         )
+        agent._merge_lm_history(lm, call_lm)
         concept_list = getattr(result_obj, "concepts", [])
         return set(concept_list)
 
@@ -300,10 +309,17 @@ class MemoryModule(FlockModule):
             -> chunks: list[str] | List of data and information for future reference
             """,
         )
-        agent._configure_language_model(agent.model, True, 0.0, 8192)
+        lm = agent._configure_language_model(agent.model, True, 0.0, 8192)
         splitter = agent._select_task(split_signature, "Completion")
+        call_lm = agent._scoped_lm(lm)
+        if call_lm is not None:
+            splitter.set_lm(call_lm)
         full_text = json.dumps(inputs) + json.dumps(result)
+        await get_rate_limiter().acquire(
+            agent.model, estimate_tokens(full_text) + 8192
+        )
         split_result = splitter(content=full_text)
+        agent._merge_lm_history(lm, call_lm)
         return "\n".join(split_result.chunks)
 
     async def _semantic_splitter_mode(
@@ -321,10 +337,17 @@ class MemoryModule(FlockModule):
             -> chunks: list[dict[str,str]] | List of chunks as key-value pairs - keys are a short title and values are the chunk content
             """,
         )
-        agent._configure_language_model(agent.model, True, 0.0, 8192)
+        lm = agent._configure_language_model(agent.model, True, 0.0, 8192)
         splitter = agent._select_task(split_signature, "Completion")
+        call_lm = agent._scoped_lm(lm)
+        if call_lm is not None:
+            splitter.set_lm(call_lm)
         full_text = json.dumps(inputs) + (json.dumps(result) if result else "")
+        await get_rate_limiter().acquire(
+            agent.model, estimate_tokens(full_text) + 8192
+        )
         split_result = splitter(content=full_text)
+        agent._merge_lm_history(lm, call_lm)
         return split_result.chunks
 
     async def _character_splitter_mode(
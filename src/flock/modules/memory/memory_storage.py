@@ -665,14 +665,15 @@ class FlockMemoryStore(BaseModel):
                     similarity * decay * reinforcement * entry.decay_factor
                 )
 
-                span.add_event(
-                    "memory score",
-                    attributes={
-                        "entry_id": entry.id,
-                        "similarity": similarity,
-                        "final_score": final_score,
-                    },
-                )
+                if span.is_recording():
+                    span.add_event(
+                        "memory score",
+                        attributes={
+                            "entry_id": entry.id,
+                            "similarity": similarity,
+                            "final_score": final_score,
+                        },
+                    )
 
                 # If base similarity passes threshold, include in results
                 if similarity >= similarity_threshold:
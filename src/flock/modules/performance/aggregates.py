@@ -0,0 +1,281 @@
+"""Incremental, mergeable metric aggregates.
+
+Each metric keeps running moments (count/mean/variance via Welford's
+algorithm) and a DDSketch-style quantile sketch with bounded relative
+error. Both update in O(1) per point, merge across processes, and
+serialize to a few kilobytes, so statistics never require re-reading the
+raw metric history.
+"""
+
+import json
+import math
+import os
+import tempfile
+from collections.abc import Iterable
+from typing import Any
+
+# Values closer to zero than this are counted in the zero bucket
+_MIN_INDEXABLE = 1e-9
+
+
+class RunningStats:
+    """Count, mean, variance, min, max and last value of a stream."""
+
+    __slots__ = ("count", "last", "m2", "max", "mean", "min")
+
+    def __init__(self):
+        """Creates empty statistics."""
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.last: float | None = None
+
+    def add(self, value: float) -> None:
+        """Adds one value (Welford's update)."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self.last = value
+
+    def merge(self, other: "RunningStats") -> None:
+        """Combines other into these statistics (Chan et al.)."""
+        if not other.count:
+            return
+        if not self.count:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max, self.last = other.min, other.max, other.last
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta**2 * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.last = other.last
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation."""
+        return math.sqrt(self.m2 / self.count) if self.count else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serializable state."""
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "m2": self.m2,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "last": self.last,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "RunningStats":
+        """Restores statistics saved with to_dict."""
+        stats = cls()
+        stats.count = data["count"]
+        stats.mean = data["mean"]
+        stats.m2 = data["m2"]
+        if stats.count:
+            stats.min, stats.max = data["min"], data["max"]
+        stats.last = data["last"]
+        return stats
+
+
+class QuantileSketch:
+    """Mergeable quantile sketch with bounded relative error (DDSketch).
+
+    Values are counted in logarithmic buckets, so any quantile is returned
+    within `relative_accuracy` of the exact value, using memory that grows
+    with the logarithm of the value range rather than with the count.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        """Creates an empty sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of quantiles.
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1.")
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.positive: dict[int, int] = {}
+        self.negative: dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def _key(self, magnitude: float) -> int:
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def _value(self, key: int) -> float:
+        return 2 * self._gamma**key / (self._gamma + 1)
+
+    def add(self, value: float) -> None:
+        """Adds one value."""
+        self.count += 1
+        if value > _MIN_INDEXABLE:
+            key = self._key(value)
+            self.positive[key] = self.positive.get(key, 0) + 1
+        elif value < -_MIN_INDEXABLE:
+            key = self._key(-value)
+            self.negative[key] = self.negative.get(key, 0) + 1
+        else:
+            self.zero_count += 1
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Adds the counts of a sketch with the same accuracy."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches of different accuracy.")
+        for key, count in other.positive.items():
+            self.positive[key] = self.positive.get(key, 0) + count
+        for key, count in other.negative.items():
+            self.negative[key] = self.negative.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+
+    def quantile(self, q: float) -> float | None:
+        """Approximate q-quantile (0 <= q <= 1), or None if empty."""
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        # Most negative values first: larger keys have larger magnitudes
+        for key in sorted(self.negative, reverse=True):
+            seen += self.negative[key]
+            if seen > rank:
+                return -self._value(key)
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+        for key in sorted(self.positive):
+            seen += self.positive[key]
+            if seen > rank:
+                return self._value(key)
+        return self._value(max(self.positive)) if self.positive else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serializable state."""
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "positive": {str(k): c for k, c in self.positive.items()},
+            "negative": {str(k): c for k, c in self.negative.items()},
+            "zero_count": self.zero_count,
+            "count": self.count,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "QuantileSketch":
+        """Restores a sketch saved with to_dict."""
+        sketch = cls(data["relative_accuracy"])
+        sketch.positive = {int(k): c for k, c in data["positive"].items()}
+        sketch.negative = {int(k): c for k, c in data["negative"].items()}
+        sketch.zero_count = data["zero_count"]
+        sketch.count = data["count"]
+        return sketch
+
+
+class MetricAggregate:
+    """RunningStats plus a QuantileSketch for one metric."""
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        """Creates an empty aggregate."""
+        self.stats = RunningStats()
+        self.sketch = QuantileSketch(relative_accuracy)
+
+    def add(self, value: float) -> None:
+        """Adds one value in O(1)."""
+        self.stats.add(value)
+        self.sketch.add(value)
+
+    def merge(self, other: "MetricAggregate") -> None:
+        """Combines another aggregate of the same metric into this one."""
+        self.stats.merge(other.stats)
+        self.sketch.merge(other.sketch)
+
+    def statistics(
+        self, percentiles: Iterable[float] = (50, 90, 95, 99)
+    ) -> dict[str, float]:
+        """min/max/mean/std/count/last_value and the requested percentiles."""
+        if not self.stats.count:
+            return {}
+        stats = {
+            "min": self.stats.min,
+            "max": self.stats.max,
+            "mean": self.stats.mean,
+            "std": self.stats.std,
+            "count": self.stats.count,
+            "last_value": self.stats.last,
+        }
+        for p in percentiles:
+            # Clamp the sketch's estimate to the exact observed range
+            value = self.sketch.quantile(p / 100)
+            stats[f"p{p}"] = min(max(value, self.stats.min), self.stats.max)
+        return stats
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serializable state."""
+        return {"stats": self.stats.to_dict(), "sketch": self.sketch.to_dict()}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "MetricAggregate":
+        """Restores an aggregate saved with to_dict."""
+        aggregate = cls()
+        aggregate.stats = RunningStats.from_dict(data["stats"])
+        aggregate.sketch = QuantileSketch.from_dict(data["sketch"])
+        return aggregate
+
+
+class MetricAggregates:
+    """Aggregates for all metrics, persisted as one compact JSON file."""
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        """Creates an empty collection."""
+        self.relative_accuracy = relative_accuracy
+        self.metrics: dict[str, MetricAggregate] = {}
+
+    def add(self, name: str, value: float) -> None:
+        """Adds one point of metric name."""
+        aggregate = self.metrics.get(name)
+        if aggregate is None:
+            aggregate = self.metrics[name] = MetricAggregate(
+                self.relative_accuracy
+            )
+        aggregate.add(value)
+
+    def statistics(
+        self, name: str, percentiles: Iterable[float] = (50, 90, 95, 99)
+    ) -> dict[str, float]:
+        """Statistics of metric name ({} if it has no numeric points)."""
+        aggregate = self.metrics.get(name)
+        return aggregate.statistics(percentiles) if aggregate else {}
+
+    def save(self, path: str) -> None:
+        """Writes all aggregates to path atomically."""
+        data = {name: agg.to_dict() for name, agg in self.metrics.items()}
+        directory = os.path.dirname(path) or "."
+        with tempfile.NamedTemporaryFile(
+            "w", dir=directory, suffix=".tmp", delete=False
+        ) as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(f.name, path)
+
+    @classmethod
+    def load(cls, path: str, relative_accuracy: float = 0.01):
+        """Loads aggregates saved with save(); empty if path is missing."""
+        aggregates = cls(relative_accuracy)
+        if os.path.exists(path):
+            with open(path) as f:
+                data = json.load(f)
+            aggregates.metrics = {
+                name: MetricAggregate.from_dict(agg)
+                for name, agg in data.items()
+            }
+        return aggregates
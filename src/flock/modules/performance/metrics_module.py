@@ -4,16 +4,28 @@ import json
 import os
 import time
 from collections import defaultdict
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any, Literal
 
-import numpy as np
 import psutil
 from pydantic import BaseModel, Field, validator
 
 from flock.core.context.context import FlockContext
 from flock.core.flock_agent import FlockAgent
 from flock.core.flock_module import FlockModule, FlockModuleConfig
+from flock.core.util.prometheus_metrics import get_prometheus_metrics
+from flock.core.util.token_usage import (
+    TokenUsage,
+    count_tokens,
+    get_last_token_usage,
+)
+from flock.modules.performance.aggregates import MetricAggregates
+from flock.modules.performance.metrics_store import SqliteMetricsStore
+
+# Rolling aggregates of all metrics, kept next to the raw metric files
+AGGREGATES_FILE = "aggregates.json"
+# Database of the "sqlite" storage type inside metrics_dir
+METRICS_DB_FILE = "metrics.db"
 
 
 class MetricPoint(BaseModel):
@@ -40,7 +52,7 @@ class MetricsModuleConfig(FlockModuleConfig):
     collect_cpu: bool = Field(default=True, description="Collect CPU usage")
 
     # Storage settings
-    storage_type: Literal["json", "prometheus", "memory"] = Field(
+    storage_type: Literal["json", "sqlite", "prometheus", "memory"] = Field(
         default="json", description="Where to store metrics"
     )
     metrics_dir: str = Field(
@@ -52,6 +64,14 @@ class MetricsModuleConfig(FlockModuleConfig):
         default="1h", description="Interval for metric aggregation"
     )
     retention_days: int = Field(default=30, description="Days to keep metrics")
+    raw_retention_days: float = Field(
+        default=1,
+        description="Days to keep raw points (sqlite); older data is kept "
+        "only as aggregation_interval rollups",
+    )
+    write_batch_size: int = Field(
+        default=100, description="Points written per batch (sqlite)"
+    )
 
     # Alerting settings
     alert_on_high_latency: bool = Field(
@@ -85,38 +105,58 @@ class MetricsModule(FlockModule):
         self._start_memory: int | None = None
 
         # Set up storage
+        self._aggregates = MetricAggregates()
+        self._store: SqliteMetricsStore | None = None
         if self.config.storage_type == "json":
             os.makedirs(self.config.metrics_dir, exist_ok=True)
+            self._prune_metric_files()
+            self._aggregates = self._load_aggregates()
+        elif self.config.storage_type == "sqlite":
+            os.makedirs(self.config.metrics_dir, exist_ok=True)
+            self._store = SqliteMetricsStore(
+                os.path.join(self.config.metrics_dir, METRICS_DB_FILE),
+                aggregation_interval=self.config.aggregation_interval,
+                retention_days=self.config.retention_days,
+                raw_retention_days=self.config.raw_retention_days,
+                batch_size=self.config.write_batch_size,
+            )
+            self._aggregates = self._load_aggregates()
 
-        # Set up prometheus if needed
+        # Prometheus uses the process-wide instruments served at /metrics
         if self.config.storage_type == "prometheus":
-            try:
-                from prometheus_client import Counter, Gauge, Histogram
-
-                self._prom_latency = Histogram(
-                    "flock_agent_latency_seconds",
-                    "Time taken for agent evaluation",
-                    ["agent_name"],
-                )
-                self._prom_memory = Gauge(
-                    "flock_agent_memory_bytes",
-                    "Memory usage by agent",
-                    ["agent_name"],
-                )
-                self._prom_tokens = Counter(
-                    "flock_agent_tokens_total",
-                    "Token usage by agent",
-                    ["agent_name", "type"],
-                )
-                self._prom_errors = Counter(
-                    "flock_agent_errors_total",
-                    "Error count by agent",
-                    ["agent_name", "error_type"],
-                )
-            except ImportError:
+            self._prom = get_prometheus_metrics()
+            if self._prom is None:
                 self.config.storage_type = "json"
 
-    """Fixes for metrics summary calculation."""
+    @property
+    def _aggregates_path(self) -> str:
+        return os.path.join(self.config.metrics_dir, AGGREGATES_FILE)
+
+    def _prune_metric_files(self) -> None:
+        """Deletes monthly JSON metric files older than retention_days."""
+        cutoff = datetime.now() - timedelta(days=self.config.retention_days)
+        for filename in os.listdir(self.config.metrics_dir):
+            month = filename.removesuffix(".json").rsplit("_", 1)[-1]
+            if not filename.endswith(".json") or len(month) != 6:
+                continue
+            try:
+                start = datetime.strptime(month, "%Y%m")
+            except ValueError:
+                continue
+            month_end = (start + timedelta(days=32)).replace(day=1)
+            if month_end < cutoff:
+                os.remove(os.path.join(self.config.metrics_dir, filename))
+
+    def _load_aggregates(self) -> MetricAggregates:
+        """Loads persisted aggregates, building them once from old files."""
+        if os.path.exists(self._aggregates_path):
+            return MetricAggregates.load(self._aggregates_path)
+        aggregates = MetricAggregates()
+        for name, points in self._load_metrics_from_files().items():
+            for point in points:
+                if isinstance(point.value, int | float):
+                    aggregates.add(name, point.value)
+        return aggregates
 
     def _load_metrics_from_files(
         self, metric_name: str = None
@@ -129,7 +169,9 @@ class MetricsModule(FlockModule):
             files = [
                 f
                 for f in os.listdir(self.config.metrics_dir)
-                if f.endswith(".json") and not f.startswith("summary_")
+                if f.endswith(".json")
+                and not f.startswith("summary_")
+                and f != AGGREGATES_FILE
             ]
 
             # Filter by metric name if specified
@@ -168,6 +210,15 @@ class MetricsModule(FlockModule):
         end_time: datetime | None = None,
     ) -> dict[str, list[MetricPoint]]:
         """Get recorded metrics with optional filtering."""
+        if self._store is not None:
+            # Range query on the (name, timestamp) index, no full scan
+            return {
+                name: [MetricPoint(**point) for point in points]
+                for name, points in self._store.query_points(
+                    metric_name, start_time, end_time
+                ).items()
+            }
+
         # Get metrics from appropriate source
         if self.config.storage_type == "json":
             metrics = self._load_metrics_from_files(metric_name)
@@ -191,36 +242,31 @@ class MetricsModule(FlockModule):
 
         return dict(metrics)
 
+    def get_rollups(
+        self,
+        metric_name: str | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Per-interval count/sum/mean/min/max of numeric metrics.
+
+        Rollups are kept for retention_days, also after the raw points
+        have been removed. Requires storage_type "sqlite".
+        """
+        if self._store is None:
+            raise ValueError("Metric rollups require storage_type='sqlite'.")
+        return self._store.query_rollups(metric_name, start_time, end_time)
+
     def get_statistics(
         self, metric_name: str, percentiles: list[float] = [50, 90, 95, 99]
     ) -> dict[str, float]:
-        """Calculate statistics for a metric."""
-        # Get all points for this metric
-        metrics = self.get_metrics(metric_name=metric_name)
-        points = metrics.get(metric_name, [])
+        """Calculate statistics for a metric.
 
-        if not points:
-            return {}
-
-        values = [p.value for p in points if isinstance(p.value, (int, float))]
-        if not values:
-            return {}
-
-        stats = {
-            "min": min(values),
-            "max": max(values),
-            "mean": float(
-                np.mean(values)
-            ),  # Convert to float for JSON serialization
-            "std": float(np.std(values)),
-            "count": len(values),
-            "last_value": values[-1],
-        }
-
-        for p in percentiles:
-            stats[f"p{p}"] = float(np.percentile(values, p))
-
-        return stats
+        Served from rolling aggregates updated on every point, so the cost
+        does not grow with the metric history. Percentiles are estimated
+        within 1% relative error.
+        """
+        return self._aggregates.statistics(metric_name, percentiles)
 
     async def terminate(
         self,
@@ -230,12 +276,15 @@ class MetricsModule(FlockModule):
         context: FlockContext | None = None,
     ) -> None:
         """Clean up and final metric recording."""
-        if self.config.storage_type == "json":
-            # Save aggregated metrics
+        if self._store is not None:
+            self._store.flush()
+        if self.config.storage_type in ("json", "sqlite"):
+            self._aggregates.save(self._aggregates_path)
+
+            # Latest summary per agent, overwritten on every run
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             summary_file = os.path.join(
-                self.config.metrics_dir,
-                f"summary_{agent.name}_{timestamp}.json",
+                self.config.metrics_dir, f"summary_{agent.name}.json"
             )
 
             # Calculate summary for all metrics
@@ -245,10 +294,7 @@ class MetricsModule(FlockModule):
                 "metrics": {},
             }
 
-            # Get all unique metric names from files
-            all_metrics = self._load_metrics_from_files()
-
-            for metric_name in all_metrics.keys():
+            for metric_name in self._aggregates.metrics:
                 stats = self.get_statistics(metric_name)
                 if stats:  # Only include metrics that have data
                     summary["metrics"][metric_name] = stats
@@ -264,21 +310,29 @@ class MetricsModule(FlockModule):
             timestamp=datetime.now(), value=value, tags=tags or {}
         )
 
+        if isinstance(value, int | float) and not isinstance(value, bool):
+            self._aggregates.add(name, value)
+
         # Store metric
         if self.config.storage_type == "memory":
             self._metrics[name].append(point)
 
         elif self.config.storage_type == "prometheus":
-            if name == "latency":
-                self._prom_latency.labels(**tags).observe(value)
-            elif name == "memory":
-                self._prom_memory.labels(**tags).set(value)
+            # Latency and errors are recorded for every run by FlockAgent
+            agent_name = point.tags.get("agent", "")
+            if name == "memory" and point.tags.get("phase") == "start":
+                self._prom.agent_memory.labels(agent_name=agent_name).set(value)
             elif name == "tokens":
-                self._prom_tokens.labels(**tags).inc(value)
+                self._prom.agent_tokens.labels(
+                    agent_name=agent_name, type=point.tags.get("type", "")
+                ).inc(value)
 
         elif self.config.storage_type == "json":
             self._save_metric_to_file(name, point)
 
+        elif self._store is not None:
+            self._store.add(name, point.timestamp, point.value, point.tags)
+
     def _save_metric_to_file(self, name: str, point: MetricPoint) -> None:
         """Save metric to JSON file."""
         filename = f"{name}_{point.timestamp.strftime('%Y%m')}.json"
@@ -294,41 +348,6 @@ class MetricsModule(FlockModule):
         with open(filepath, "a") as f:
             f.write(json.dumps(data) + "\n")
 
-    def _get_tokenizer(self, model: str):
-        """Get the appropriate tokenizer for the model."""
-        try:
-            import tiktoken
-
-            # Handle different model naming conventions
-            if model.startswith("openai/"):
-                model = model[7:]  # Strip 'openai/' prefix
-
-            try:
-                return tiktoken.encoding_for_model(model)
-            except KeyError:
-                # Fallback to cl100k_base for unknown models
-                return tiktoken.get_encoding("cl100k_base")
-
-        except ImportError:
-            return None
-
-    def _calculate_token_usage(self, text: str, model: str = "gpt-4") -> int:
-        """Calculate token count using tiktoken when available."""
-        tokenizer = self._get_tokenizer(model)
-
-        if tokenizer:
-            # Use tiktoken for accurate count
-            return len(tokenizer.encode(text))
-        else:
-            # Fallback to estimation if tiktoken not available
-            # Simple estimation - words / 0.75 for average tokens per word
-            token_estimate = int(len(text.split()) / 0.75)
-
-            # Log warning about estimation
-            print(
-                f"Warning: Using estimated token count. Install tiktoken for accurate counting."
-            )
-
     def _should_alert(self, metric: str, value: float) -> bool:
         """Check if metric should trigger alert."""
         if metric == "latency" and self.config.alert_on_high_latency:
@@ -353,29 +372,45 @@ class MetricsModule(FlockModule):
             )
 
     def _calculate_cost(
-        self, text: str, model: str, is_completion: bool = False
-    ) -> tuple[int, float]:
-        """Calculate both token count and cost."""
-        # Get token count
+        self, model: str | None, prompt_tokens: int, completion_tokens: int
+    ) -> tuple[float, float]:
+        """Prompt and completion cost in USD (0 for unknown models)."""
         try:
             from litellm import cost_per_token
 
-            token_count = self._calculate_token_usage(text, model)
-            # Calculate total cost
-            if is_completion:
-                total_cost = token_count * cost_per_token(
-                    model, completion_tokens=token_count
-                )
-            else:
-                total_cost = token_count * cost_per_token(
-                    model, prompt_tokens=token_count
-                )
-
-            return token_count, total_cost
+            return cost_per_token(
+                model,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+            )
         except Exception:
-            token_count = 0
-            total_cost = 0.0
-            return token_count, total_cost
+            return 0.0, 0.0
+
+    def _token_usage(
+        self,
+        agent: FlockAgent,
+        inputs: dict[str, Any],
+        result: dict[str, Any],
+        context: FlockContext | None,
+    ) -> TokenUsage:
+        """Provider-reported usage of the evaluation, else an estimate.
+
+        Read from the run's context, where the evaluator records it, so
+        concurrent runs of the same agent never see each other's usage.
+        """
+        if context is not None:
+            usage = get_last_token_usage(context, agent.name)
+            if usage is not None:
+                return usage
+        return TokenUsage(
+            prompt_tokens=sum(
+                count_tokens(str(v), agent.model) for v in inputs.values()
+            ),
+            completion_tokens=sum(
+                count_tokens(str(v), agent.model) for v in result.values()
+            ),
+            estimated=True,
+        )
 
     async def pre_evaluate(
         self,
@@ -384,30 +419,6 @@ class MetricsModule(FlockModule):
         context: FlockContext | None = None,
     ) -> dict[str, Any]:
         """Record pre-evaluation metrics."""
-        if self.config.collect_token_usage:
-            # Calculate input tokens and cost
-            total_input_tokens = 0
-            total_input_cost = 0.0
-
-            for v in inputs.values():
-                tokens, cost = self._calculate_cost(
-                    str(v), agent.model, is_completion=False
-                )
-                total_input_tokens += tokens
-                if isinstance(cost, float):
-                    total_input_cost += cost
-                else:
-                    total_input_cost += cost[1]
-
-            self._record_metric(
-                "tokens",
-                total_input_tokens,
-                {"agent": agent.name, "type": "input"},
-            )
-            self._record_metric(
-                "cost", total_input_cost, {"agent": agent.name, "type": "input"}
-            )
-
         if self.config.collect_cpu:
             cpu_percent = psutil.Process().cpu_percent()
             self._record_metric(
@@ -436,35 +447,22 @@ class MetricsModule(FlockModule):
                 print(f"ALERT: High latency detected: {latency * 1000:.2f}ms")
 
         if self.config.collect_token_usage:
-            # Calculate output tokens and cost
-            total_output_tokens = 0
-            total_output_cost = 0.0
-
-            for v in result.values():
-                tokens, cost = self._calculate_cost(
-                    str(v), agent.model, is_completion=True
-                )
-                total_output_tokens += tokens
-                if isinstance(cost, float):
-                    total_output_cost += cost
-                else:
-                    total_output_cost += cost[1]
-
-            self._record_metric(
-                "tokens",
-                total_output_tokens,
-                {"agent": agent.name, "type": "output"},
+            usage = self._token_usage(agent, inputs, result, context)
+            input_cost, output_cost = self._calculate_cost(
+                agent.model, usage.prompt_tokens, usage.completion_tokens
             )
-            self._record_metric(
-                "cost",
-                total_output_cost,
-                {"agent": agent.name, "type": "output"},
-            )
-
-            # Record total cost for this operation
+            for token_type, tokens, cost in (
+                ("input", usage.prompt_tokens, input_cost),
+                ("output", usage.completion_tokens, output_cost),
+            ):
+                tags = {"agent": agent.name, "type": token_type}
+                self._record_metric("tokens", tokens, tags)
+                self._record_metric("cost", cost, tags)
+
+            # Provider-reported cost when available
             self._record_metric(
                 "total_cost",
-                total_output_cost + total_output_cost,
+                usage.cost or input_cost + output_cost,
                 {"agent": agent.name},
             )
 
@@ -0,0 +1,278 @@
+"""SQLite time-series backend for MetricsModule.
+
+Points are buffered and written in batches. Every numeric point is also
+folded into per-interval rollups (count/sum/min/max per metric, tag set and
+`aggregation_interval` bucket) at write time, so raw points can be dropped
+after `raw_retention_days` while long-range history stays queryable at
+interval resolution until `retention_days`.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Any
+
+INTERVAL_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+SECONDS_PER_DAY = 86400
+# Retention is enforced at most this often while flushing
+PRUNE_INTERVAL_SECONDS = 3600
+
+
+def parse_interval(interval: str) -> float:
+    """Converts an interval such as "30s", "5m", "1h" or "1d" to seconds."""
+    try:
+        return float(interval[:-1]) * INTERVAL_UNITS[interval[-1]]
+    except (KeyError, ValueError, IndexError) as e:
+        raise ValueError(f"Invalid interval: {interval!r}") from e
+
+
+class SqliteMetricsStore:
+    """Raw metric points plus interval rollups in one SQLite database."""
+
+    def __init__(
+        self,
+        db_path: str,
+        aggregation_interval: str = "1h",
+        retention_days: float | None = 30,
+        raw_retention_days: float | None = 1,
+        batch_size: int = 100,
+        flush_interval_seconds: float = 5.0,
+    ):
+        """Opens (or creates) the database.
+
+        Args:
+            db_path: Path to the SQLite database file.
+            aggregation_interval: Width of rollup buckets (e.g. "1h").
+            retention_days: Delete rollups (and raw points) older than this.
+            raw_retention_days: Delete raw points older than this; only
+                rollups remain for older data.
+            batch_size: Flush once this many points are buffered.
+            flush_interval_seconds: Flush buffered points at least this
+                often (checked when a point is added).
+        """
+        self.db_path = db_path
+        self.interval_seconds = parse_interval(aggregation_interval)
+        self.retention_days = retention_days
+        self.raw_retention_days = raw_retention_days
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self._buffer: list[tuple[str, float, Any, str]] = []
+        self._last_flush = time.monotonic()
+        self._last_prune = 0.0
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._initialize_database()
+
+    def _initialize_database(self) -> None:
+        with self._lock:
+            self.conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS metric_points (
+                    name TEXT NOT NULL,
+                    timestamp REAL NOT NULL,
+                    value,
+                    tags TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_metric_points_name_time
+                    ON metric_points (name, timestamp);
+                CREATE TABLE IF NOT EXISTS metric_rollups (
+                    name TEXT NOT NULL,
+                    bucket_start REAL NOT NULL,
+                    tags TEXT NOT NULL,
+                    count INTEGER NOT NULL,
+                    sum REAL NOT NULL,
+                    min REAL NOT NULL,
+                    max REAL NOT NULL,
+                    PRIMARY KEY (name, bucket_start, tags)
+                );
+                """
+            )
+            self.conn.commit()
+
+    def add(
+        self,
+        name: str,
+        timestamp: datetime,
+        value: int | float | str,
+        tags: dict[str, str] | None = None,
+    ) -> None:
+        """Buffers one point; flushes when the batch is full or due."""
+        tags_json = json.dumps(tags or {}, sort_keys=True)
+        with self._lock:
+            self._buffer.append((name, timestamp.timestamp(), value, tags_json))
+            due = (
+                len(self._buffer) >= self.batch_size
+                or time.monotonic() - self._last_flush
+                >= self.flush_interval_seconds
+            )
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes buffered points and their rollups in one transaction."""
+        with self._lock:
+            points, self._buffer = self._buffer, []
+            self._last_flush = time.monotonic()
+            if points:
+                self._write(points)
+            prune_due = time.monotonic() - self._last_prune
+        if prune_due >= PRUNE_INTERVAL_SECONDS:
+            self.prune()
+
+    def _write(self, points: list[tuple[str, float, Any, str]]) -> None:
+        rollups: dict[tuple[str, float, str], list[float]] = {}
+        for name, timestamp, value, tags in points:
+            if isinstance(value, bool) or not isinstance(value, int | float):
+                continue
+            bucket = timestamp - timestamp % self.interval_seconds
+            rollup = rollups.get((name, bucket, tags))
+            if rollup is None:
+                rollups[(name, bucket, tags)] = [1, value, value, value]
+            else:
+                rollup[0] += 1
+                rollup[1] += value
+                rollup[2] = min(rollup[2], value)
+                rollup[3] = max(rollup[3], value)
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO metric_points (name, timestamp, value, tags) "
+                "VALUES (?, ?, ?, ?)",
+                points,
+            )
+            self.conn.executemany(
+                """
+                INSERT INTO metric_rollups
+                    (name, bucket_start, tags, count, sum, min, max)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (name, bucket_start, tags) DO UPDATE SET
+                    count = count + excluded.count,
+                    sum = sum + excluded.sum,
+                    min = MIN(min, excluded.min),
+                    max = MAX(max, excluded.max)
+                """,
+                [(*key, *values) for key, values in rollups.items()],
+            )
+
+    def prune(self) -> tuple[int, int]:
+        """Applies retention.
+
+        Returns:
+            The number of raw points and rollup buckets deleted.
+        """
+        now = time.time()
+        deleted_points = deleted_rollups = 0
+        with self._lock, self.conn:
+            self._last_prune = time.monotonic()
+            raw_days = min(
+                (
+                    d
+                    for d in (self.raw_retention_days, self.retention_days)
+                    if d
+                ),
+                default=None,
+            )
+            if raw_days:
+                deleted_points = self.conn.execute(
+                    "DELETE FROM metric_points WHERE timestamp < ?",
+                    (now - raw_days * SECONDS_PER_DAY,),
+                ).rowcount
+            if self.retention_days:
+                deleted_rollups = self.conn.execute(
+                    "DELETE FROM metric_rollups WHERE bucket_start < ?",
+                    (now - self.retention_days * SECONDS_PER_DAY,),
+                ).rowcount
+        return deleted_points, deleted_rollups
+
+    def _time_filter(
+        self,
+        column: str,
+        name: str | None,
+        start_time: datetime | None,
+        end_time: datetime | None,
+    ) -> tuple[str, list[Any]]:
+        clauses, params = [], []
+        if name is not None:
+            clauses.append("name = ?")
+            params.append(name)
+        if start_time is not None:
+            clauses.append(f"{column} >= ?")
+            params.append(start_time.timestamp())
+        if end_time is not None:
+            clauses.append(f"{column} <= ?")
+            params.append(end_time.timestamp())
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    def query_points(
+        self,
+        name: str | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Raw points in a time range, grouped by metric name.
+
+        Uses the (name, timestamp) index, so only the requested range is
+        read. Buffered points are flushed first.
+        """
+        self.flush()
+        where, params = self._time_filter(
+            "timestamp", name, start_time, end_time
+        )
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT name, timestamp, value, tags FROM metric_points"
+                f"{where} ORDER BY name, timestamp",
+                params,
+            ).fetchall()
+        points: dict[str, list[dict[str, Any]]] = {}
+        for metric, timestamp, value, tags in rows:
+            points.setdefault(metric, []).append(
+                {
+                    "timestamp": datetime.fromtimestamp(timestamp),
+                    "value": value,
+                    "tags": json.loads(tags),
+                }
+            )
+        return points
+
+    def query_rollups(
+        self,
+        name: str | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Interval aggregates (count/sum/mean/min/max) in a time range."""
+        self.flush()
+        where, params = self._time_filter(
+            "bucket_start", name, start_time, end_time
+        )
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT name, bucket_start, tags, count, sum, min, max "
+                f"FROM metric_rollups{where} ORDER BY name, bucket_start",
+                params,
+            ).fetchall()
+        rollups: dict[str, list[dict[str, Any]]] = {}
+        for metric, bucket, tags, count, total, low, high in rows:
+            rollups.setdefault(metric, []).append(
+                {
+                    "bucket_start": datetime.fromtimestamp(bucket),
+                    "tags": json.loads(tags),
+                    "count": count,
+                    "sum": total,
+                    "mean": total / count,
+                    "min": low,
+                    "max": high,
+                }
+            )
+        return rollups
+
+    def close(self) -> None:
+        """Flushes buffered points and closes the database."""
+        self.flush()
+        with self._lock:
+            self.conn.close()
@@ -13,6 +13,7 @@ from flock.core.flock_router import (
     HandOffRequest,
 )
 from flock.core.logging.logging import get_logger
+from flock.core.util.rate_limiter import estimate_tokens, get_rate_limiter
 
 logger = get_logger("llm_router")
 
@@ -201,6 +202,14 @@ class LLMRouter(FlockRouter):
                 model=current_agent.model,
                 temperature=self.config.temperature,
             )
+            max_tokens = (
+                self.config.max_tokens
+                if isinstance(self.config, LLMRouterConfig)
+                else 500
+            )
+            await get_rate_limiter().acquire(
+                current_agent.model, estimate_tokens(prompt) + max_tokens
+            )
             # Call the LLM to get the next agent
             response = await litellm.acompletion(
                 model=current_agent.model,
@@ -208,9 +217,7 @@ class LLMRouter(FlockRouter):
                 temperature=self.config.temperature
                 if isinstance(self.config, LLMRouterConfig)
                 else 0.2,
-                max_tokens=self.config.max_tokens
-                if isinstance(self.config, LLMRouterConfig)
-                else 500,
+                max_tokens=max_tokens,
             )
 
             content = response.choices[0].message.content
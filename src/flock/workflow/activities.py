@@ -1,5 +1,6 @@
 """Defines Temporal activities for running a chain of agents with logging and tracing."""
 
+import time
 from datetime import datetime
 
 from opentelemetry import trace
@@ -11,7 +12,17 @@ from flock.core.flock_agent import FlockAgent
 from flock.core.flock_registry import get_registry
 from flock.core.flock_router import HandOffRequest
 from flock.core.logging.logging import get_logger
+from flock.core.logging.span_attributes import (
+    payload_attributes,
+    payload_scope,
+    set_payload_attribute,
+)
+from flock.core.logging.telemetry_metrics import (
+    record_router_decision,
+    timed_hop,
+)
 from flock.core.util.input_resolver import resolve_inputs
+from flock.core.util.profiler import get_profiler
 
 logger = get_logger("activities")
 tracer = trace.get_tracer(__name__)
@@ -27,6 +38,7 @@ async def run_agent(context: FlockContext) -> dict:
     # Start a top-level span for the entire run_agent activity.
     with tracer.start_as_current_span("run_agent") as span:
         registry = get_registry()
+        profiler = get_profiler()
         previous_agent_name = ""
         if isinstance(context, dict):
             context = FlockContext.from_dict(context)
@@ -48,23 +60,31 @@ async def run_agent(context: FlockContext) -> dict:
         # Loop over agents in the chain.
         while agent:
             # Create a nested span for this iteration.
-            with tracer.start_as_current_span("agent_iteration") as iter_span:
+            with (
+                payload_scope(),
+                tracer.start_as_current_span("agent_iteration") as iter_span,
+                timed_hop(agent.name),
+            ):
                 iter_span.set_attribute("agent.name", agent.name)
                 agent.context = context
                 # Resolve inputs for the agent.
-                agent_inputs = resolve_inputs(
-                    agent.input, context, previous_agent_name
-                )
-                iter_span.add_event(
-                    "resolved inputs", attributes={"inputs": str(agent_inputs)}
-                )
+                with profiler.phase(agent.name, "hop.resolve_inputs"):
+                    agent_inputs = resolve_inputs(
+                        agent.input, context, previous_agent_name
+                    )
+                if iter_span.is_recording():
+                    iter_span.add_event(
+                        "resolved inputs",
+                        attributes=payload_attributes("inputs", agent_inputs),
+                    )
 
                 # Execute the agent with its own span.
                 with tracer.start_as_current_span("execute_agent") as exec_span:
                     logger.info("Executing agent", agent=agent.name)
                     try:
-                        result = await agent.run_async(agent_inputs)
-                        exec_span.set_attribute("result", str(result))
+                        with profiler.phase(agent.name, "hop.execute"):
+                            result = await agent.run_async(agent_inputs)
+                        set_payload_attribute(exec_span, "result", result)
                         logger.debug(
                             "Agent execution completed", agent=agent.name
                         )
@@ -87,9 +107,10 @@ async def run_agent(context: FlockContext) -> dict:
                     )
                     try:
                         # Route to the next agent
-                        handoff_data = await agent.handoff_router.route(
-                            agent, result, context
-                        )
+                        with profiler.phase(agent.name, "hop.routing"):
+                            handoff_data = await agent.handoff_router.route(
+                                agent, result, context
+                            )
 
                         if callable(handoff_data):
                             logger.debug(
@@ -116,6 +137,11 @@ async def run_agent(context: FlockContext) -> dict:
                                 handoff_data.next_agent.name
                             )
 
+                        record_router_decision(
+                            type(agent.handoff_router).__name__,
+                            agent.name,
+                            handoff_data.next_agent,
+                        )
                         if not handoff_data.next_agent:
                             logger.info(
                                 "Router found no suitable next agent",
@@ -155,6 +181,7 @@ async def run_agent(context: FlockContext) -> dict:
                     iter_span.add_event("chain completed")
                     return result
 
+                handoff_start = time.perf_counter_ns()
                 # Record the agent run in the context.
                 context.record(
                     agent.name,
@@ -189,6 +216,11 @@ async def run_agent(context: FlockContext) -> dict:
                         }
 
                     context.set_variable(FLOCK_CURRENT_AGENT, agent.name)
+                    profiler.record(
+                        previous_agent_name,
+                        "hop.handoff",
+                        time.perf_counter_ns() - handoff_start,
+                    )
 
                     logger.info("Handing off to next agent", next=agent.name)
                     iter_span.set_attribute("next.agent", agent.name)
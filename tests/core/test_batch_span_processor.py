@@ -0,0 +1,80 @@
+# tests/core/test_batch_span_processor.py
+import threading
+
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+
+from flock.core.logging.span_middleware.batch_span_processor import (
+    QueuedBatchSpanProcessor,
+)
+
+
+class RecordingExporter(SpanExporter):
+    def __init__(self):
+        self.batches = []
+        self.exported = threading.Event()
+
+    def export(self, spans):
+        self.batches.append([span.name for span in spans])
+        self.exported.set()
+        return SpanExportResult.SUCCESS
+
+    def shutdown(self):
+        pass
+
+
+def end_spans(processor, names):
+    provider = TracerProvider()
+    provider.add_span_processor(processor)
+    tracer = provider.get_tracer("test")
+    for name in names:
+        tracer.start_span(name).end()
+
+
+def test_spans_are_exported_in_batches_on_flush():
+    exporter = RecordingExporter()
+    processor = QueuedBatchSpanProcessor(
+        exporter, schedule_delay_millis=60_000, max_export_batch_size=2
+    )
+    end_spans(processor, ["a", "b", "c"])
+    processor.force_flush()
+    assert [name for batch in exporter.batches for name in batch] == [
+        "a",
+        "b",
+        "c",
+    ]
+    assert all(len(batch) <= 2 for batch in exporter.batches)
+    assert processor.stats["exported"] == 3
+    processor.shutdown()
+
+
+def test_full_queue_drops_and_counts_spans():
+    newest = RecordingExporter()
+    processor = QueuedBatchSpanProcessor(
+        newest, max_queue_size=2, schedule_delay_millis=60_000
+    )
+    end_spans(processor, ["a", "b", "c", "d"])
+    processor.shutdown()
+    assert newest.batches == [["a", "b"]]
+    assert processor.stats["dropped"] == 2
+
+    oldest = RecordingExporter()
+    processor = QueuedBatchSpanProcessor(
+        oldest,
+        max_queue_size=2,
+        schedule_delay_millis=60_000,
+        drop_policy="drop_oldest",
+    )
+    end_spans(processor, ["a", "b", "c", "d"])
+    processor.shutdown()
+    assert oldest.batches == [["c", "d"]]
+    assert processor.stats["dropped"] == 2
+
+
+def test_background_thread_exports_after_delay():
+    exporter = RecordingExporter()
+    processor = QueuedBatchSpanProcessor(exporter, schedule_delay_millis=50)
+    end_spans(processor, ["a"])
+    assert exporter.exported.wait(timeout=5)
+    assert exporter.batches == [["a"]]
+    processor.shutdown()
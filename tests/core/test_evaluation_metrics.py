@@ -0,0 +1,432 @@
+# tests/core/test_evaluation_metrics.py
+import pytest
+
+from flock.core import Flock, FlockFactory
+from flock.core.evaluation.utils import (
+    JudgmentCache,
+    MetricRegistry,
+    calculate_batch_metrics,
+)
+from flock.core.flock_registry import get_registry
+from flock.evaluators.test.test_case_evaluator import (
+    TestCaseEvaluator,
+    TestCaseEvaluatorConfig,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_registry():
+    """Fixture to ensure a clean registry for each test."""
+    registry = get_registry()
+    registry._initialize()
+    yield
+    registry._initialize()
+
+
+def test_metric_registry_creates_resources_once():
+    registry = MetricRegistry()
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return object()
+
+    first = registry.get_resource("model", factory)
+    second = registry.get_resource("model", factory)
+    assert first is second
+    assert len(calls) == 1
+    assert registry.get_function("exact_match") is registry.get_function(
+        "exact_match"
+    )
+
+
+def test_calculate_batch_metrics_column_wise():
+    results = calculate_batch_metrics(
+        metric_names=["exact_match", "fuzzy_match_missing"],
+        metric_configs={},
+        predicted_answers=[
+            {"exact_match": "a"},
+            {"exact_match": "b "},
+            {"exact_match": "c"},
+        ],
+        expected_answers=[
+            {"exact_match": "a"},
+            {"exact_match": "b"},
+            {"exact_match": "x"},
+        ],
+        registry=MetricRegistry(),
+    )
+    assert [r["exact_match"] for r in results] == [True, True, False]
+    assert all(r["fuzzy_match_missing"] is None for r in results)
+
+
+def test_calculate_batch_metrics_isolates_item_errors():
+    registry = MetricRegistry()
+
+    def strict_match(pred, act, **kw):
+        if pred is None:
+            raise ValueError("missing prediction")
+        return pred == act
+
+    registry._functions["exact_match"] = strict_match
+    results = calculate_batch_metrics(
+        metric_names=["exact_match"],
+        metric_configs={},
+        predicted_answers=[{"exact_match": "a"}, {"exact_match": None}],
+        expected_answers=[{"exact_match": "a"}, {"exact_match": "b"}],
+        registry=registry,
+    )
+    assert results[0]["exact_match"] is True
+    assert results[1]["exact_match"] == "[Error: missing prediction]"
+
+
+def test_evaluate_computes_string_metrics_after_runs():
+    flock = Flock(
+        name="eval_flock",
+        model="test-model",
+        enable_logging=False,
+        show_flock_banner=False,
+    )
+    agent = FlockFactory.create_default_agent(
+        name="agent1", input="query", output="exact_match"
+    )
+    agent.evaluator = TestCaseEvaluator(
+        name="test_case_evaluator", config=TestCaseEvaluatorConfig()
+    )
+    flock.add_agent(agent)
+
+    results = flock.evaluate(
+        dataset=[
+            {"q": "one", "truth": "Test Result"},
+            {"q": "two", "truth": "something else"},
+        ],
+        start_agent="agent1",
+        input_mapping={"q": "query"},
+        answer_mapping={"exact_match": "truth"},
+        metrics=["exact_match"],
+        return_dataframe=False,
+    )
+    assert [r["metrics"]["exact_match"] for r in results] == [True, False]
+
+
+def test_evaluate_runs_judge_metrics_with_cache():
+    flock = Flock(
+        name="eval_flock",
+        model="test-model",
+        enable_logging=False,
+        show_flock_banner=False,
+    )
+    agent = FlockFactory.create_default_agent(
+        name="agent1", input="query", output="answer"
+    )
+    agent.evaluator = TestCaseEvaluator(
+        name="test_case_evaluator", config=TestCaseEvaluatorConfig()
+    )
+    flock.add_agent(agent)
+    judge = TestCaseEvaluator(name="judge", config=TestCaseEvaluatorConfig())
+    cache = JudgmentCache()
+
+    results = flock.evaluate(
+        dataset=[
+            {"q": "one", "truth": "same"},
+            {"q": "two", "truth": "same"},
+            {"q": "three", "truth": "other"},
+        ],
+        start_agent="agent1",
+        input_mapping={"q": "query"},
+        answer_mapping={"answer": "truth"},
+        metrics=[judge],
+        return_dataframe=False,
+        judge_cache=cache,
+    )
+    assert [r["metrics"]["judge_score"] for r in results] == ["Test Result"] * 3
+    # Items one and two share (judge, prediction, reference)
+    assert cache.misses == 2
+    assert cache.hits == 1
+
+
+def test_evaluate_reuses_stored_outputs_for_unchanged_items(tmp_path):
+    flock = Flock(
+        name="eval_flock",
+        model="test-model",
+        enable_logging=False,
+        show_flock_banner=False,
+    )
+    agent = FlockFactory.create_default_agent(
+        name="agent1", input="query", output="exact_match"
+    )
+    agent.evaluator = TestCaseEvaluator(
+        name="test_case_evaluator", config=TestCaseEvaluatorConfig()
+    )
+    flock.add_agent(agent)
+    store_path = tmp_path / "eval_store.db"
+
+    def run(dataset):
+        return flock.evaluate(
+            dataset=dataset,
+            start_agent="agent1",
+            input_mapping={"q": "query"},
+            answer_mapping={"exact_match": "truth"},
+            metrics=["exact_match"],
+            return_dataframe=False,
+            result_store=store_path,
+        )
+
+    dataset = [
+        {"q": "one", "truth": "Test Result"},
+        {"q": "two", "truth": "other"},
+    ]
+    first = run(dataset)
+    assert [r["from_store"] for r in first] == [False, False]
+
+    second = run(dataset + [{"q": "three", "truth": "Test Result"}])
+    assert [r["from_store"] for r in second] == [True, True, False]
+    assert [r["metrics"]["exact_match"] for r in second] == [True, False, True]
+
+    # Changing the agent definition invalidates stored outputs
+    agent.description = "A different agent"
+    third = run(dataset)
+    assert [r["from_store"] for r in third] == [False, False]
+
+
+@pytest.mark.asyncio
+async def test_judgment_cache_evicts_least_recently_used():
+    cache = JudgmentCache(maxsize=2)
+
+    async def judge(value):
+        return value
+
+    await cache.get_or_compute("a", lambda: judge(1))
+    await cache.get_or_compute("b", lambda: judge(2))
+    assert await cache.get_or_compute("a", lambda: judge(0)) == 1
+    await cache.get_or_compute("c", lambda: judge(3))
+
+    assert list(cache._judgments) == ["a", "c"]
+    assert await cache.get_or_compute("b", lambda: judge(4)) == 4
+
+
+@pytest.mark.asyncio
+async def test_agent_fingerprint_ignores_evaluator_runtime_state():
+    import dspy
+    from dspy.utils.dummies import DummyLM
+
+    from flock.core.evaluation.result_store import agent_fingerprint
+    from flock.core.flock_agent import FlockAgent
+    from flock.evaluators.declarative.declarative_evaluator import (
+        DeclarativeEvaluator,
+        DeclarativeEvaluatorConfig,
+    )
+
+    flock = Flock(
+        name="eval_flock", enable_logging=False, show_flock_banner=False
+    )
+    agent = FlockAgent(
+        name="classifier",
+        input="text: str",
+        output="label: str",
+        evaluator=DeclarativeEvaluator(
+            name="default",
+            config=DeclarativeEvaluatorConfig(model="test-model"),
+        ),
+    )
+    flock.add_agent(agent)
+    before = agent_fingerprint(flock, "classifier")
+
+    with dspy.context(lm=DummyLM([{"label": "pos"}])):
+        await agent.evaluator.evaluate(agent, {"text": "good"}, [])
+    assert agent.evaluator.lm_history
+    assert agent_fingerprint(flock, "classifier") == before
+
+    agent.evaluator.config.temperature = 0.7
+    assert agent_fingerprint(flock, "classifier") != before
+
+
+def test_running_intervals_match_the_final_intervals():
+    import numpy as np
+
+    from flock.core.evaluation.utils import (
+        RunningIntervals,
+        check_confidence_intervals,
+    )
+
+    rng = np.random.default_rng(0)
+    items = [
+        {"metrics": {"correct": bool(i % 4), "score": float(x)}}
+        for i, x in enumerate(rng.normal(0.5, 0.1, size=400))
+    ]
+    items.append({"error": "boom", "metrics": {"correct": False}})
+    running = RunningIntervals()
+    for item in items:
+        running.add(item)
+
+    report = check_confidence_intervals(
+        items, target_half_width=0.05, rng=np.random.default_rng(0)
+    )
+    intervals = report["intervals"]
+    assert running.half_width("correct") == pytest.approx(
+        intervals["correct"]["half_width"]
+    )
+    assert running.half_width("score") == pytest.approx(
+        intervals["score"]["half_width"], rel=0.15
+    )
+    assert running.converged(0.05) == report["converged"] is True
+    assert not running.converged(0.001)
+
+
+def test_evaluate_stops_early_once_confidence_interval_is_narrow():
+    flock = Flock(
+        name="eval_flock",
+        model="test-model",
+        enable_logging=False,
+        show_flock_banner=False,
+    )
+    agent = FlockFactory.create_default_agent(
+        name="agent1", input="query", output="exact_match"
+    )
+    agent.evaluator = TestCaseEvaluator(
+        name="test_case_evaluator", config=TestCaseEvaluatorConfig()
+    )
+    flock.add_agent(agent)
+
+    # Every prediction is correct, so the Wilson interval narrows quickly
+    dataset = [{"q": f"item {i}", "truth": "Test Result"} for i in range(400)]
+    results = flock.evaluate(
+        dataset=dataset,
+        start_agent="agent1",
+        input_mapping={"q": "query"},
+        answer_mapping={"exact_match": "truth"},
+        metrics=["exact_match"],
+        max_workers=10,
+        early_stopping_ci_width=0.05,
+        early_stopping_min_items=20,
+        random_seed=42,
+    )
+    report = results.attrs["early_stopping"]
+    assert report["stopped_early"]
+    assert report["items_evaluated"] == len(results) < 400
+    assert report["intervals"]["exact_match"]["method"] == "wilson"
+    assert report["intervals"]["exact_match"]["half_width"] <= 0.05
+
+
+def test_iter_dataset_batches_projects_and_shards_parquet(tmp_path):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    from flock.core.evaluation.utils import iter_dataset_batches
+
+    path = tmp_path / "data.parquet"
+    table = pa.table(
+        {"q": [f"q{i}" for i in range(10)], "unused": list(range(10))}
+    )
+    pq.write_table(table, path, row_group_size=3)
+
+    shards = [
+        [
+            pair
+            for batch in iter_dataset_batches(
+                path, columns=["q"], batch_size=2, num_shards=2, shard_index=i
+            )
+            for pair in batch
+        ]
+        for i in range(2)
+    ]
+    positions = sorted(p for shard in shards for p, _ in shard)
+    assert positions == list(range(10))
+    assert all(set(row) == {"q"} for shard in shards for _, row in shard)
+
+    with pytest.raises(ValueError):
+        next(iter_dataset_batches(path, columns=["missing"]))
+
+
+def test_evaluate_streams_generator_dataset():
+    flock = Flock(
+        name="eval_flock",
+        model="test-model",
+        enable_logging=False,
+        show_flock_banner=False,
+    )
+    agent = FlockFactory.create_default_agent(
+        name="agent1", input="query", output="exact_match"
+    )
+    agent.evaluator = TestCaseEvaluator(
+        name="test_case_evaluator", config=TestCaseEvaluatorConfig()
+    )
+    flock.add_agent(agent)
+
+    rows = (
+        {"q": f"item {i}", "truth": "Test Result", "extra": i} for i in range(7)
+    )
+    results = flock.evaluate(
+        dataset=rows,
+        start_agent="agent1",
+        input_mapping={"q": "query"},
+        answer_mapping={"exact_match": "truth"},
+        metrics=["exact_match"],
+        return_dataframe=False,
+        streaming=True,
+        stream_batch_size=3,
+        num_shards=2,
+        shard_index=1,
+    )
+    assert [r["index"] for r in results] == [1, 3, 5]
+    assert all(r["metrics"]["exact_match"] for r in results)
+
+
+def test_evaluate_matrix_shares_dataset_across_variants(monkeypatch):
+    from flock.core.execution.evaluation_executor import EvaluationExecutor
+
+    load_calls = []
+    load_rows = EvaluationExecutor._load_rows
+
+    def counting_load_rows(self, dataset, columns):
+        load_calls.append(columns)
+        return load_rows(self, dataset, columns)
+
+    monkeypatch.setattr(EvaluationExecutor, "_load_rows", counting_load_rows)
+    flock = Flock(
+        name="eval_flock",
+        model="test-model",
+        enable_logging=False,
+        show_flock_banner=False,
+    )
+    agent = FlockFactory.create_default_agent(
+        name="agent1", input="query", output="exact_match"
+    )
+    agent.evaluator = TestCaseEvaluator(
+        name="test_case_evaluator", config=TestCaseEvaluatorConfig()
+    )
+    flock.add_agent(agent)
+
+    results = flock.evaluate_matrix(
+        dataset=[
+            {"q": "one", "truth": "Test Result"},
+            {"q": "two", "truth": "other"},
+        ],
+        variants={
+            "baseline": "agent1",
+            "other-model": {"agent": "agent1", "model": "other-model"},
+        },
+        input_mapping={"q": "query"},
+        answer_mapping={"exact_match": "truth"},
+        metrics=["exact_match"],
+        max_workers=2,
+    )
+    assert list(results["variant"]) == ["baseline"] * 2 + ["other-model"] * 2
+    assert len(load_calls) == 1
+    summary = results.attrs["variant_summary"]
+    assert summary["other-model"]["metrics_summary"]["exact_match"] == {
+        "accuracy": 0.5
+    }
+    # Temporary model variants are not left in the flock
+    assert list(flock.agents) == ["agent1"]
+    assert agent.model == "test-model"
+
+    # Variants given as a list must have distinct agent names
+    with pytest.raises(ValueError, match="unique names"):
+        flock.evaluate_matrix(
+            dataset=[{"q": "one", "truth": "Test Result"}],
+            variants=["agent1", agent],
+            input_mapping={"q": "query"},
+            answer_mapping={"exact_match": "truth"},
+            metrics=["exact_match"],
+        )
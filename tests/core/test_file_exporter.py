@@ -0,0 +1,76 @@
+# tests/core/test_file_exporter.py
+import time
+
+from opentelemetry.sdk.trace import TracerProvider
+
+from flock.core.logging.telemetry_exporter.file_exporter import (
+    FileSpanExporter,
+    read_spans,
+    span_segments,
+)
+
+
+def make_spans(names):
+    tracer = TracerProvider().get_tracer("test")
+    spans = []
+    for name in names:
+        span = tracer.start_span(name)
+        span.end()
+        spans.append(span)
+    return spans
+
+
+def test_rotated_segments_are_compressed_and_readable(tmp_path):
+    exporter = FileSpanExporter(str(tmp_path), max_bytes=1, compression="gzip")
+    exporter.export(make_spans(["first"]))
+    exporter.export(make_spans(["second"]))
+    exporter.export(make_spans(["third"]))
+    exporter.shutdown()
+
+    segments = span_segments(tmp_path)
+    assert len(segments) == 3
+    assert all(segment.suffix == ".gz" for segment in segments)
+    names = [span["name"] for span in read_spans(tmp_path)]
+    assert names == ["first", "second", "third"]
+    assert [s["name"] for s in read_spans(tmp_path, name="second")] == [
+        "second"
+    ]
+
+
+def test_buffered_file_is_flushed_and_segments_pruned(tmp_path):
+    exporter = FileSpanExporter(
+        str(tmp_path),
+        max_bytes=None,
+        compression=None,
+        max_segments=1,
+        flush_interval_seconds=3600,
+    )
+    exporter.export(make_spans(["a", "b"]))
+    exporter.force_flush()
+    assert [span["name"] for span in read_spans(tmp_path)] == ["a", "b"]
+
+    exporter.rotate()
+    exporter.export(make_spans(["c"]))
+    exporter.rotate()
+    exporter.shutdown()
+    assert [span["name"] for span in read_spans(tmp_path)] == ["c"]
+
+
+def test_idle_buffer_is_flushed_by_the_timer(tmp_path):
+    exporter = FileSpanExporter(
+        str(tmp_path), max_bytes=None, flush_interval_seconds=0.05
+    )
+    exporter.export(make_spans(["idle"]))
+    deadline = time.monotonic() + 5
+    while not list(read_spans(tmp_path)) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert [span["name"] for span in read_spans(tmp_path)] == ["idle"]
+    exporter.shutdown()
+
+
+def test_read_spans_filters_names_that_need_escaping(tmp_path):
+    exporter = FileSpanExporter(str(tmp_path), compression=None)
+    exporter.export(make_spans(['say "hi"', "café", "other"]))
+    exporter.shutdown()
+    for name in ['say "hi"', "café"]:
+        assert [s["name"] for s in read_spans(tmp_path, name=name)] == [name]
@@ -2,9 +2,12 @@
 
 import os
 import pytest
+import dspy
 import pandas as pd
+from dspy.utils.dummies import DummyLM
 from flock.core import Flock, FlockAgent, FlockFactory
 from flock.core.flock_registry import get_registry
+from flock.evaluators.declarative.declarative_evaluator import DeclarativeEvaluator, DeclarativeEvaluatorConfig
 from flock.evaluators.test.test_case_evaluator import TestCaseEvaluator, TestCaseEvaluatorConfig
 
 
@@ -73,3 +76,110 @@ async def test_batch_execution_with_dataframe_input_and_csv_output(basic_flock:
     assert df["col4"][1] == "Test Result"
     os.remove("test_output.csv")
 
+
+
+@pytest.mark.asyncio
+async def test_batch_execution_with_parquet_input_and_output(basic_flock: Flock, simple_agent: FlockAgent, tmp_path):
+    """Test batch execution with Parquet input (column projection) and Parquet output."""
+    input_path = tmp_path / "inputs.parquet"
+    output_path = tmp_path / "results.parquet"
+    pd.DataFrame({
+        "question": ["test1", "test2", "test3"],
+        "unused": ["x", "y", "z"],
+    }).to_parquet(input_path)
+
+    results = await basic_flock.run_batch_async(
+        start_agent=simple_agent,
+        batch_inputs=str(input_path),
+        input_mapping={"question": "query"},
+        parallel=True,
+        write_to_parquet=str(output_path),
+        hide_columns=["col1"],
+    )
+    assert len(results) == 3
+    assert results[0]["col2"] == "Test Result"
+
+    df = pd.read_parquet(output_path)
+    assert len(df) == 3
+    assert "col1" not in df.columns
+    assert df["col4"].tolist() == ["Test Result"] * 3
+
+
+def test_feather_columns_are_read_from_the_schema(tmp_path):
+    """Test that feather inputs are projected and missing columns reported."""
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    from flock.core.util.columnar import columnar_column_names, read_columnar_table
+
+    path = tmp_path / "inputs.feather"
+    feather.write_feather(pa.table({"question": ["a", "b"], "unused": [1, 2]}), str(path))
+
+    assert columnar_column_names(str(path)) == ["question", "unused"]
+    assert read_columnar_table(str(path), columns=["question"]).column_names == ["question"]
+    with pytest.raises(ValueError, match="missing required columns"):
+        read_columnar_table(str(path), columns=["answer"])
+
+
+@pytest.mark.asyncio
+async def test_batch_skips_missing_mapped_columns_for_arrow_and_dataframe(basic_flock: Flock, simple_agent: FlockAgent):
+    """Test that Arrow and DataFrame inputs treat a missing mapped column alike."""
+    import pyarrow as pa
+
+    frame = pd.DataFrame({"question": ["test1", "test2"]})
+    mapping = {"question": "query", "missing": "context"}
+    for batch_inputs in (frame, pa.Table.from_pandas(frame)):
+        results = await basic_flock.run_batch_async(
+            start_agent=simple_agent,
+            batch_inputs=batch_inputs,
+            input_mapping=mapping,
+            parallel=False,
+        )
+        assert len(results) == 2
+        assert results[0]["col2"] == "Test Result"
+
+
+@pytest.fixture
+def packable_agent() -> FlockAgent:
+    """Fixture for a single-hop classification agent without modules."""
+    return FlockAgent(
+        name="classifier",
+        input="text: str",
+        output="label: str",
+        evaluator=DeclarativeEvaluator(
+            name="default", config=DeclarativeEvaluatorConfig(model="test-model")
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_execution_with_prompt_packing(basic_flock: Flock, packable_agent: FlockAgent):
+    """Test that packed items are answered by a single LM call."""
+    lm = DummyLM([{"label": ["pos", "neg", "pos"]}])
+    with dspy.context(lm=lm):
+        results = await basic_flock.run_batch_async(
+            start_agent=packable_agent,
+            batch_inputs=[{"text": "good"}, {"text": "bad"}, {"text": "great"}],
+            pack_size=3,
+        )
+    assert len(lm.history) == 1
+    assert [r["label"] for r in results] == ["pos", "neg", "pos"]
+    assert results[1]["text"] == "bad"
+
+
+@pytest.mark.asyncio
+async def test_batch_prompt_packing_falls_back_on_parse_failure(basic_flock: Flock, packable_agent: FlockAgent):
+    """Test that items of an unparseable pack are re-run individually."""
+    lm = DummyLM([
+        {"label": ["pos"]},  # Wrong length: the pack cannot be unpacked
+        {"label": "pos"},
+        {"label": "neg"},
+    ])
+    with dspy.context(lm=lm):
+        results = await basic_flock.run_batch_async(
+            start_agent=packable_agent,
+            batch_inputs=[{"text": "good"}, {"text": "bad"}],
+            pack_size=2,
+            parallel=False,
+        )
+    assert len(lm.history) == 3
+    assert [r["label"] for r in results] == ["pos", "neg"]
@@ -0,0 +1,85 @@
+# tests/core/test_flock_registry.py
+import sys
+
+import pytest
+
+from flock.core.flock_registry import FlockRegistry
+
+
+@pytest.fixture
+def registry():
+    # A private instance, so the global singleton is left untouched
+    registry = object.__new__(FlockRegistry)
+    registry._initialize()
+    return registry
+
+
+def sample_tool(x: int) -> int:
+    return x
+
+
+class SampleComponent:
+    def method(self):
+        return None
+
+
+def test_callable_path_lookup_uses_first_registered_name(registry):
+    registry.register_callable(sample_tool, name="tools.sample")
+    registry.register_callable(sample_tool, name="tools.alias")
+    assert registry.get_callable_path_string(sample_tool) == "tools.sample"
+
+    # Bound methods are new objects on each access but compare equal
+    instance = SampleComponent()
+    path = registry.get_callable_path_string(instance.method)
+    assert registry.get_callable_path_string(instance.method) == path
+    assert len([p for p in registry._callables if p == path]) == 1
+
+
+def test_overwritten_callable_is_not_resolved_to_stale_name(registry):
+    registry.register_callable(sample_tool, name="tools.sample")
+    registry.register_callable(len, name="tools.sample")
+    assert registry.get_callable_path_string(len) == "tools.sample"
+    assert registry.get_callable_path_string(sample_tool) != "tools.sample"
+
+
+def test_overwritten_name_falls_back_to_alias(registry):
+    registry.register_callable(sample_tool, name="tools.sample")
+    registry.register_callable(sample_tool, name="tools.alias")
+    registry.register_callable(len, name="tools.sample")
+    assert registry.get_callable_path_string(sample_tool) == "tools.alias"
+
+
+def test_component_type_name_lookup(registry):
+    registry.register_component(SampleComponent, name="Sample")
+    assert registry.get_component_type_name(SampleComponent) == "Sample"
+    del registry._components["Sample"]
+    assert (
+        registry.get_component_type_name(SampleComponent) == "SampleComponent"
+    )
+
+
+def test_failed_dynamic_import_is_cached(registry, monkeypatch):
+    import importlib
+
+    calls = []
+    real_import = importlib.import_module
+
+    def counting_import(name, *args, **kwargs):
+        calls.append(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(importlib, "import_module", counting_import)
+    for _ in range(3):
+        with pytest.raises(KeyError):
+            registry.get_callable("no_such_module_xyz.func")
+    assert calls == ["no_such_module_xyz"]
+
+    # Changing sys.path invalidates the negative cache
+    monkeypatch.setattr(sys, "path", [*sys.path, "/no/such/dir"])
+    with pytest.raises(KeyError):
+        registry.get_callable("no_such_module_xyz.func")
+    assert calls == ["no_such_module_xyz", "no_such_module_xyz"]
+
+    # So does registering any callable
+    registry.register_callable(sample_tool, name="no_such_module_xyz.func")
+    assert registry.get_callable("no_such_module_xyz.func") is sample_tool
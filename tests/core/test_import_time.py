@@ -0,0 +1,20 @@
+# tests/core/test_import_time.py
+import subprocess
+import sys
+
+from scripts.import_time_benchmark import LAZY_MODULES
+
+
+def test_import_flock_does_not_load_heavy_dependencies():
+    # A fresh interpreter, since the test session has imported everything
+    code = (
+        "import sys\n"
+        "from flock.core import Flock\n"
+        f"loaded = [m for m in {LAZY_MODULES!r} if m in sys.modules]\n"
+        "print('LOADED:' + ','.join(loaded))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    loaded = result.stdout.rsplit("LOADED:", 1)[1].strip()
+    assert loaded == ""
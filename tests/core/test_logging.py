@@ -0,0 +1,101 @@
+# tests/core/test_logging.py
+import io
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from flock.core.logging.logging import (
+    FlockLogger,
+    QueuedSink,
+    configure_logging,
+)
+
+
+@pytest.fixture
+def warning_level():
+    from flock.config import LOG_ASYNC, LOG_LEVEL
+
+    configure_logging("WARNING")
+    yield
+    configure_logging(LOG_LEVEL, async_sink=LOG_ASYNC)
+
+
+def explode():
+    raise AssertionError("message should not be formatted")
+
+
+def test_disabled_logger_does_not_format():
+    logger = FlockLogger("test", enable_logging=False)
+    logger.info(explode)
+    assert not logger.is_enabled_for("error")
+
+
+def test_levels_below_threshold_are_skipped(warning_level):
+    logger = FlockLogger("test", enable_logging=True)
+    logger.debug(explode)
+    logger.info(explode)
+    assert not logger.is_enabled_for("info")
+    assert logger.is_enabled_for("warning")
+
+
+def test_bound_logger_is_cached():
+    logger = FlockLogger("test", enable_logging=True)
+    assert logger._get_logger() is logger._get_logger()
+
+
+def test_queued_sink_writes_in_background():
+    class StreamSink:
+        def __init__(self):
+            self.stream = io.StringIO()
+
+        def write(self, message):
+            self.stream.write(message)
+
+        def flush(self):
+            pass
+
+    target = StreamSink()
+    sink = QueuedSink(target)
+    sink.write("one\n")
+    sink.write("two\n")
+    sink.flush()
+    assert target.stream.getvalue() == "one\ntwo\n"
+    sink.stop()
+
+
+def test_queued_sink_keeps_errors_and_reports_drops():
+    started, release = threading.Event(), threading.Event()
+
+    class BlockingSink:
+        def __init__(self):
+            self.lines = []
+
+        def write(self, message):
+            if not started.is_set():  # Hold the writer thread on "first"
+                started.set()
+                release.wait(5)
+            self.lines.append(str(message))
+
+        def flush(self):
+            pass
+
+    class Message(str):
+        record = {"level": SimpleNamespace(no=40)}
+
+    target = BlockingSink()
+    sink = QueuedSink(target, max_queue_size=1)
+    sink.write("first\n")
+    started.wait(5)
+    sink.write("queued\n")
+    sink.write("dropped\n")
+    sink.write(Message("error\n"))
+    assert target.lines == ["error\n"]  # Written synchronously
+    release.set()
+    sink.flush()
+    sink.stop()
+
+    assert "dropped\n" not in target.lines
+    assert {"first\n", "queued\n", "error\n"} <= set(target.lines)
+    assert sink.dropped == 1
+    assert any("dropped 1 messages" in line for line in target.lines)
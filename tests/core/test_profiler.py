@@ -0,0 +1,64 @@
+# tests/core/test_profiler.py
+import asyncio
+
+from flock.core.flock_agent import FlockAgent
+from flock.core.util.profiler import (
+    LatencyHistogram,
+    LatencyProfiler,
+    get_profiler,
+)
+
+
+class EchoAgent(FlockAgent):
+    async def evaluate(self, inputs: dict) -> dict:
+        return {"result": inputs["query"]}
+
+
+def test_histogram_statistics():
+    histogram = LatencyHistogram()
+    for duration_ms in [0.5, 3, 4, 20, 700]:
+        histogram.add(duration_ms)
+    stats = histogram.to_dict()
+    assert stats["count"] == 5
+    assert stats["min_ms"] == 0.5
+    assert stats["max_ms"] == 700
+    assert stats["p50_ms"] == 5
+    assert stats["p99_ms"] == 700
+    assert stats["buckets"]["le_5"] == 2
+
+
+def test_phases_are_aggregated_per_agent():
+    profiler = LatencyProfiler()
+    for _ in range(3):
+        with profiler.phase("a", "llm"):
+            pass
+    profiler.record("a", "initialize", 2_000_000)
+    profiler.record("b", "llm", 1_000_000)
+
+    report = profiler.report()
+    assert list(report["a"]) == ["initialize", "llm"]
+    assert report["a"]["llm"]["count"] == 3
+    assert report["b"]["llm"]["mean_ms"] == 1.0
+    table = profiler.format_report()
+    assert table.splitlines()[0].split()[:3] == ["agent", "phase", "count"]
+    assert "initialize" in table
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = LatencyProfiler(enabled=False)
+    with profiler.phase("a", "llm"):
+        pass
+    assert profiler.report() == {}
+    assert profiler.format_report() == "No latency data recorded."
+
+
+def test_agent_run_records_lifecycle_phases():
+    profiler = get_profiler()
+    profiler.reset()
+    agent = EchoAgent(name="echo_profiled", input="query", output="result")
+    asyncio.run(agent.run_async({"query": "hi"}))
+
+    phases = profiler.report()["echo_profiled"]
+    assert {"run", "initialize", "terminate"} <= set(phases)
+    assert phases["run"]["count"] == 1
+    profiler.reset()
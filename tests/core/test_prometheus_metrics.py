@@ -0,0 +1,63 @@
+# tests/core/test_prometheus_metrics.py
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from flock.core import Flock
+from flock.core.api.main import FlockAPI
+from flock.core.api.run_store import RunStore
+from flock.core.util.prometheus_metrics import (
+    get_prometheus_metrics,
+    record_agent_run,
+)
+
+
+def sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_run_store_tracks_in_flight_runs_and_batch_items():
+    assert get_prometheus_metrics() is not None
+    store = RunStore()
+    in_flight = sample("flock_api_runs_in_flight", kind="run")
+    failed = sample("flock_api_runs_finished_total", kind="run", status="failed")
+
+    store.create_run("r1")
+    store.update_run_status("r1", "running")
+    store.create_run("r2")
+    assert sample("flock_api_runs_in_flight", kind="run") == in_flight + 2
+
+    store.update_run_result("r1", {"answer": 42})
+    store.update_run_status("r2", "failed", "boom")
+    assert sample("flock_api_runs_in_flight", kind="run") == in_flight
+    assert (
+        sample("flock_api_runs_finished_total", kind="run", status="failed")
+        == failed + 1
+    )
+
+    completed = sample("flock_api_batch_items_completed_total")
+    store.create_batch("b1")
+    store.set_batch_total_items("b1", 4)
+    store.update_batch_progress("b1", 1)
+    store.update_batch_progress("b1", 3)
+    store.update_batch_status("b1", "completed")
+    assert sample("flock_api_batch_items_completed_total") == completed + 4
+
+
+def test_metrics_endpoint_exposes_agent_metrics():
+    record_agent_run("prom_agent", 0.2)
+    record_agent_run("prom_agent", 0.3, ValueError("bad input"))
+
+    client = TestClient(FlockAPI(Flock(show_flock_banner=False)).app)
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert (
+        'flock_agent_latency_seconds_count{agent_name="prom_agent"} 2.0'
+        in response.text
+    )
+    assert (
+        'flock_agent_errors_total{agent_name="prom_agent",'
+        'error_type="ValueError"} 1.0' in response.text
+    )
+    assert "flock_api_runs_in_flight" in response.text
@@ -0,0 +1,84 @@
+# tests/core/test_rate_limiter.py
+import pytest
+
+from flock.core.util.rate_limiter import ModelRateLimiter, estimate_tokens
+
+
+@pytest.mark.asyncio
+async def test_unlimited_model_does_not_wait():
+    limiter = ModelRateLimiter()
+    assert await limiter.acquire("openai/gpt-4o", estimated_tokens=10_000) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_token_budget_is_shared_per_model():
+    limiter = ModelRateLimiter()
+    # 1200 tokens/minute -> 20 tokens/second
+    limiter.configure("model-a", tokens_per_minute=1200)
+
+    assert await limiter.acquire("model-a", estimated_tokens=1200) == 0.0
+    # Bucket is empty now: 4 tokens need ~0.2s of refill
+    waited = await limiter.acquire("model-a", estimated_tokens=4)
+    assert 0.1 < waited < 1.0
+    # Other models keep their own (unlimited) budget
+    assert await limiter.acquire("model-b", estimated_tokens=1200) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_request_budget_limits_calls():
+    limiter = ModelRateLimiter()
+    # 600 requests/minute -> one request every 0.1s after the burst
+    limiter.configure("model-a", requests_per_minute=600)
+    for _ in range(600):
+        assert await limiter.acquire("model-a") == 0.0
+    assert await limiter.acquire("model-a") > 0.0
+
+
+def test_estimate_tokens():
+    assert estimate_tokens(None) == 0
+    assert estimate_tokens("abcd" * 10) == 10
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_agent_keeps_its_model_while_waiting(monkeypatch):
+    import asyncio
+
+    import dspy
+    from dspy.utils.dummies import DummyLM
+
+    from flock.core.flock_agent import FlockAgent
+    from flock.core.util import rate_limiter
+    from flock.evaluators.declarative.declarative_evaluator import (
+        DeclarativeEvaluator,
+        DeclarativeEvaluatorConfig,
+    )
+
+    # Every configured LM answers with its own model name
+    monkeypatch.setattr(
+        dspy, "LM", lambda model, **kwargs: DummyLM([{"label": model}])
+    )
+    limiter = ModelRateLimiter()
+    monkeypatch.setattr(rate_limiter, "_rate_limiter_instance", limiter)
+    # 600 requests/minute: after the burst, "a" waits ~0.1s per call
+    limiter.configure("a", requests_per_minute=600)
+    for _ in range(600):
+        await limiter.acquire("a")
+
+    def make_agent(model: str) -> FlockAgent:
+        return FlockAgent(
+            name=f"agent_{model}",
+            input="text: str",
+            output="label: str",
+            evaluator=DeclarativeEvaluator(
+                name="default", config=DeclarativeEvaluatorConfig(model=model)
+            ),
+        )
+
+    agent_a, agent_b = make_agent("a"), make_agent("b")
+    result_a, result_b = await asyncio.gather(
+        agent_a.evaluator.evaluate(agent_a, {"text": "x"}, []),
+        agent_b.evaluator.evaluate(agent_b, {"text": "y"}, []),
+    )
+
+    assert result_a["label"] == "a"
+    assert result_b["label"] == "b"
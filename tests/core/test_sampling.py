@@ -0,0 +1,66 @@
+# tests/core/test_sampling.py
+import time
+
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+from opentelemetry.trace import Status, StatusCode
+
+from flock.core.logging.span_middleware.sampling import (
+    AgentRatioSampler,
+    TailSamplingSpanProcessor,
+)
+
+
+def make_tracer(sampler=None, **tail_options):
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider(sampler=sampler)
+    processor = SimpleSpanProcessor(exporter)
+    if tail_options:
+        processor = TailSamplingSpanProcessor([processor], **tail_options)
+    provider.add_span_processor(processor)
+    return provider.get_tracer("test"), exporter, processor
+
+
+def test_agent_ratio_drops_agent_subtree():
+    sampler = AgentRatioSampler(1.0, {"noisy": 0.0})
+    tracer, exporter, _ = make_tracer(sampler)
+    with tracer.start_as_current_span("flock.run_async"):
+        with tracer.start_as_current_span(
+            "agent.run", attributes={"agent.name": "noisy"}
+        ):
+            with tracer.start_as_current_span("agent.evaluate"):
+                pass
+        with tracer.start_as_current_span(
+            "agent.run", attributes={"agent.name": "quiet"}
+        ):
+            pass
+    names = [span.name for span in exporter.get_finished_spans()]
+    assert names == ["agent.run", "flock.run_async"]
+
+
+def test_head_ratio_zero_records_nothing():
+    tracer, exporter, _ = make_tracer(AgentRatioSampler(0.0))
+    with tracer.start_as_current_span("root") as span:
+        assert not span.is_recording()
+    assert exporter.get_finished_spans() == ()
+
+
+def test_tail_sampling_keeps_errors_and_slow_traces():
+    tracer, exporter, tail = make_tracer(
+        keep_ratio=0.0, latency_threshold_ms=20
+    )
+    with tracer.start_as_current_span("healthy"):
+        with tracer.start_as_current_span("child"):
+            pass
+    with tracer.start_as_current_span("failing"):
+        with tracer.start_as_current_span("child") as child:
+            child.set_status(Status(StatusCode.ERROR))
+    with tracer.start_as_current_span("slow"):
+        time.sleep(0.03)
+
+    names = [span.name for span in exporter.get_finished_spans()]
+    assert names == ["child", "failing", "slow"]
+    assert tail.stats == {"kept": 2, "dropped": 1, "pending": 0}
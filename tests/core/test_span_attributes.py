@@ -0,0 +1,90 @@
+# tests/core/test_span_attributes.py
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+from opentelemetry.trace import NonRecordingSpan, SpanContext
+
+from flock.core.logging import span_attributes
+from flock.core.logging.span_attributes import (
+    SpanAttributePolicy,
+    payload_attributes,
+    payload_scope,
+    set_payload_attribute,
+)
+
+
+def record(value, policy):
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    with provider.get_tracer("test").start_as_current_span("s") as span:
+        set_payload_attribute(span, "inputs", value, policy)
+    return dict(exporter.get_finished_spans()[0].attributes)
+
+
+def test_payloads_are_fingerprinted_by_default():
+    attributes = record({"query": "x" * 10_000}, SpanAttributePolicy())
+    assert "inputs" not in attributes
+    assert attributes["inputs.type"] == "dict"
+    assert attributes["inputs.size"] == 1
+    assert len(attributes["inputs.fingerprint"]) == 16
+
+
+def test_captured_payloads_are_bounded():
+    policy = SpanAttributePolicy(capture_payloads=True, max_bytes=64)
+    attributes = record({"query": "x" * 10_000}, policy)
+    assert len(attributes["inputs"]) <= 64 + len("...")
+    assert attributes["inputs"].startswith("{'query': 'x")
+
+
+def test_sampling_and_identical_fingerprints():
+    never = SpanAttributePolicy(capture_payloads=True, sample_rate=0.0)
+    assert "inputs" not in payload_attributes("inputs", [1, 2], never)
+    first = payload_attributes("inputs", [1, 2])["inputs.fingerprint"]
+    assert first == payload_attributes("inputs", [1, 2])["inputs.fingerprint"]
+
+
+def test_fingerprints_are_bounded_and_computed_once_per_scope(monkeypatch):
+    policy = SpanAttributePolicy(max_bytes=64)
+    short = payload_attributes("inputs", list(range(100)), policy)
+    longer = payload_attributes("inputs", list(range(101)), policy)
+    assert short["inputs.fingerprint"] != longer["inputs.fingerprint"]
+
+    calls = []
+    real_fingerprint = span_attributes.payload_fingerprint
+
+    def counting_fingerprint(value, max_bytes=1024):
+        calls.append(value)
+        return real_fingerprint(value, max_bytes)
+
+    monkeypatch.setattr(
+        span_attributes, "payload_fingerprint", counting_fingerprint
+    )
+    payload = {"query": "x" * 10_000}
+    with payload_scope():
+        first = payload_attributes("inputs", payload)["inputs.fingerprint"]
+        with payload_scope():
+            again = payload_attributes("inputs", payload)["inputs.fingerprint"]
+    assert first == again
+    assert len(calls) == 1
+
+
+def test_container_subclasses_are_abbreviated():
+    class Payload(dict):
+        def __repr__(self):
+            raise AssertionError("payload should not be formatted in full")
+
+    policy = SpanAttributePolicy(capture_payloads=True, max_bytes=64)
+    attributes = payload_attributes("inputs", Payload(q="x" * 10_000), policy)
+    assert attributes["inputs"].startswith("{'q': 'x")
+
+
+def test_non_recording_spans_are_skipped():
+    class Unprintable:
+        def __str__(self):
+            raise AssertionError("payload should not be formatted")
+
+    span = NonRecordingSpan(SpanContext(1, 1, False))
+    set_payload_attribute(span, "result", Unprintable())
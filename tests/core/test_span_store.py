@@ -0,0 +1,74 @@
+# tests/core/test_span_store.py
+import time
+
+from opentelemetry.sdk.trace import TracerProvider
+
+from flock.core.logging.telemetry_exporter.span_store import (
+    NS_PER_DAY,
+    SpanStore,
+)
+from flock.core.logging.telemetry_exporter.sqlite_exporter import (
+    SqliteTelemetryExporter,
+)
+
+
+def record_spans():
+    provider = TracerProvider()
+    tracer = provider.get_tracer("test")
+    spans = []
+    start = time.time_ns()
+    for agent, duration_ms in [("a", 10), ("a", 30), ("b", 20)]:
+        span = tracer.start_span(
+            "agent.run", attributes={"agent.name": agent}, start_time=start
+        )
+        span.add_event("started", {"step": 1})
+        span.end(end_time=start + duration_ms * 1_000_000)
+        spans.append(span)
+    return spans
+
+
+def test_exporter_stores_spans_and_events(tmp_path):
+    exporter = SqliteTelemetryExporter(str(tmp_path), "spans.db")
+    exporter.export(record_spans())
+
+    store = SpanStore(tmp_path / "spans.db")
+    slowest = store.slowest_spans(limit=1, name="agent.run")
+    assert slowest[0]["agent_name"] == "a"
+    assert slowest[0]["duration_ns"] == 30_000_000
+    events = store.conn.execute("SELECT COUNT(*) FROM span_events").fetchone()
+    assert events[0] == 3
+
+    latency = store.agent_latency_percentiles(percentiles=(50, 99))
+    assert latency["a"] == {"count": 2, "p50": 10.0, "p99": 30.0}
+    assert latency["b"]["count"] == 1
+    store.close()
+
+
+def test_reexported_spans_do_not_duplicate_events(tmp_path):
+    store = SpanStore(tmp_path / "spans.db")
+    spans = record_spans()
+    store.insert_spans(spans)
+    store.insert_spans(spans)
+    counts = store.conn.execute(
+        "SELECT (SELECT COUNT(*) FROM spans), (SELECT COUNT(*) FROM span_events)"
+    ).fetchone()
+    assert counts == (3, 3)
+    store.close()
+
+
+def test_prune_removes_old_spans(tmp_path):
+    store = SpanStore(tmp_path / "spans.db")
+    store.insert_spans(record_spans())
+    old = time.time_ns() - 3 * NS_PER_DAY
+    store.conn.execute(
+        "UPDATE spans SET start_time = ? WHERE agent_name = 'a'", (old,)
+    )
+    store.conn.commit()
+
+    assert store.prune(retention_days=1) == 2
+    store.compact()
+    remaining = store.conn.execute("SELECT agent_name FROM spans").fetchall()
+    assert remaining == [("b",)]
+    events = store.conn.execute("SELECT COUNT(*) FROM span_events").fetchone()
+    assert events[0] == 1
+    store.close()
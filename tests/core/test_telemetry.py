@@ -0,0 +1,63 @@
+# tests/core/test_telemetry.py
+import sys
+
+from opentelemetry.sdk import trace as sdk_trace
+
+from flock.core.logging.telemetry import TelemetryConfig, _LazyTracerProvider
+
+
+def make_config(**kwargs) -> TelemetryConfig:
+    return TelemetryConfig(
+        "test-service",
+        enable_jaeger=False,
+        enable_file=False,
+        enable_sql=False,
+        **kwargs,
+    )
+
+
+def test_tracing_is_set_up_once_on_first_span(monkeypatch):
+    monkeypatch.setattr(sys, "excepthook", sys.__excepthook__)
+    config = make_config()
+    tracer = _LazyTracerProvider(config).get_tracer("test")
+    assert not config.is_initialized  # Creating tracers is free
+    with tracer.start_as_current_span("first") as span:
+        assert span.get_span_context().is_valid
+    assert config.is_initialized
+
+    first_provider = config.provider
+    config.setup_tracing()
+    assert config.provider is first_provider
+    assert config.get_tracer_provider() is first_provider
+
+
+def test_disabled_telemetry_creates_no_provider():
+    config = make_config(enabled=False)
+    tracer = config.get_tracer_provider().get_tracer("test")
+    with tracer.start_as_current_span("noop") as span:
+        assert not span.get_span_context().is_valid
+    assert not config.is_initialized
+
+
+def test_lazy_tracer_picks_up_telemetry_enabled_later(monkeypatch):
+    monkeypatch.setattr(sys, "excepthook", sys.__excepthook__)
+    config = make_config(enabled=False)
+    tracer = _LazyTracerProvider(config).get_tracer("test")
+    with tracer.start_as_current_span("noop") as span:
+        assert not span.get_span_context().is_valid
+
+    config.configure(True)
+    with tracer.start_as_current_span("real") as span:
+        assert span.get_span_context().is_valid
+
+
+def test_lazy_provider_forwards_to_the_sdk_provider(monkeypatch):
+    monkeypatch.setattr(sys, "excepthook", sys.__excepthook__)
+    config = make_config()
+    provider = _LazyTracerProvider(config)
+    with provider.get_tracer("test").start_as_current_span("first"):
+        pass
+
+    assert isinstance(provider.get_tracer("test"), sdk_trace.Tracer)
+    assert provider.resource is config.provider.resource
+    assert provider.add_span_processor.__self__ is config.provider
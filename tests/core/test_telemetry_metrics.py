@@ -0,0 +1,128 @@
+# tests/core/test_telemetry_metrics.py
+import json
+import sqlite3
+
+import pytest
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import (
+    InMemoryMetricReader,
+    PeriodicExportingMetricReader,
+)
+
+from flock.core.logging import telemetry_metrics
+from flock.core.logging.telemetry_exporter.metric_exporter import (
+    FileMetricExporter,
+    SqliteMetricExporter,
+)
+from flock.core.mixin.dspy_integration import _counted_tool
+from flock.core.util.token_usage import TokenUsage
+
+
+@pytest.fixture
+def reader(monkeypatch):
+    reader = InMemoryMetricReader()
+    provider = MeterProvider(metric_readers=[reader])
+    monkeypatch.setattr(
+        telemetry_metrics,
+        "_instruments",
+        telemetry_metrics.FlockInstruments(provider.get_meter("flock")),
+    )
+    yield reader
+    provider.shutdown()
+
+
+def collect(reader) -> dict[str, list]:
+    points = {}
+    for resource_metrics in reader.get_metrics_data().resource_metrics:
+        for scope_metrics in resource_metrics.scope_metrics:
+            for metric in scope_metrics.metrics:
+                points[metric.name] = list(metric.data.data_points)
+    return points
+
+
+def test_llm_calls_record_tokens_cost_and_cache_hits(reader):
+    usages = [
+        TokenUsage(prompt_tokens=100, completion_tokens=20, cost=0.5, calls=1),
+        TokenUsage(calls=1, cached_calls=1),
+    ]
+    telemetry_metrics.record_llm_calls("writer", "openai/gpt-4o", 1.5, usages)
+
+    points = collect(reader)
+    assert points["flock.llm.calls"][0].value == 2
+    assert points["flock.llm.cache_hits"][0].value == 1
+    tokens = {
+        p.attributes["token.type"]: p.value for p in points["flock.llm.tokens"]
+    }
+    assert tokens == {"prompt": 100, "completion": 20}
+    assert points["flock.llm.cost"][0].value == 0.5
+    (duration,) = points["flock.llm.duration"]
+    assert duration.sum == 1.5
+    assert duration.attributes == {
+        "agent.name": "writer",
+        "model": "openai/gpt-4o",
+    }
+
+
+def test_hops_routers_and_tools_are_recorded(reader):
+    def search(query: str) -> str:
+        """Searches the web."""
+        if not query:
+            raise ValueError("empty query")
+        return query
+
+    counted = _counted_tool(search)
+    assert counted.__name__ == "search"
+    assert counted.__doc__ == "Searches the web."
+    counted("flock")
+    with pytest.raises(ValueError):
+        counted("")
+    with telemetry_metrics.timed_hop("writer"):
+        telemetry_metrics.record_router_decision(
+            "DefaultRouter", "writer", "critic"
+        )
+
+    points = collect(reader)
+    calls = {
+        p.attributes["status"]: p.value for p in points["flock.tool.calls"]
+    }
+    assert calls == {"ok": 1, "error": 1}
+    (decision,) = points["flock.router.decisions"]
+    assert decision.attributes["next_agent"] == "critic"
+    assert points["flock.hop.duration"][0].count == 1
+
+
+def test_local_exporters_write_interval_aggregates(tmp_path):
+    file_exporter = FileMetricExporter(str(tmp_path), "metrics.jsonl")
+    sqlite_exporter = SqliteMetricExporter(str(tmp_path), "events.db")
+    provider = MeterProvider(
+        metric_readers=[
+            PeriodicExportingMetricReader(
+                exporter, export_interval_millis=3_600_000
+            )
+            for exporter in (file_exporter, sqlite_exporter)
+        ]
+    )
+    instruments = telemetry_metrics.FlockInstruments(provider.get_meter("t"))
+    for duration in (0.1, 0.3):
+        instruments.agent_duration.record(duration, {"agent.name": "a"})
+    instruments.llm_calls.add(3, {"agent.name": "a"})
+    provider.force_flush()
+
+    rows = {
+        row["name"]: row
+        for row in map(json.loads, (tmp_path / "metrics.jsonl").open())
+    }
+    assert rows["flock.agent.duration"]["count"] == 2
+    assert rows["flock.llm.calls"]["value"] == 3
+
+    # Delta temporality: the next interval starts from zero
+    instruments.llm_calls.add(1, {"agent.name": "a"})
+    provider.force_flush()
+    conn = sqlite3.connect(tmp_path / "events.db")
+    values = conn.execute(
+        "SELECT value FROM otel_metrics WHERE name = 'flock.llm.calls' "
+        "ORDER BY time"
+    ).fetchall()
+    assert values == [(3,), (1,)]
+    conn.close()
+    provider.shutdown()
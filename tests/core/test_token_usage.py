@@ -0,0 +1,163 @@
+# tests/core/test_token_usage.py
+import dspy
+import pytest
+from dspy.utils.dummies import DummyLM
+
+from flock.core.context.context import FlockContext
+from flock.core.flock_agent import FlockAgent
+from flock.core.mixin import dspy_integration
+from flock.core.util import token_usage
+from flock.core.util.token_usage import (
+    TokenUsage,
+    get_token_usage,
+    record_token_usage,
+    usage_from_history_entry,
+)
+from flock.evaluators.declarative.declarative_evaluator import (
+    DeclarativeEvaluator,
+    DeclarativeEvaluatorConfig,
+)
+
+
+def test_provider_usage_is_used_as_reported():
+    entry = {
+        "usage": {"prompt_tokens": 812, "completion_tokens": 64},
+        "cost": 0.002,
+        "messages": [{"role": "user", "content": "ignored"}],
+    }
+    usage = usage_from_history_entry(entry, "openai/gpt-4o")
+    assert (usage.prompt_tokens, usage.completion_tokens) == (812, 64)
+    assert usage.cost == 0.002
+    assert not usage.estimated
+
+
+def test_cache_hits_cost_no_tokens():
+    usage = usage_from_history_entry({"usage": {}, "cost": None})
+    assert usage.total_tokens == 0
+    assert (usage.calls, usage.cached_calls) == (1, 1)
+
+
+def test_missing_usage_is_estimated_with_a_cached_tokenizer():
+    token_usage.get_tokenizer.cache_clear()
+    entry = {
+        "messages": [{"role": "user", "content": "How many tokens is this?"}],
+        "outputs": ["Six or so."],
+        "model": "openai/gpt-4o",
+    }
+    first = usage_from_history_entry(entry)
+    second = usage_from_history_entry(entry)
+
+    assert first.estimated
+    assert first.prompt_tokens > 0 and first.completion_tokens > 0
+    assert first == second
+    assert token_usage.get_tokenizer.cache_info().misses == 1
+
+
+def test_usage_is_aggregated_per_agent_and_run_in_context():
+    context = FlockContext()
+    record_token_usage(
+        context, "writer", TokenUsage(prompt_tokens=100, completion_tokens=10)
+    )
+    record_token_usage(
+        context, "writer", TokenUsage(prompt_tokens=50, completion_tokens=5)
+    )
+    record_token_usage(
+        context, "critic", TokenUsage(prompt_tokens=20, completion_tokens=2)
+    )
+
+    restored = FlockContext.model_validate(context.model_dump())
+    assert get_token_usage(restored, "writer").total_tokens == 165
+    assert get_token_usage(restored, "critic").prompt_tokens == 20
+    assert get_token_usage(restored).total_tokens == 187
+
+
+@pytest.mark.asyncio
+async def test_evaluation_accounts_only_its_own_calls(monkeypatch):
+    from dspy.clients import base_lm
+
+    monkeypatch.setattr(dspy_integration, "LM_HISTORY_SIZE", 2)
+    monkeypatch.setattr(
+        base_lm, "GLOBAL_HISTORY", [{"old": i} for i in range(5)]
+    )
+    agent = FlockAgent(
+        name="classifier",
+        input="text: str",
+        output="label: str",
+        evaluator=DeclarativeEvaluator(
+            name="default",
+            config=DeclarativeEvaluatorConfig(model="test-model"),
+        ),
+    )
+    agent.context = FlockContext()
+    lm = DummyLM([{"label": "pos"}, {"label": "neg"}, {"label": "pos"}])
+
+    with dspy.context(lm=lm):
+        for text in ("good", "bad", "fine"):
+            await agent.evaluator.evaluate(agent, {"text": text}, [])
+
+    evaluator = agent.evaluator
+    assert len(lm.history) == 2  # Bounded like the global history
+    assert evaluator.token_usage.calls == 1
+    assert len(evaluator.lm_history) == 1
+    assert "response" not in evaluator.lm_history[0]
+    assert get_token_usage(agent.context, "classifier").calls == 3
+    assert len(base_lm.GLOBAL_HISTORY) == 2
+
+
+@pytest.mark.asyncio
+async def test_calls_by_others_on_a_shared_lm_are_not_accounted(monkeypatch):
+    agent = FlockAgent(
+        name="classifier",
+        input="text: str",
+        output="label: str",
+        evaluator=DeclarativeEvaluator(
+            name="default",
+            config=DeclarativeEvaluatorConfig(model="test-model"),
+        ),
+    )
+    lm = DummyLM([{"label": "pos"}, {"label": "other"}])
+    dummy_call = DummyLM.__call__
+
+    def call_while_another_agent_calls(self, *args, **kwargs):
+        outputs = dummy_call(self, *args, **kwargs)
+        if len(lm.history) == 0:
+            # Another (e.g. streaming) call on the shared LM finishes now
+            dummy_call(lm, "concurrent prompt")
+        return outputs
+
+    monkeypatch.setattr(DummyLM, "__call__", call_while_another_agent_calls)
+    with dspy.context(lm=lm):
+        await agent.evaluator.evaluate(agent, {"text": "good"}, [])
+
+    assert agent.evaluator.token_usage.calls == 1
+    assert len(lm.history) == 2
+
+
+@pytest.mark.asyncio
+async def test_metrics_module_reads_usage_from_the_run_context(tmp_path):
+    from flock.modules.performance.metrics_module import (
+        MetricsModule,
+        MetricsModuleConfig,
+    )
+
+    module = MetricsModule(
+        "metrics",
+        config=MetricsModuleConfig(
+            storage_type="memory", metrics_dir=str(tmp_path)
+        ),
+    )
+    agent = FlockAgent(
+        name="writer",
+        input="q",
+        output="a",
+        evaluator=DeclarativeEvaluator(name="default"),
+    )
+    # Left on the shared evaluator by a concurrent run of the same agent
+    agent.evaluator.token_usage = TokenUsage(prompt_tokens=999)
+    context = FlockContext()
+    record_token_usage(
+        context, "writer", TokenUsage(prompt_tokens=7, completion_tokens=3)
+    )
+
+    await module.post_evaluate(agent, {"q": "x"}, {"a": "y"}, context)
+    assert [p.value for p in module._metrics["tokens"]] == [7, 3]
@@ -0,0 +1,66 @@
+# tests/modules/test_metrics_aggregates.py
+import asyncio
+import os
+import random
+
+import pytest
+
+from flock.core.flock_agent import FlockAgent
+from flock.modules.performance.aggregates import (
+    MetricAggregate,
+    QuantileSketch,
+    RunningStats,
+)
+from flock.modules.performance.metrics_module import (
+    AGGREGATES_FILE,
+    MetricsModule,
+    MetricsModuleConfig,
+)
+
+
+def test_sketch_quantiles_are_within_relative_accuracy():
+    rng = random.Random(7)
+    values = sorted(rng.lognormvariate(0, 2) for _ in range(5000))
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    for value in values:
+        sketch.add(value)
+    for q in (0.5, 0.9, 0.99):
+        exact = values[int(q * (len(values) - 1))]
+        assert sketch.quantile(q) == pytest.approx(exact, rel=0.01)
+
+
+def test_merged_aggregates_match_single_stream():
+    values = [-3.0, 0.0, 1.5, 2.0, 8.0, 13.0]
+    whole, left, right = MetricAggregate(), MetricAggregate(), MetricAggregate()
+    for value in values:
+        whole.add(value)
+    for value in values[:2]:
+        left.add(value)
+    for value in values[2:]:
+        right.add(value)
+    left.merge(right)
+    assert left.statistics() == pytest.approx(whole.statistics())
+    stats = RunningStats.from_dict(whole.stats.to_dict())
+    assert stats.mean == pytest.approx(sum(values) / len(values))
+    assert stats.min == -3.0
+
+
+def test_module_persists_aggregates_and_one_summary(tmp_path):
+    config = MetricsModuleConfig(metrics_dir=str(tmp_path))
+    module = MetricsModule("metrics", config=config)
+    for latency in (0.1, 0.2, 0.3):
+        module._record_metric("latency", latency, {"agent": "a"})
+    agent = FlockAgent(name="a", input="query", output="result")
+    asyncio.run(module.terminate(agent, {}, {}))
+    asyncio.run(module.terminate(agent, {}, {}))
+
+    assert os.path.exists(tmp_path / AGGREGATES_FILE)
+    summaries = [f for f in os.listdir(tmp_path) if f.startswith("summary_")]
+    assert summaries == ["summary_a.json"]
+
+    reloaded = MetricsModule("metrics", config=config)
+    stats = reloaded.get_statistics("latency")
+    assert stats["count"] == 3
+    assert stats["mean"] == pytest.approx(0.2)
+    # Raw points are still readable next to the aggregates file
+    assert len(reloaded.get_metrics("latency")["latency"]) == 3
@@ -0,0 +1,94 @@
+# tests/modules/test_metrics_store.py
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from flock.core.flock_agent import FlockAgent
+from flock.modules.performance.metrics_module import (
+    MetricsModule,
+    MetricsModuleConfig,
+)
+from flock.modules.performance.metrics_store import (
+    SqliteMetricsStore,
+    parse_interval,
+)
+
+
+def test_parse_interval():
+    assert parse_interval("90s") == 90
+    assert parse_interval("1h") == 3600
+    with pytest.raises(ValueError):
+        parse_interval("1w")
+
+
+def test_points_are_batched_and_range_queried(tmp_path):
+    store = SqliteMetricsStore(
+        str(tmp_path / "metrics.db"), batch_size=3, flush_interval_seconds=60
+    )
+    base = datetime.now().replace(microsecond=0) - timedelta(hours=1)
+    for minute in range(2):
+        store.add("latency", base + timedelta(minutes=minute), 1.0 + minute)
+    # Nothing is written until the batch is full
+    rows = store.conn.execute("SELECT COUNT(*) FROM metric_points").fetchone()
+    assert rows[0] == 0
+    store.add("latency", base + timedelta(minutes=2), 3.0, {"agent": "a"})
+    store.add("errors", base, "ValueError")
+
+    points = store.query_points(
+        "latency", start_time=base + timedelta(minutes=1)
+    )
+    assert [p["value"] for p in points["latency"]] == [2.0, 3.0]
+    assert points["latency"][1]["tags"] == {"agent": "a"}
+    assert store.query_points("errors")["errors"][0]["value"] == "ValueError"
+    store.close()
+
+
+def test_rollups_survive_raw_retention(tmp_path):
+    store = SqliteMetricsStore(
+        str(tmp_path / "metrics.db"),
+        aggregation_interval="1h",
+        retention_days=30,
+        raw_retention_days=1,
+    )
+    old = datetime.now() - timedelta(days=3)
+    for value in (1.0, 2.0, 6.0):
+        store.add("latency", old, value)
+    store.add("latency", datetime.now() - timedelta(days=60), 9.0)
+    # The first flush also applies retention
+    store.flush()
+
+    assert store.prune() == (0, 0)
+    assert store.query_points("latency") == {}
+    (rollup,) = store.query_rollups("latency")["latency"]
+    assert rollup["count"] == 3
+    assert rollup["mean"] == 3.0
+    assert (rollup["min"], rollup["max"]) == (1.0, 6.0)
+    store.close()
+
+
+def test_flush_interval_triggers_write(tmp_path):
+    store = SqliteMetricsStore(
+        str(tmp_path / "metrics.db"), flush_interval_seconds=0
+    )
+    store.add("cpu", datetime.now(), 12.5)
+    rows = store.conn.execute("SELECT COUNT(*) FROM metric_points").fetchone()
+    assert rows[0] == 1
+    store.close()
+
+
+def test_module_with_sqlite_storage(tmp_path):
+    config = MetricsModuleConfig(
+        metrics_dir=str(tmp_path), storage_type="sqlite", write_batch_size=10
+    )
+    module = MetricsModule("metrics", config=config)
+    for latency in (0.1, 0.2, 0.3):
+        module._record_metric("latency", latency, {"agent": "a"})
+    agent = FlockAgent(name="a", input="query", output="result")
+    asyncio.run(module.terminate(agent, {}, {}))
+
+    reloaded = MetricsModule("metrics", config=config)
+    assert len(reloaded.get_metrics("latency")["latency"]) == 3
+    assert reloaded.get_statistics("latency")["count"] == 3
+    (rollup,) = reloaded.get_rollups("latency")["latency"]
+    assert rollup["sum"] == pytest.approx(0.6)